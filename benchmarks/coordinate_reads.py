@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+좌표 조회 방식 벤치마크 스크립트
+
+주차장 목록 조회에서 두 좌표 조회 방식의 실행 시간을 비교
+- columns: 저장된 latitude/longitude 컬럼을 그대로 읽기 (현재 레포지토리 방식)
+- st_xy: 행마다 ST_Y(location::geometry), ST_X(location::geometry) 계산 (이전 방식)
+
+기본으로 대구 일대 임의 좌표를 가진 임시 테이블(세션 종료 시 삭제)을 --rows 건 생성하여 측정하며,
+--table parking_lots로 실제 테이블을 측정할 수 있음 (읽기만 수행)
+
+실행 방법:
+    # 임시 테이블 20만 건, 방식별 20회 반복
+    uv run python benchmarks/coordinate_reads.py --rows 200000 --repeat 20
+
+    # 실제 parking_lots 테이블 측정, 결과 JSON 출력
+    uv run python benchmarks/coordinate_reads.py --table parking_lots --json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, text
+
+from src.config import get_settings
+
+BENCH_TABLE = "bench_parking_lots"
+
+# 방식별 조회 쿼리 (레포지토리의 get_all_parking_lots와 같은 컬럼 구성)
+QUERIES = {
+    "columns": "SELECT id, station_id, name, address, distance_to_station_m, fee_info, created_at, "
+    "latitude, longitude FROM {table} ORDER BY name",
+    "st_xy": "SELECT id, station_id, name, address, distance_to_station_m, fee_info, created_at, "
+    "ST_Y(location::geometry) AS latitude, ST_X(location::geometry) AS longitude FROM {table} ORDER BY name",
+}
+
+# 대구 일대 임의 좌표로 임시 주차장 테이블 생성 (트리거 대신 location을 함께 계산)
+CREATE_BENCH_TABLE = f"""
+CREATE TEMP TABLE {BENCH_TABLE} AS
+SELECT
+    gen_random_uuid() AS id,
+    gen_random_uuid() AS station_id,
+    '주차장 ' || n AS name,
+    '대구광역시 중구 ' || n AS address,
+    (random() * 1000)::int AS distance_to_station_m,
+    NULL::text AS fee_info,
+    now() AS created_at,
+    lat AS latitude,
+    lng AS longitude,
+    ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography AS location
+FROM (
+    SELECT n, 35.75 + random() * 0.25 AS lat, 128.45 + random() * 0.30 AS lng
+    FROM generate_series(1, :rows) AS n
+) AS points
+"""
+
+
+def measure(connection, sql: str, repeat: int) -> dict:
+    """쿼리를 repeat회 실행하여 실행 시간(ms) 통계 반환 (1회 워밍업 제외)"""
+    connection.execute(text(sql)).all()
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = connection.execute(text(sql)).all()
+        durations.append((time.perf_counter() - started) * 1000)
+    durations.sort()
+    return {
+        "rows": len(rows),
+        "median_ms": statistics.median(durations),
+        "p95_ms": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+        "min_ms": durations[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="좌표 컬럼 조회 vs ST_X/ST_Y 계산 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="임시 테이블 행 수")
+    parser.add_argument("--repeat", type=int, default=10, help="방식별 반복 횟수")
+    parser.add_argument("--table", default=None, help="측정할 실제 테이블 (지정 시 임시 테이블 미생성)")
+    parser.add_argument("--json", action="store_true", help="측정 결과만 JSON으로 출력")
+    args = parser.parse_args()
+
+    engine = create_engine(get_settings().database_url)
+    table = args.table or BENCH_TABLE
+
+    with engine.connect() as connection:
+        if args.table is None:
+            connection.execute(text(CREATE_BENCH_TABLE), {"rows": args.rows})
+            connection.execute(text(f"ANALYZE {BENCH_TABLE}"))
+
+        results = {name: measure(connection, sql.format(table=table), args.repeat) for name, sql in QUERIES.items()}
+        connection.rollback()
+
+    engine.dispose()
+
+    if args.json:
+        print(json.dumps({"table": table, **results}, ensure_ascii=False))
+        return
+
+    print(f"⏱️  좌표 조회 벤치마크 ({table}, {results['columns']['rows']}행, {args.repeat}회)")
+    for name, result in results.items():
+        print(
+            f"   {name:8s}: median {result['median_ms']:8.1f} ms"
+            f" / p95 {result['p95_ms']:8.1f} ms / min {result['min_ms']:8.1f} ms"
+        )
+    speedup = results["st_xy"]["median_ms"] / results["columns"]["median_ms"]
+    print(f"📉 컬럼 조회가 ST_X/ST_Y 계산 대비 {speedup:.2f}배 빠름 (median 기준)")
+
+
+if __name__ == "__main__":
+    main()
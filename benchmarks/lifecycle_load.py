@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+여정 라이프사이클 부하 테스트 드라이버
+
+asyncio + httpx로 가상 사용자를 동시에 실행하여
+출발 → 환승(이미지 업로드 포함) → 도착(이미지 업로드 포함) → 관리자 승인 흐름을 반복하고
+엔드포인트별 p50/p95/p99 지연 시간과 처리량(req/s)을 출력
+
+실행 방법:
+    # 로컬 Supabase(Postgres + PostgREST + Auth + Storage) 기동 후 서버 실행
+    supabase start
+    uv run uvicorn src.main:app --port 8000
+
+    # 가상 사용자 10명 x 사용자당 5회 여정
+    uv run python benchmarks/lifecycle_load.py --users 10 --iterations 5 \\
+        --admin-email admin@ecopass.com --admin-password admin123
+
+    # 결과를 기준선으로 저장 / 기준선과 비교 (p95가 허용치 이상 느려지면 종료 코드 1)
+    uv run python benchmarks/lifecycle_load.py --save-baseline local
+    uv run python benchmarks/lifecycle_load.py --compare local --tolerance 0.2
+
+주의사항:
+    - 가상 사용자마다 새 계정을 회원가입하므로 운영 환경에서 실행하지 마세요
+    - 관리자 계정이 없으면 승인 단계는 건너뜁니다 (scripts/create_admin_user.py 참고)
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+from uuid import uuid4
+
+import httpx
+
+BASELINE_DIR = Path(__file__).parent / "baselines" / "lifecycle"
+
+# 1x1 PNG (환승/도착 인증 이미지)
+PNG_IMAGE = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
+    b"\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\x00\x01"
+    b"\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+# 대구역 → 중앙로역 → 반월당역 (통합 테스트와 동일한 좌표)
+START = {"latitude": 35.8809, "longitude": 128.6286}
+TRANSFER = {"latitude": 35.8714, "longitude": 128.5988}
+ARRIVAL = {"latitude": 35.8569, "longitude": 128.5932}
+
+
+class LatencyRecorder:
+    """엔드포인트별 지연 시간 및 실패 횟수 기록"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.failures: dict[str, int] = defaultdict(int)
+
+    async def call(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        method: str,
+        url: str,
+        expected_status: int,
+        **kwargs,
+    ) -> Optional[dict]:
+        """
+        요청 1건 실행 및 지연 시간 기록
+        기대한 상태 코드가 아니면 실패로 집계하고 None 반환
+        """
+        started_at = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.failures[endpoint] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - started_at)
+
+        if response.status_code != expected_status:
+            self.failures[endpoint] += 1
+            return None
+        return response.json()
+
+
+def percentile(sorted_values: list[float], ratio: float) -> float:
+    """정렬된 값 목록의 백분위수 (최근접 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(ratio * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(recorder: LatencyRecorder, elapsed: float) -> dict[str, dict]:
+    """엔드포인트별 통계 (밀리초 단위 지연 시간, 처리량)"""
+    summary = {}
+    for endpoint in sorted(set(recorder.latencies) | set(recorder.failures)):
+        values = sorted(recorder.latencies.get(endpoint, []))
+        summary[endpoint] = {
+            "count": len(values),
+            "failures": recorder.failures.get(endpoint, 0),
+            "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+            "mean_ms": round(statistics.fmean(values) * 1000, 2) if values else 0.0,
+            "throughput_rps": round(len(values) / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+    return summary
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> Optional[str]:
+    """로그인 후 access_token 반환 (실패 시 None)"""
+    response = await client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    if response.status_code != 200:
+        return None
+    return response.json()["data"]["access_token"]
+
+
+async def run_virtual_user(
+    client: httpx.AsyncClient,
+    recorder: LatencyRecorder,
+    iterations: int,
+    admin_headers: Optional[dict],
+) -> int:
+    """
+    가상 사용자 1명의 여정을 iterations회 순차 실행
+    (사용자당 진행 중 여정은 1개만 허용되므로 사용자 내부는 순차, 사용자 간은 병렬)
+
+    Returns:
+        완료한 여정 수
+    """
+    random_id = uuid4().hex[:8]
+    signup = await recorder.call(
+        client,
+        "POST /auth/signup",
+        "POST",
+        "/api/v1/auth/signup",
+        201,
+        json={
+            "email": f"bench_{random_id}@example.com",
+            "password": "benchpassword123",
+            "username": f"벤치유저_{random_id}",
+            "vehicle_number": "12가3456",
+        },
+    )
+    if signup is None:
+        return 0
+    headers = {"Authorization": f"Bearer {signup['data']['access_token']}"}
+
+    completed = 0
+    for _ in range(iterations):
+        started = await recorder.call(
+            client, "POST /trips/start", "POST", "/api/v1/trips/start", 201, json=START, headers=headers
+        )
+        if started is None:
+            break
+        trip_id = started["data"]["trip_id"]
+
+        upload = await recorder.call(
+            client,
+            "POST /storage/upload/transfer",
+            "POST",
+            "/api/v1/storage/upload/transfer",
+            201,
+            files={"file": ("transfer.png", PNG_IMAGE, "image/png")},
+            headers=headers,
+        )
+        if upload is None:
+            break
+        transferred = await recorder.call(
+            client,
+            "POST /trips/{trip_id}/transfer",
+            "POST",
+            f"/api/v1/trips/{trip_id}/transfer",
+            200,
+            json={**TRANSFER, "transfer_image_url": upload["data"]["image_url"]},
+            headers=headers,
+        )
+        if transferred is None:
+            break
+
+        upload = await recorder.call(
+            client,
+            "POST /storage/upload/arrival",
+            "POST",
+            "/api/v1/storage/upload/arrival",
+            201,
+            files={"file": ("arrival.png", PNG_IMAGE, "image/png")},
+            headers=headers,
+        )
+        if upload is None:
+            break
+        arrived = await recorder.call(
+            client,
+            "POST /trips/{trip_id}/arrival",
+            "POST",
+            f"/api/v1/trips/{trip_id}/arrival",
+            200,
+            json={**ARRIVAL, "arrival_image_url": upload["data"]["image_url"]},
+            headers=headers,
+        )
+        if arrived is None:
+            break
+
+        if admin_headers is not None:
+            await recorder.call(
+                client,
+                "POST /admin/trips/{trip_id}/approve",
+                "POST",
+                f"/api/v1/admin/trips/{trip_id}/approve",
+                200,
+                headers=admin_headers,
+            )
+        completed += 1
+
+    return completed
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    """부하 테스트 실행 후 결과(dict) 반환"""
+    recorder = LatencyRecorder()
+    limits = httpx.Limits(max_connections=args.users * 2, max_keepalive_connections=args.users * 2)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        admin_headers = None
+        if args.admin_email and args.admin_password:
+            token = await login(client, args.admin_email, args.admin_password)
+            if token is None:
+                print("⚠️  관리자 로그인 실패: 승인 단계를 건너뜁니다")
+            else:
+                admin_headers = {"Authorization": f"Bearer {token}"}
+        else:
+            print("ℹ️  관리자 계정 미지정: 승인 단계를 건너뜁니다")
+
+        started_at = time.perf_counter()
+        completed = await asyncio.gather(
+            *(run_virtual_user(client, recorder, args.iterations, admin_headers) for _ in range(args.users))
+        )
+        elapsed = time.perf_counter() - started_at
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "base_url": args.base_url,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {"users": args.users, "iterations": args.iterations},
+        "elapsed_seconds": round(elapsed, 3),
+        "completed_trips": sum(completed),
+        "endpoints": summarize(recorder, elapsed),
+    }
+
+
+def print_report(result: dict) -> None:
+    """엔드포인트별 결과 표 출력"""
+    print("\n" + "=" * 100)
+    print(
+        f"여정 라이프사이클 벤치마크: 사용자 {result['config']['users']}명 x {result['config']['iterations']}회, "
+        f"완료 여정 {result['completed_trips']}건, {result['elapsed_seconds']}초"
+    )
+    print("=" * 100)
+    print(f"{'엔드포인트':<38}{'요청':>7}{'실패':>6}{'p50(ms)':>11}{'p95(ms)':>11}{'p99(ms)':>11}{'req/s':>10}")
+    for endpoint, stats in result["endpoints"].items():
+        print(
+            f"{endpoint:<38}{stats['count']:>7}{stats['failures']:>6}"
+            f"{stats['p50_ms']:>11.1f}{stats['p95_ms']:>11.1f}{stats['p99_ms']:>11.1f}{stats['throughput_rps']:>10.1f}"
+        )
+    print("=" * 100)
+
+
+def compare_with_baseline(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    기준선 대비 p95 지연 시간 회귀 검사
+
+    Returns:
+        허용치(tolerance, 비율)를 넘어 느려진 엔드포인트 설명 목록
+    """
+    regressions = []
+    for endpoint, stats in result["endpoints"].items():
+        base = baseline["endpoints"].get(endpoint)
+        if not base or not base["p95_ms"]:
+            continue
+        ratio = stats["p95_ms"] / base["p95_ms"] - 1
+        marker = "❌" if ratio > tolerance else "✅"
+        print(f"  {marker} {endpoint}: p95 {base['p95_ms']:.1f}ms → {stats['p95_ms']:.1f}ms ({ratio:+.1%})")
+        if ratio > tolerance:
+            regressions.append(f"{endpoint} ({ratio:+.1%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="여정 라이프사이클 부하 테스트 (p50/p95/p99, 처리량)")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API 서버 주소")
+    parser.add_argument("--users", type=int, default=10, help="동시 가상 사용자 수 (기본 10)")
+    parser.add_argument("--iterations", type=int, default=5, help="사용자당 여정 반복 횟수 (기본 5)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--admin-email", help="승인 단계에 사용할 관리자 이메일")
+    parser.add_argument("--admin-password", help="승인 단계에 사용할 관리자 비밀번호")
+    parser.add_argument("--save-baseline", metavar="NAME", help="결과를 baselines/lifecycle/NAME.json으로 저장")
+    parser.add_argument("--compare", metavar="NAME", help="baselines/lifecycle/NAME.json과 p95 비교")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 p95 증가 비율 (기본 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.users < 1 or args.iterations < 1:
+        parser.error("--users와 --iterations는 1 이상이어야 합니다")
+
+    result = asyncio.run(run_benchmark(args))
+    print_report(result)
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        path = BASELINE_DIR / f"{args.save_baseline}.json"
+        path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"💾 기준선 저장: {path}")
+
+    if args.compare:
+        path = BASELINE_DIR / f"{args.compare}.json"
+        if not path.exists():
+            print(f"❌ 기준선 파일이 없습니다: {path}")
+            sys.exit(2)
+        print(f"\n📊 기준선 비교 ({path.name}, 허용치 {args.tolerance:.0%})")
+        regressions = compare_with_baseline(result, json.loads(path.read_text(encoding="utf-8")), args.tolerance)
+        if regressions:
+            print(f"\n❌ 성능 회귀 감지: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ 성능 회귀 없음")
@@ -0,0 +1,46 @@
+"""
+응답 압축 마이크로 벤치마크
+
+전체 역 카탈로그 크기의 JSON 본문을 요청마다 압축하는 비용과
+ETag 단위 압축 캐시(카탈로그 버전당 1회 압축)를 재사용하는 비용 비교
+"""
+
+import json
+
+import pytest
+
+from src.api.middleware.compression import CompressionMiddleware
+
+ROWS = 100
+
+
+@pytest.fixture(scope="module")
+def catalog_body():
+    """100개 역 목록 응답 크기의 JSON 본문"""
+    stations = [
+        {
+            "id": f"00000000-0000-0000-0000-{index:012d}",
+            "name": f"테스트역{index}",
+            "line_number": index % 4 + 1,
+            "latitude": 35.85 + index * 0.001,
+            "longitude": 128.59 + index * 0.001,
+        }
+        for index in range(ROWS)
+    ]
+    payload = {"status": "success", "message": "역 목록", "data": {"stations": stations, "total_count": ROWS}}
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+class BenchCatalogCompression:
+    """요청마다 압축 vs ETag 단위 압축 캐시"""
+
+    def bench_gzip_per_request(self, benchmark, catalog_body):
+        """요청마다 gzip 압축"""
+        middleware = CompressionMiddleware(app=None)
+        compressed = benchmark(middleware.compress, catalog_body, "gzip")
+        benchmark.extra_info["ratio"] = round(len(compressed) / len(catalog_body), 3)
+
+    def bench_gzip_cached_by_etag(self, benchmark, catalog_body):
+        """같은 카탈로그 버전(ETag)은 압축 결과 재사용"""
+        middleware = CompressionMiddleware(app=None)
+        benchmark(middleware._compress_cached, catalog_body, "gzip", 'W/"catalog"')
@@ -0,0 +1,43 @@
+"""
+거리/포인트 계산 마이크로 벤치마크
+
+도착 처리(arrival) 시 매번 실행되는 거리 계산과 포인트 산정 비용 측정
+"""
+
+from src.shared.utils.distance import (
+    calculate_distance_meters,
+    calculate_points_from_distance,
+    calculate_trip_total_distance,
+    validate_points_consistency,
+)
+
+
+class BenchDistance:
+    """거리 계산 벤치마크"""
+
+    def bench_distance_between_two_points(self, benchmark):
+        """두 좌표 간 geodesic 거리 (대구역 → 반월당역)"""
+        result = benchmark(calculate_distance_meters, 35.8809, 128.6286, 35.8569, 128.5932)
+        assert result > 0
+
+    def bench_trip_total_distance_with_transfer(self, benchmark):
+        """출발 → 환승 → 도착 전체 거리"""
+        result = benchmark(
+            calculate_trip_total_distance,
+            35.8809,
+            128.6286,
+            35.8714,
+            128.5988,
+            35.8569,
+            128.5932,
+        )
+        assert result > 0
+
+    def bench_points_and_consistency_check(self, benchmark):
+        """포인트 산정 + 클라이언트 포인트 검증"""
+
+        def run():
+            points = calculate_points_from_distance(4321.0)
+            return validate_points_consistency(points, 8)
+
+        benchmark(run)
@@ -0,0 +1,129 @@
+"""
+응답 직렬화 경로 마이크로 벤치마크
+
+100건 역/여정 목록 응답을 기존 경로(response_model 재검증 + JSON 인코딩)와
+빠른 경로(FastSerializationRoute)로 각각 처리하는 비용 비교
+행당 비용은 결과의 평균 시간을 extra_info["rows"]로 나누어 확인
+"""
+
+import json
+import os
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from src.api.responses import FastJSONResponse, FastSerializationRoute
+from src.api.schemas.station_schemas import StationListResponse, StationResponse
+from src.api.schemas.trip_schemas import TripListResponse, TripResponse
+from src.config import get_settings
+from src.infrastructure.repositories.trip_repository_impl import SupbaseTripRepository
+from src.shared.schemas.response import SuccessResponse
+
+ROWS = 100
+
+
+def build_client(route_class: type[APIRoute], station_list: StationListResponse, trip_list: TripListResponse):
+    """역/여정 목록을 반환하는 최소 앱 생성 (빠른 경로 설정은 라우트 생성 시점에 적용)"""
+    os.environ["FAST_SERIALIZATION_ENABLED"] = "true"
+    get_settings.cache_clear()
+    try:
+        router = APIRouter(route_class=route_class)
+
+        @router.get("/stations", response_model=SuccessResponse[StationListResponse])
+        async def list_stations():
+            return SuccessResponse.create(message="역 목록", data=station_list)
+
+        @router.get("/trips", response_model=SuccessResponse[TripListResponse])
+        async def list_trips():
+            return SuccessResponse.create(message="여정 목록", data=trip_list)
+
+        app = FastAPI()
+        app.include_router(router)
+    finally:
+        os.environ.pop("FAST_SERIALIZATION_ENABLED")
+        get_settings.cache_clear()
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def payloads(trip_rows):
+    """100건 역 목록 / 여정 목록 응답 스키마"""
+    stations = [
+        StationResponse(
+            id=uuid4(),
+            name=f"테스트역{index}",
+            line_number=index % 4 + 1,
+            latitude=35.85 + index * 0.001,
+            longitude=128.59 + index * 0.001,
+        )
+        for index in range(ROWS)
+    ]
+    repository = SupbaseTripRepository(db=None)
+    trips = [TripResponse.model_validate(repository._parse_trip_data(row)) for row in trip_rows[:ROWS]]
+    return (
+        StationListResponse(stations=stations, total_count=ROWS),
+        TripListResponse(trips=trips, total_count=ROWS),
+    )
+
+
+@pytest.fixture(scope="module")
+def default_client(payloads):
+    return build_client(APIRoute, *payloads)
+
+
+@pytest.fixture(scope="module")
+def fast_client(payloads):
+    return build_client(FastSerializationRoute, *payloads)
+
+
+class BenchResponseSerialization:
+    """기존 경로 vs 빠른 경로 (100건 목록)"""
+
+    @pytest.mark.parametrize("path", ["/stations", "/trips"])
+    def bench_default_route(self, benchmark, default_client, path):
+        """기존 경로: response_model 재검증 후 JSON 인코딩"""
+        benchmark.extra_info["rows"] = ROWS
+        response = benchmark(default_client.get, path)
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("path", ["/stations", "/trips"])
+    def bench_fast_route(self, benchmark, fast_client, default_client, path):
+        """빠른 경로: 재검증 없이 pydantic-core 직렬화 (응답 본문은 기존 경로와 동일해야 함)"""
+        benchmark.extra_info["rows"] = ROWS
+        response = benchmark(fast_client.get, path)
+        assert response.status_code == 200
+        assert response.json() == default_client.get(path).json()
+
+
+class BenchEnvelopeEncoding:
+    """
+    HTTP 계층을 제외한 봉투 인코딩 비용 (100건 목록)
+    기존 경로는 FastAPI의 응답 처리 단계(재검증 → JSON 모드 덤프 → json.dumps)를 동일하게 재현
+    """
+
+    @pytest.mark.parametrize("kind", ["stations", "trips"])
+    def bench_validate_then_dump(self, benchmark, payloads, kind):
+        """기존 경로: response_model 재검증 + dict 덤프 + 표준 json 인코딩"""
+        data = payloads[0] if kind == "stations" else payloads[1]
+        response_type = type(data)
+        adapter = TypeAdapter(SuccessResponse[response_type])
+        result = SuccessResponse.create(message="목록", data=data)
+        benchmark.extra_info["rows"] = ROWS
+
+        def run():
+            validated = adapter.validate_python(result, from_attributes=True)
+            return json.dumps(adapter.dump_python(validated, mode="json"), ensure_ascii=False).encode("utf-8")
+
+        benchmark(run)
+
+    @pytest.mark.parametrize("kind", ["stations", "trips"])
+    def bench_fast_json_render(self, benchmark, payloads, kind):
+        """빠른 경로: 재검증 없이 pydantic-core로 바로 JSON bytes 생성"""
+        data = payloads[0] if kind == "stations" else payloads[1]
+        result = SuccessResponse.create(message="목록", data=data)
+        benchmark.extra_info["rows"] = ROWS
+        benchmark(FastJSONResponse, result)
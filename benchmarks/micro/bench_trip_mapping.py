@@ -0,0 +1,31 @@
+"""
+여정 조회 경로 마이크로 벤치마크
+
+PostgREST 응답 → Trip 엔티티 변환(레포지토리)과
+Trip 엔티티 → 응답 스키마 직렬화 비용을 목록 100건 기준으로 측정
+"""
+
+from src.api.schemas.trip_schemas import TripResponse
+from src.domain.entities.trip import Trip
+from src.infrastructure.repositories.trip_repository_impl import SupbaseTripRepository
+
+
+class BenchTripMapping:
+    """여정 매핑/직렬화 벤치마크"""
+
+    def bench_parse_trip_rows(self, benchmark, trip_rows):
+        """레포지토리 행 → 엔티티 변환 100건"""
+        repository = SupbaseTripRepository(db=None)
+        trips = benchmark(lambda: [repository._parse_trip_data(row) for row in trip_rows])
+        assert len(trips) == 100
+
+    def bench_serialize_trip_list(self, benchmark, trip_rows):
+        """엔티티 → 사용자 응답 JSON 직렬화 100건 (이미지 경로 → Public URL 변환 포함)"""
+        repository = SupbaseTripRepository(db=None)
+        trips: list[Trip] = [repository._parse_trip_data(row) for row in trip_rows]
+
+        def run():
+            return [TripResponse.model_validate(trip).model_dump_json() for trip in trips]
+
+        payloads = benchmark(run)
+        assert len(payloads) == 100
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+trips 테이블 이미지 URL → 객체 경로 변환 스크립트 (1회성)
+
+trips 테이블에 저장된 Storage URL(public/sign)을 버킷 내 객체 경로로 변환
+변환 후에는 응답 시점에 URL을 발급하므로 주기적인 Signed URL 갱신이 필요 없음
+
+- Storage URL이 남아 있는 행만 id 기준 keyset 페이지로 조회
+- 페이지마다 bulk_update_trip_image_urls RPC 한 번으로 일괄 반영
+- 외부 URL(Storage 객체가 아닌 값)은 변경하지 않음
+
+실행 방법:
+    # Dry-run (변환 대상만 집계, 실제 변경 없음)
+    uv run python scripts/convert_image_urls_to_paths.py --dry-run
+
+    # 실제 변환 실행
+    uv run python scripts/convert_image_urls_to_paths.py --page-size 500
+
+주의사항:
+    - supabase/migrations/20260103000001_add_bulk_update_trip_image_urls_function.sql 적용 필요
+    - 여러 번 실행해도 안전합니다 (이미 변환된 행은 조회되지 않음)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from supabase import Client, create_client
+
+from src.config import get_settings
+from src.shared.utils.storage_path import extract_object_path
+
+IMAGE_COLUMNS = ("transfer_image_url", "arrival_image_url")
+
+# Storage URL이 하나라도 남아 있는 행만 조회하는 PostgREST 필터
+STORAGE_URL_FILTER = ",".join(f"{column}.like.*/storage/v1/object/*" for column in IMAGE_COLUMNS)
+
+
+def iter_storage_url_pages(supabase: Client, page_size: int):
+    """
+    Storage URL이 남아 있는 여정을 id 기준 keyset 페이지로 조회
+    """
+    last_id = None
+    while True:
+        query = (
+            supabase.table("trips")
+            .select("id, transfer_image_url, arrival_image_url")
+            .or_(STORAGE_URL_FILTER)
+        )
+        if last_id is not None:
+            query = query.gt("id", last_id)
+
+        rows = query.order("id").limit(page_size).execute().data
+        if not rows:
+            return
+
+        yield rows
+
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]["id"]
+
+
+def build_updates(rows: list[dict]) -> list[dict]:
+    """
+    한 페이지의 URL → 객체 경로 변경 목록 생성
+    변경할 컬럼만 포함 (RPC에서 누락 컬럼은 기존 값 유지)
+    """
+    updates = []
+    for row in rows:
+        update = {"id": row["id"]}
+        for column in IMAGE_COLUMNS:
+            value = row.get(column)
+            path = extract_object_path(value)
+            if path and path != value:
+                update[column] = path
+        if len(update) > 1:
+            updates.append(update)
+    return updates
+
+
+def convert_image_urls(page_size: int, dry_run: bool) -> None:
+    """
+    이미지 URL → 객체 경로 변환 실행
+    """
+    settings = get_settings()
+
+    # Storage API는 URL 끝에 슬래시가 필요함
+    supabase_url = settings.supabase_url.rstrip("/") + "/"
+    supabase = create_client(supabase_url, settings.supabase_key)
+
+    if dry_run:
+        print("🧪 DRY-RUN 모드: 실제 데이터베이스 변경 없이 변환 대상만 집계합니다.\n")
+
+    page_count = 0
+    trip_count = 0
+    url_count = 0
+    started_at = time.perf_counter()
+
+    print("📋 Storage URL이 남아 있는 여정을 페이지 단위로 조회 중...")
+    for page_count, rows in enumerate(iter_storage_url_pages(supabase, page_size), start=1):
+        updates = build_updates(rows)
+        if updates and not dry_run:
+            supabase.rpc("bulk_update_trip_image_urls", {"p_updates": updates}).execute()
+
+        converted = sum(len(update) - 1 for update in updates)
+        trip_count += len(updates)
+        url_count += converted
+        print(f"  ✅ 페이지 {page_count}: {len(rows)}건 조회, {converted}개 URL 변환")
+
+    elapsed = time.perf_counter() - started_at
+
+    print("\n" + "=" * 60)
+    print("🧪 DRY-RUN 완료 (실제 변경 없음)" if dry_run else "🎉 변환 완료!")
+    print("=" * 60)
+    print(f"조회 페이지: {page_count}개")
+    print(f"변환 {'대상' if dry_run else '완료'} 여정: {trip_count}개 ({url_count}개 URL)")
+    print(f"소요 시간: {elapsed:.2f}초")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="trips 이미지 URL을 Storage 객체 경로로 변환")
+    parser.add_argument("--page-size", type=int, default=500, help="keyset 페이지 크기 (기본 500)")
+    parser.add_argument("--dry-run", action="store_true", help="실제 변경 없이 변환 대상만 집계")
+    args = parser.parse_args()
+
+    if args.page_size < 1:
+        parser.error("--page-size는 1 이상이어야 합니다")
+
+    convert_image_urls(page_size=args.page_size, dry_run=args.dry_run)
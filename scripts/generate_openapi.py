@@ -0,0 +1,53 @@
+"""
+OpenAPI 스키마 사전 생성 스크립트
+
+라우트로부터 OpenAPI 스키마를 생성하여 src/api/openapi.json에 저장합니다.
+앱 시작 시 이 파일을 로드하여 첫 /docs, /openapi.json 요청의 스키마 생성 비용을 없앱니다.
+
+라우트/스키마를 변경한 뒤에는 반드시 다시 실행하세요.
+(tests/startup/test_cold_start.py가 저장된 스키마와 현재 라우트의 불일치를 검출합니다)
+
+사용법:
+    python scripts/generate_openapi.py          # 스키마 파일 갱신
+    python scripts/generate_openapi.py --check  # 파일이 최신인지 확인만 (불일치 시 exit 1)
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.api.openapi import PREBUILT_OPENAPI_PATH, generate_openapi_schema, load_prebuilt_openapi
+from src.main import app
+
+
+def render_schema(schema: dict) -> str:
+    """diff가 보기 쉽도록 키 순서를 유지한 들여쓰기 JSON으로 직렬화"""
+    return json.dumps(schema, ensure_ascii=False, indent=2) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAPI 스키마 사전 생성")
+    parser.add_argument("--check", action="store_true", help="파일이 최신인지 확인만 수행")
+    args = parser.parse_args()
+
+    schema = generate_openapi_schema(app)
+
+    if args.check:
+        if load_prebuilt_openapi() != schema:
+            print(f"❌ {PREBUILT_OPENAPI_PATH.relative_to(project_root)}이(가) 최신이 아닙니다")
+            print("   python scripts/generate_openapi.py 를 실행하세요")
+            sys.exit(1)
+        print("✅ OpenAPI 스키마 파일이 최신입니다")
+        return
+
+    PREBUILT_OPENAPI_PATH.write_text(render_schema(schema), encoding="utf-8")
+    print(f"✅ OpenAPI 스키마 저장 완료: {PREBUILT_OPENAPI_PATH.relative_to(project_root)} (경로 {len(schema['paths'])}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+콜드 스타트 프로파일링 스크립트
+
+새 Python 프로세스에서 앱을 띄워 첫 요청까지의 시간을 측정하고 import 비용 리포트를 출력합니다.
+- import: src.main import (라우트, 의존성 모듈 로드 포함)
+- startup: lifespan 시작 (DB 엔진 초기화 등)
+- first request: 첫 GET /health 응답
+- openapi: 첫 GET /openapi.json 응답 (미리 생성된 스키마 사용 여부 확인)
+- 지연 로드 대상 모듈(geopy, 네이버 Geocoding)이 시작 시점에 로드되었는지 확인
+
+사용법:
+    python scripts/profile_startup.py                  # 측정 + import 비용 상위 모듈 리포트
+    python scripts/profile_startup.py --budget-ms 2500 # 예산 초과 시 exit 1
+    python scripts/profile_startup.py --json           # 측정 결과만 JSON 출력 (테스트/CI용)
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+# 첫 사용 시점까지 로드를 미루는 모듈 (시작 시 로드되면 회귀)
+DEFERRED_MODULES = (
+    "geopy",
+    "src.infrastructure.external.naver_geocoding_service",
+)
+
+# 자식 프로세스에서 실행할 측정 코드 (인터프리터 시작 이후 구간별 시간 측정)
+PROBE_CODE = f"""
+import json, sys, time, warnings
+warnings.simplefilter("ignore")
+started = time.perf_counter()
+from src.main import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    ready = time.perf_counter()
+    client.get("/health")
+    first_request = time.perf_counter()
+    first_request_wall = time.time()
+    deferred_loaded = [name for name in {DEFERRED_MODULES!r} if name in sys.modules]
+    client.get("{{}}".format(app.openapi_url))
+    openapi = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "first_request_ms": (first_request - ready) * 1000,
+    "openapi_ms": (openapi - first_request) * 1000,
+    "deferred_modules_loaded": deferred_loaded,
+    "first_request_wall": first_request_wall,
+}}))
+"""
+
+
+def run_probe() -> dict:
+    """
+    새 프로세스에서 앱을 띄워 구간별 시간 측정
+    첫 요청까지 전체 시간은 인터프리터 시작 시간을 포함하도록 프로세스 생성 시각 기준으로 계산
+    """
+    env = {**os.environ, "PYTHONPATH": str(project_root), "PYTHONDONTWRITEBYTECODE": "1"}
+    spawned_wall = time.time()
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE_CODE],
+        cwd=project_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["time_to_first_request_ms"] = (result.pop("first_request_wall") - spawned_wall) * 1000
+    return result
+
+
+def import_time_report(top: int) -> tuple[list[tuple[str, float]], list[tuple[str, float]]]:
+    """
+    python -X importtime 결과 집계
+
+    Returns:
+        (최상위 패키지별 self 시간 합계 상위 목록, 모듈별 누적 시간 상위 목록) - 단위 ms
+    """
+    env = {**os.environ, "PYTHONPATH": str(project_root), "PYTHONDONTWRITEBYTECODE": "1"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", "import src.main"],
+        cwd=project_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    by_package: dict[str, float] = defaultdict(float)
+    by_module: list[tuple[str, float]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():  # 헤더 행
+            continue
+        module = name.strip()
+        top_level = module.split(".", 1)[0] if not module.startswith("src.") else ".".join(module.split(".")[:3])
+        by_package[top_level] += int(self_us) / 1000
+        by_module.append((module, int(cumulative_us) / 1000))
+
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+    modules = sorted(by_module, key=lambda item: item[1], reverse=True)[:top]
+    return packages, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 프로파일링")
+    parser.add_argument("--budget-ms", type=float, default=None, help="첫 요청까지 허용 시간 (초과 시 exit 1)")
+    parser.add_argument("--top", type=int, default=15, help="import 비용 리포트 상위 항목 수")
+    parser.add_argument("--json", action="store_true", help="측정 결과만 JSON으로 출력")
+    args = parser.parse_args()
+
+    result = run_probe()
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False))
+    else:
+        print("⏱️  콜드 스타트 측정")
+        print(f"   import           : {result['import_ms']:8.1f} ms")
+        print(f"   lifespan startup : {result['startup_ms']:8.1f} ms")
+        print(f"   first request    : {result['first_request_ms']:8.1f} ms")
+        print(f"   첫 요청까지 (전체): {result['time_to_first_request_ms']:8.1f} ms")
+        print(f"   first /openapi   : {result['openapi_ms']:8.1f} ms")
+
+        if result["deferred_modules_loaded"]:
+            print(f"⚠️  시작 시점에 로드된 지연 로드 대상 모듈: {', '.join(result['deferred_modules_loaded'])}")
+        else:
+            print("✅ 지연 로드 대상 모듈이 시작 시점에 로드되지 않음")
+
+        packages, modules = import_time_report(args.top)
+        print(f"\n📦 패키지별 import 시간 (self 합계, 상위 {args.top})")
+        for name, ms in packages:
+            print(f"   {ms:8.1f} ms  {name}")
+        print(f"\n📄 모듈별 import 시간 (누적, 상위 {args.top})")
+        for name, ms in modules:
+            print(f"   {ms:8.1f} ms  {name}")
+
+    if args.budget_ms is not None and result["time_to_first_request_ms"] > args.budget_ms:
+        print(
+            f"❌ 첫 요청까지 {result['time_to_first_request_ms']:.1f}ms - 예산 {args.budget_ms:.0f}ms 초과",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
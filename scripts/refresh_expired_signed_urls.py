@@ -1,66 +1,272 @@
 #!/usr/bin/env python3
 """
-만료된 Signed URL 갱신 스크립트
-trips 테이블의 모든 이미지 URL을 새로운 24시간 유효 URL로 업데이트
+만료 임박 Signed URL 갱신 스크립트
+
+trips 테이블을 id 기준 keyset 페이지로 스트리밍하며
+만료가 임박한 Signed URL만 골라 새로운 URL로 갱신
+
+- Signed URL이 있는 행만 조회 (전체 여정을 읽지 않음)
+- 페이지마다 create_signed_urls 일괄 API 1회 호출
+- 갱신 결과는 bulk_update_trip_image_urls RPC 한 번으로 일괄 반영
+- 동시에 처리 중인 페이지 수는 --concurrency로 제한
+
+실행 방법:
+    # Dry-run (갱신 대상만 집계, 실제 변경 없음)
+    uv run python scripts/refresh_expired_signed_urls.py --dry-run
+
+    # 만료 6시간 이내 URL만 갱신, 페이지 500건, 동시 4페이지
+    uv run python scripts/refresh_expired_signed_urls.py --threshold-hours 6 --page-size 500 --concurrency 4
+
+주의사항:
+    - SIGNED_URL_REFRESH_CRON을 설정하면 앱 스케줄러가 주기 실행함 (기본 비활성)
+    - supabase/migrations/20260103000001_add_bulk_update_trip_image_urls_function.sql 적용 필요
+    - 신규 여정은 객체 경로만 저장하고 응답 시 Signed URL을 발급함
+      scripts/convert_image_urls_to_paths.py로 기존 URL을 변환하면 이 스크립트는 더 이상 필요 없음
 """
-import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
-
-def main():
-    load_dotenv()
-
-    supabase_url = "https://cozcysbrzmmumutivtny.supabase.co"
-    supabase_key = os.getenv("SUPABASE_KEY")
-
-    print("🔧 Supabase 클라이언트 생성 중...")
-    supabase: Client = create_client(supabase_url, supabase_key)
-
-    # trips 테이블에서 이미지 URL이 있는 모든 레코드 조회
-    print("\n📋 만료된 URL이 있는 여정 조회 중...")
-    response = supabase.table("trips").select("id, transfer_image_url, arrival_image_url").execute()
-
-    trips = response.data
-    print(f"✅ 총 {len(trips)}개의 여정 발견\n")
-
-    storage = supabase.storage.from_("trips")
-    updated_count = 0
-
-    for trip in trips:
-        trip_id = trip["id"]
-        transfer_url = trip.get("transfer_image_url")
-        arrival_url = trip.get("arrival_image_url")
-
-        updates = {}
-
-        # transfer_image_url 갱신
-        if transfer_url and "/sign/" in transfer_url:
-            # URL에서 파일 경로 추출
-            file_path = transfer_url.split("/trips/")[1].split("?")[0]
-            try:
-                new_url = storage.create_signed_url(file_path, expires_in=86400)["signedURL"]
-                updates["transfer_image_url"] = new_url
-                print(f"✅ {trip_id[:8]}... transfer 갱신")
-            except Exception as e:
-                print(f"❌ {trip_id[:8]}... transfer 실패: {e}")
-
-        # arrival_image_url 갱신
-        if arrival_url and "/sign/" in arrival_url:
-            file_path = arrival_url.split("/trips/")[1].split("?")[0]
-            try:
-                new_url = storage.create_signed_url(file_path, expires_in=86400)["signedURL"]
-                updates["arrival_image_url"] = new_url
-                print(f"✅ {trip_id[:8]}... arrival 갱신")
-            except Exception as e:
-                print(f"❌ {trip_id[:8]}... arrival 실패: {e}")
-
-        # DB 업데이트
-        if updates:
-            supabase.table("trips").update(updates).eq("id", trip_id).execute()
-            updated_count += 1
-
-    print(f"\n🎉 완료! {updated_count}개 여정의 URL 갱신됨")
-    print("⏰ 새 URL은 24시간 동안 유효합니다")
+
+import argparse
+import base64
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from supabase import Client, create_client
+
+from src.config import get_settings
+
+STORAGE_BUCKET = "trips"
+IMAGE_COLUMNS = ("transfer_image_url", "arrival_image_url")
+
+# Signed URL이 하나라도 있는 행만 조회하는 PostgREST 필터
+SIGNED_URL_FILTER = ",".join(f"{column}.like.*/sign/*" for column in IMAGE_COLUMNS)
+
+
+def extract_file_path(signed_url: str) -> Optional[str]:
+    """
+    Signed URL에서 버킷 내 파일 경로 추출
+
+    예시:
+        입력: https://xxx.supabase.co/storage/v1/object/sign/trips/user_id/file.jpg?token=...
+        출력: user_id/file.jpg
+    """
+    marker = f"/object/sign/{STORAGE_BUCKET}/"
+    path = urlparse(signed_url).path
+    if marker not in path:
+        return None
+    return path.split(marker, 1)[1] or None
+
+
+def get_token_expiry(signed_url: str) -> Optional[int]:
+    """
+    Signed URL의 token(JWT)에서 만료 시각(exp, epoch 초) 추출
+    서명 검증 없이 payload만 디코딩하며 실패 시 None 반환
+    """
+    token = parse_qs(urlparse(signed_url).query).get("token", [None])[0]
+    if not token or token.count(".") != 2:
+        return None
+
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    try:
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return int(exp) if exp is not None else None
+
+
+def is_expiring(signed_url: Optional[str], refresh_before: float) -> bool:
+    """
+    갱신 대상 여부 확인
+    Signed URL이고 만료 시각이 refresh_before 이전이면 True (만료 시각을 알 수 없어도 True)
+    """
+    if not signed_url or "/sign/" not in signed_url:
+        return False
+    exp = get_token_expiry(signed_url)
+    return exp is None or exp <= refresh_before
+
+
+def iter_signed_url_pages(supabase: Client, page_size: int):
+    """
+    Signed URL이 있는 여정을 id 기준 keyset 페이지로 조회
+    offset을 사용하지 않으므로 테이블 크기와 무관하게 페이지당 비용이 일정함
+    """
+    last_id = None
+    while True:
+        query = (
+            supabase.table("trips")
+            .select("id, transfer_image_url, arrival_image_url")
+            .or_(SIGNED_URL_FILTER)
+        )
+        if last_id is not None:
+            query = query.gt("id", last_id)
+
+        rows = query.order("id").limit(page_size).execute().data
+        if not rows:
+            return
+
+        yield rows
+
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]["id"]
+
+
+def refresh_page(
+    supabase: Client,
+    rows: list[dict],
+    refresh_before: float,
+    expires_in: int,
+    dry_run: bool,
+) -> tuple[int, int, int]:
+    """
+    한 페이지의 만료 임박 URL 갱신
+
+    Returns:
+        (갱신된 여정 수, 갱신된 URL 수, 서명 실패 수)
+    """
+    # 갱신 대상 (여정 ID, 컬럼, 파일 경로) 수집
+    targets: list[tuple[str, str, str]] = []
+    for row in rows:
+        for column in IMAGE_COLUMNS:
+            url = row.get(column)
+            if not is_expiring(url, refresh_before):
+                continue
+            file_path = extract_file_path(url)
+            if file_path:
+                targets.append((row["id"], column, file_path))
+
+    if not targets or dry_run:
+        return len({trip_id for trip_id, _, _ in targets}), len(targets), 0
+
+    # 페이지 단위 일괄 서명 (동일 경로는 한 번만 요청)
+    storage = supabase.storage.from_(STORAGE_BUCKET)
+    unique_paths = list(dict.fromkeys(file_path for _, _, file_path in targets))
+    signed = storage.create_signed_urls(unique_paths, expires_in)
+    signed_by_path = {
+        item["path"]: item["signedURL"] for item in signed if not item.get("error") and item.get("signedURL")
+    }
+
+    updates: dict[str, dict] = {}
+    failed_count = 0
+    for trip_id, column, file_path in targets:
+        new_url = signed_by_path.get(file_path)
+        if new_url is None:
+            failed_count += 1
+            continue
+        updates.setdefault(trip_id, {"id": trip_id})[column] = new_url
+
+    if not updates:
+        return 0, 0, failed_count
+
+    # 단일 UPDATE 문으로 일괄 반영
+    supabase.rpc("bulk_update_trip_image_urls", {"p_updates": list(updates.values())}).execute()
+
+    url_count = sum(len(update) - 1 for update in updates.values())
+    return len(updates), url_count, failed_count
+
+
+def refresh_signed_urls(
+    page_size: int,
+    concurrency: int,
+    threshold_hours: float,
+    expires_in: int,
+    dry_run: bool,
+) -> None:
+    """
+    만료 임박 Signed URL 갱신 실행
+    페이지 조회는 순차적으로, 서명/업데이트는 최대 concurrency 페이지까지 병렬 처리
+    """
+    settings = get_settings()
+
+    # Storage API는 URL 끝에 슬래시가 필요함
+    supabase_url = settings.supabase_url.rstrip("/") + "/"
+    supabase = create_client(supabase_url, settings.supabase_key)
+
+    refresh_before = time.time() + threshold_hours * 3600
+
+    if dry_run:
+        print("🧪 DRY-RUN 모드: 실제 데이터베이스 변경 없이 갱신 대상만 집계합니다.\n")
+
+    totals = {"pages": 0, "trips": 0, "urls": 0, "failed": 0, "errors": 0}
+    totals_lock = threading.Lock()
+    in_flight = threading.BoundedSemaphore(concurrency)
+    started_at = time.perf_counter()
+
+    def process(page_number: int, rows: list[dict]) -> None:
+        try:
+            trip_count, url_count, failed_count = refresh_page(
+                supabase, rows, refresh_before, expires_in, dry_run
+            )
+            with totals_lock:
+                totals["trips"] += trip_count
+                totals["urls"] += url_count
+                totals["failed"] += failed_count
+            print(f"  ✅ 페이지 {page_number}: {len(rows)}건 조회, {url_count}개 URL 갱신")
+        except Exception as e:
+            with totals_lock:
+                totals["errors"] += 1
+            print(f"  ❌ 페이지 {page_number} 처리 실패: {e}")
+        finally:
+            in_flight.release()
+
+    print("📋 Signed URL이 있는 여정을 페이지 단위로 조회 중...")
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for page_number, rows in enumerate(iter_signed_url_pages(supabase, page_size), start=1):
+            # 처리 중인 페이지가 concurrency개를 넘지 않도록 조회 속도 제한
+            in_flight.acquire()
+            totals["pages"] = page_number
+            executor.submit(process, page_number, rows)
+
+    elapsed = time.perf_counter() - started_at
+
+    print("\n" + "=" * 60)
+    print("🧪 DRY-RUN 완료 (실제 변경 없음)" if dry_run else "🎉 갱신 완료!")
+    print("=" * 60)
+    print(f"조회 페이지: {totals['pages']}개")
+    print(f"갱신 {'대상' if dry_run else '완료'} 여정: {totals['trips']}개 ({totals['urls']}개 URL)")
+    print(f"서명 실패: {totals['failed']}개")
+    print(f"페이지 오류: {totals['errors']}개")
+    print(f"소요 시간: {elapsed:.2f}초")
+    print("=" * 60)
+    if not dry_run:
+        print(f"⏰ 새 URL은 {expires_in // 3600}시간 동안 유효합니다")
+
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="만료 임박 Signed URL을 페이지 단위로 일괄 갱신")
+    parser.add_argument("--page-size", type=int, default=500, help="keyset 페이지 크기 (기본 500)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 처리할 페이지 수 (기본 4)")
+    parser.add_argument(
+        "--threshold-hours",
+        type=float,
+        default=6.0,
+        help="만료까지 남은 시간이 이 값 이하인 URL만 갱신 (기본 6시간)",
+    )
+    parser.add_argument(
+        "--expires-in",
+        type=int,
+        default=86400,
+        help="새 Signed URL 유효 시간 (초, 기본 86400 = 24시간)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="실제 변경 없이 갱신 대상만 집계")
+    args = parser.parse_args()
+
+    if args.page_size < 1 or args.concurrency < 1:
+        parser.error("--page-size와 --concurrency는 1 이상이어야 합니다")
+
+    refresh_signed_urls(
+        page_size=args.page_size,
+        concurrency=args.concurrency,
+        threshold_hours=args.threshold_hours,
+        expires_in=args.expires_in,
+        dry_run=args.dry_run,
+    )
@@ -10,6 +10,7 @@ from supabase import Client
 
 from src.application.services.admin_service import AdminService
 from src.application.services.auth_service import AuthService
+from src.config import get_settings
 from src.domain.repositories.trip_repository import ITripRepository
 from src.infrastructure.database.supabase import get_db
 from src.infrastructure.repositories.trip_repository_impl import SupbaseTripRepository
@@ -32,5 +33,12 @@ def get_admin_service(
     """
     AdminService 의존성 주입
     FastAPI 엔드포인트에서 AdminService를 사용할 수 있도록 제공
+    jobs_enabled 설정 시 포인트 지급을 백그라운드 작업 큐로 처리
     """
-    return AdminService(trip_repository=trip_repository, auth_service=auth_service)
+    job_queue = None
+    if get_settings().jobs_enabled:
+        from src.infrastructure.jobs.queue import get_job_queue
+
+        job_queue = get_job_queue()
+
+    return AdminService(trip_repository=trip_repository, auth_service=auth_service, job_queue=job_queue)
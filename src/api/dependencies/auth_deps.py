@@ -5,7 +5,8 @@ FastAPI 의존성 주입을 위한 인증/인가 관련 함수
 JWT 토큰 검증 및 현재 사용자 조회 기능 제공
 """
 
-from typing import Annotated
+import asyncio
+from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import Depends
@@ -67,5 +68,19 @@ async def get_current_user(
         raise UnauthorizedError(f"토큰 검증 실패: {str(e)}")
 
 
+async def verified_token_subject(token: str) -> Optional[str]:
+    """
+    Supabase Auth로 토큰을 검증하여 사용자 ID 반환 (검증 실패 시 None)
+    인증 의존성 밖(미들웨어)에서 토큰 소유자를 확인할 때 사용
+    """
+    try:
+        user_response = await asyncio.to_thread(get_db().auth.get_user, token)
+    except Exception:
+        return None
+    if not user_response or not user_response.user:
+        return None
+    return user_response.user.id
+
+
 # 타입 힌트용 Annotated 별칭
 CurrentUser = Annotated[User, Depends(get_current_user)]
@@ -0,0 +1,5 @@
+"""
+API Middleware
+
+요청 단위로 동작하는 ASGI 미들웨어 모음
+"""
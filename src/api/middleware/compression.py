@@ -0,0 +1,169 @@
+"""
+Response Compression Middleware
+
+Accept-Encoding 협상으로 응답 본문을 brotli(설치 시) 또는 gzip으로 압축
+- minimum_size 미만의 작은 응답, 이미 인코딩된 응답, 압축 효과가 없는 Content-Type은 그대로 전송
+- ETag가 있는 응답(역/주차장 카탈로그)은 (ETag, 인코딩) 단위로 압축 결과를 캐시하여
+  같은 카탈로그 버전에 대해서는 한 번만 압축
+
+brotli 패키지는 선택 의존성 (미설치 시 gzip만 사용)
+"""
+
+import gzip
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성
+    brotli = None
+
+# 압축 대상 Content-Type
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+# 본문이 없는 상태 코드
+BODYLESS_STATUS_CODES = (204, 304)
+
+
+def parse_accept_encoding(value: str) -> dict[str, float]:
+    """
+    Accept-Encoding 헤더를 {인코딩: q값} 으로 파싱
+    예: "gzip;q=0.8, br" → {"gzip": 0.8, "br": 1.0}
+    """
+    codings: dict[str, float] = {}
+    for item in value.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    사용할 압축 인코딩 선택 (br > gzip)
+    클라이언트가 지원하지 않거나 q=0이면 None
+    """
+    codings = parse_accept_encoding(accept_encoding)
+    wildcard = codings.get("*", 0.0)
+    if brotli is not None and codings.get("br", wildcard) > 0:
+        return "br"
+    if codings.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def is_compressible(content_type: str) -> bool:
+    """압축 효과가 있는 Content-Type인지 확인"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type.endswith("+json") or media_type in COMPRESSIBLE_MEDIA_TYPES
+
+
+class CompressionMiddleware:
+    """
+    gzip/brotli 응답 압축 미들웨어
+
+    스트리밍 응답(more_body)은 압축하지 않고 그대로 전달
+    카탈로그 ETag 미들웨어보다 바깥쪽에 등록해야 ETag 기반 압축 캐시가 동작함
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        cache_max_entries: int = 256,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_max_entries = cache_max_entries
+        self._compressed_cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """본문 압축 (gzip은 mtime=0으로 고정하여 같은 입력에 같은 출력)"""
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def _compress_cached(self, body: bytes, encoding: str, etag: Optional[str]) -> bytes:
+        """ETag가 있으면 (ETag, 인코딩) 단위로 압축 결과 재사용"""
+        if etag is None:
+            return self.compress(body, encoding)
+
+        key = (etag, encoding)
+        compressed = self._compressed_cache.get(key)
+        if compressed is not None:
+            self._compressed_cache.move_to_end(key)
+            return compressed
+
+        compressed = self.compress(body, encoding)
+        self._compressed_cache[key] = compressed
+        while len(self._compressed_cache) > self.cache_max_entries:
+            self._compressed_cache.popitem(last=False)
+        return compressed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            body = message.get("body", b"")
+            compressible = (
+                start_message["status"] not in BODYLESS_STATUS_CODES
+                and "content-encoding" not in headers
+                and is_compressible(headers.get("content-type", ""))
+            )
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+
+            if message.get("more_body", False):
+                # 스트리밍 응답은 압축하지 않음
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if compressible and encoding is not None and len(body) >= self.minimum_size:
+                body = self._compress_cached(body, encoding, headers.get("etag"))
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                message = {**message, "body": body}
+
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,144 @@
+"""
+Catalog Conditional Cache Middleware
+
+인증이 필요 없고 변경이 드문 역/주차장 조회 API에 HTTP 조건부 캐싱 적용
+- ETag: 카탈로그 버전 + 요청 경로/쿼리로 계산한 약한(weak) ETag
+- Last-Modified: stations/parking_lots의 max(updated_at)
+- Cache-Control: public, max-age, stale-while-revalidate (설정값)
+- If-None-Match / If-Modified-Since가 현재 버전과 일치하면 라우트를 실행하지 않고 304 응답
+
+카탈로그 버전은 프로세스 캐시(CatalogVersionCache)에서 가져오므로
+캐시 적중 시 304 응답에는 DB 조회가 전혀 발생하지 않음
+"""
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.domain.value_objects.catalog_version import CatalogVersion
+from src.infrastructure.cache.catalog_version_cache import CatalogVersionCache
+
+# 조건부 캐싱을 적용할 요청 메서드
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+def build_etag(version: CatalogVersion, path: str, query_string: bytes) -> str:
+    """
+    카탈로그 버전과 요청 URL로 약한 ETag 생성
+    같은 버전이라도 경로/쿼리(필터, 페이지)가 다르면 다른 ETag
+    """
+    source = f"{version.tag}|{path}?{query_string.decode('latin-1')}"
+    return f'W/"{hashlib.sha1(source.encode("utf-8")).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 비교 (약한 비교, '*' 허용)"""
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    """If-Modified-Since 이후 변경이 없는지 확인 (HTTP 날짜는 초 단위이므로 초 미만 절삭)"""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+class CatalogCacheMiddleware:
+    """
+    역/주차장 조회 API 조건부 캐싱 미들웨어
+
+    사용 예:
+    ```python
+    app.add_middleware(
+        CatalogCacheMiddleware,
+        path_prefixes=("/api/v1/stations", "/api/v1/parking-lots"),
+        version_cache=get_catalog_version_cache(),
+        cache_control="public, max-age=60, stale-while-revalidate=300",
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: Iterable[str],
+        version_cache: CatalogVersionCache,
+        cache_control: str,
+    ):
+        self.app = app
+        self.path_prefixes = tuple(prefix.rstrip("/") for prefix in path_prefixes)
+        self.version_cache = version_cache
+        self.cache_control = cache_control
+
+    def _is_catalog_request(self, scope: Scope) -> bool:
+        """조건부 캐싱 대상 요청인지 확인"""
+        if scope["type"] != "http" or scope["method"] not in CACHEABLE_METHODS:
+            return False
+        path = scope["path"]
+        return any(path == prefix or path.startswith(prefix + "/") for prefix in self.path_prefixes)
+
+    def _cache_headers(self, etag: str, last_modified: Optional[datetime]) -> dict[str, str]:
+        """200/304 응답에 공통으로 붙일 캐시 헤더"""
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+        return headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._is_catalog_request(scope):
+            await self.app(scope, receive, send)
+            return
+
+        version = await self.version_cache.get()
+        if version is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = build_etag(version, scope["path"], scope["query_string"])
+        cache_headers = self._cache_headers(etag, version.last_modified)
+
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if_modified_since = request_headers.get("if-modified-since")
+
+        # If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110 13.1.3)
+        if if_none_match is not None:
+            is_not_modified = etag_matches(if_none_match, etag)
+        elif if_modified_since is not None and version.last_modified is not None:
+            is_not_modified = not_modified_since(if_modified_since, version.last_modified)
+        else:
+            is_not_modified = False
+
+        if is_not_modified:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in cache_headers.items()],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                for name, value in cache_headers.items():
+                    if name not in headers:
+                        headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,181 @@
+"""
+Idempotency-Key Middleware
+
+네트워크가 불안정한 모바일 클라이언트의 여행 시작/환승/도착 재시도를 안전하게 처리
+- 클라이언트가 Idempotency-Key 헤더를 보내면 첫 요청의 최종 응답을 저장
+- 같은 키(같은 사용자 + 같은 경로)로 재시도하면 라우트를 실행하지 않고 저장된 응답 반환
+  (응답 헤더 Idempotent-Replayed: true)
+- 같은 키로 다른 요청 본문을 보내면 422, 첫 요청이 아직 처리 중이면 409
+
+사용자는 토큰 문자열이 아닌 토큰의 sub(사용자 ID)로 구분하여, 토큰 갱신 후 재시도해도 저장된 응답을 찾음
+sub는 서명 검증 없이 읽으므로 저장된 응답을 돌려주기 전에 토큰을 검증하여 sub 소유자인지 확인
+(첫 요청은 라우트의 인증 의존성이 검증하며, 401 응답은 저장하지 않음)
+
+헤더가 없거나 sub를 읽을 수 없는 요청은 기존과 동일하게 처리
+"""
+
+import hashlib
+import re
+from typing import Awaitable, Callable, Iterable, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.cache.idempotency_store import InMemoryIdempotencyStore, StoredResponse
+from src.shared.schemas.response import ErrorResponse
+from src.shared.utils.token import unverified_token_subject
+
+# 멱등성 키 헤더
+IDEMPOTENCY_KEY_HEADER = "idempotency-key"
+
+# 멱등성 키 최대 길이
+MAX_KEY_LENGTH = 255
+
+# 저장하지 않는 응답 상태 코드 (재시도 시 다시 처리되어야 하는 응답)
+# 401: 토큰 갱신 후 재시도, 408/429: 일시적 거절, 5xx: 서버 오류
+UNSTORED_STATUS_CODES = (401, 408, 429)
+
+
+def _error(status_code: int, message: str) -> Response:
+    """표준 에러 응답 생성"""
+    return JSONResponse(status_code=status_code, content=ErrorResponse.create(message=message).model_dump())
+
+
+def build_store_key(user_id: str, path: str, idempotency_key: str) -> str:
+    """
+    저장소 키 생성
+    사용자 ID와 경로를 함께 묶어 다른 사용자/다른 엔드포인트의 같은 키와 섞이지 않도록 함
+    """
+    source = f"{user_id}|{path}|{idempotency_key}"
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class IdempotencyMiddleware:
+    """
+    Idempotency-Key 헤더 기반 POST 요청 재시도 처리 미들웨어
+
+    사용 예:
+    ```python
+    app.add_middleware(
+        IdempotencyMiddleware,
+        path_patterns=(r"/api/v1/trips/start", r"/api/v1/trips/[^/]+/(transfer|arrival)"),
+        store=get_idempotency_store(),
+        verify_token=verified_token_subject,
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_patterns: Iterable[str],
+        store: InMemoryIdempotencyStore,
+        verify_token: Callable[[str], Awaitable[Optional[str]]],
+    ):
+        """
+        Args:
+            verify_token: 토큰을 검증하여 사용자 ID를 반환하는 함수 (실패 시 None)
+        """
+        self.app = app
+        self.path_patterns = tuple(re.compile(pattern) for pattern in path_patterns)
+        self.store = store
+        self.verify_token = verify_token
+
+    def _is_target(self, scope: Scope) -> bool:
+        """멱등성 처리 대상 요청인지 확인"""
+        if scope["type"] != "http" or scope["method"] != "POST":
+            return False
+        return any(pattern.fullmatch(scope["path"]) for pattern in self.path_patterns)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._is_target(scope):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get(IDEMPOTENCY_KEY_HEADER)
+        authorization = headers.get("authorization", "")
+        user_id = unverified_token_subject(authorization)
+        if idempotency_key is None or user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await _error(400, f"Idempotency-Key는 1~{MAX_KEY_LENGTH}자여야 합니다")(scope, receive, send)
+            return
+
+        # 요청 본문을 모두 읽어 지문 계산 (라우트에는 읽은 본문을 다시 전달)
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                return
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        fingerprint = hashlib.sha256(body).hexdigest()
+        store_key = build_store_key(user_id, scope["path"], idempotency_key)
+
+        stored = await self.store.get(store_key)
+        if stored is not None:
+            # 위조한 sub로 다른 사용자의 저장된 응답을 받지 못하도록 토큰 소유자 확인
+            if await self.verify_token(authorization.partition(" ")[2]) != user_id:
+                await _error(401, "유효하지 않은 토큰입니다")(scope, receive, send)
+                return
+            if stored.fingerprint != fingerprint:
+                await _error(422, "같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다")(scope, receive, send)
+                return
+            replay = Response(
+                content=stored.body,
+                status_code=stored.status_code,
+                media_type=stored.content_type,
+                headers={"Idempotent-Replayed": "true"},
+            )
+            await replay(scope, receive, send)
+            return
+
+        if not self.store.begin(store_key):
+            await _error(409, "같은 Idempotency-Key의 요청이 처리 중입니다")(scope, receive, send)
+            return
+
+        body_sent = False
+
+        async def receive_buffered() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status_code = 500
+        content_type = ""
+        chunks: list[bytes] = []
+        streaming = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, content_type, streaming
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                streaming = streaming or message.get("more_body", False)
+            await send(message)
+
+        try:
+            await self.app(scope, receive_buffered, send_wrapper)
+        finally:
+            self.store.finish(store_key)
+
+        if status_code < 500 and status_code not in UNSTORED_STATUS_CODES and not streaming:
+            await self.store.save(
+                store_key,
+                StoredResponse(
+                    fingerprint=fingerprint,
+                    status_code=status_code,
+                    content_type=content_type,
+                    body=b"".join(chunks),
+                ),
+            )
@@ -0,0 +1,89 @@
+"""
+Metrics Middleware
+
+요청마다 라우트별 처리 시간과 DB 왕복 횟수를 기록하는 ASGI 미들웨어
+BaseHTTPMiddleware 대신 순수 ASGI로 구현하여 응답 스트리밍에 영향을 주지 않음
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.observability.metrics import (
+    BACKEND_AUTH,
+    BACKEND_POSTGREST,
+    BACKEND_SQLALCHEMY,
+    BACKEND_STORAGE,
+    end_request_stats,
+    http_request_db_round_trips,
+    http_request_duration_seconds,
+    http_requests_total,
+    start_request_stats,
+)
+
+# 라우트가 매칭되지 않은 요청의 라벨 (경로를 그대로 쓰면 라벨 수가 무한히 늘어남)
+UNMATCHED_ROUTE = "unmatched"
+
+# 요청마다 0회여도 기록하는 백엔드 (요청당 왕복 분포를 정확히 보기 위함)
+TRACKED_BACKENDS = (BACKEND_SQLALCHEMY, BACKEND_POSTGREST, BACKEND_STORAGE, BACKEND_AUTH)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    요청 경로를 경로 템플릿으로 변환 (예: /api/v1/trips/3f2a... → /api/v1/trips/{trip_id})
+
+    라우터 prefix 처리 방식은 FastAPI 버전마다 다르므로
+    매칭된 path_params 값을 실제 경로에서 파라미터 이름으로 치환하여 구성
+    """
+    if scope.get("route") is None:
+        return UNMATCHED_ROUTE
+
+    names_by_value = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    if not names_by_value:
+        return scope["path"]
+
+    segments = scope["path"].split("/")
+    return "/".join(
+        f"{{{names_by_value[segment]}}}" if segment in names_by_value else segment for segment in segments
+    )
+
+
+class MetricsMiddleware:
+    """
+    라우트별 지연 시간 / 요청당 DB 왕복 횟수 수집 미들웨어
+
+    라우트 라벨은 실제 경로가 아닌 경로 템플릿 사용 (예: /api/v1/trips/{trip_id})
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple[str, ...] = ()):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started_at = time.perf_counter()
+        stats, token = start_request_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request_stats(token)
+            duration = time.perf_counter() - started_at
+
+            route_label = route_template(scope)
+            method = scope["method"]
+
+            http_requests_total.inc(method, route_label, str(status_code))
+            http_request_duration_seconds.observe(duration, method, route_label)
+            for backend in TRACKED_BACKENDS:
+                http_request_db_round_trips.observe(stats.round_trips.get(backend, 0), method, route_label, backend)
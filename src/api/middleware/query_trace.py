@@ -0,0 +1,68 @@
+"""
+Query Trace Middleware
+
+요청 헤더(기본 X-Query-Trace: 1)가 있는 요청에 한해 쿼리 타임라인을 수집
+- 응답 헤더: Server-Timing (쿼리 수, 쿼리 소요 시간 합계)
+- 로그: 요청 시작 기준 오프셋, 소요 시간, SQL/PostgREST 경로, 파라미터 형태, 호출 레포지토리 메서드
+"""
+
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.observability.query_log import end_trace, start_trace
+
+logger = logging.getLogger(__name__)
+
+# 트레이스를 활성화하는 헤더 값
+TRUTHY_VALUES = ("1", "true", "yes", "on")
+
+
+class QueryTraceMiddleware:
+    """
+    헤더로 요청 단위 쿼리 트레이스를 켜는 미들웨어
+    헤더가 없는 요청은 그대로 통과 (오버헤드 없음)
+    """
+
+    def __init__(self, app: ASGIApp, header_name: str = "X-Query-Trace"):
+        self.app = app
+        self.header_name = header_name.lower().encode("latin-1")
+
+    def _is_requested(self, scope: Scope) -> bool:
+        """트레이스 요청 헤더 확인"""
+        for name, value in scope["headers"]:
+            if name == self.header_name:
+                return value.decode("latin-1").strip().lower() in TRUTHY_VALUES
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        trace, token = start_trace()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={trace.total_duration * 1000:.1f};desc="{len(trace.events)} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_trace(token)
+            elapsed_ms = (time.perf_counter() - trace.started_at) * 1000
+            logger.info(
+                f"쿼리 트레이스 {scope['method']} {scope['path']} → {status_code} "
+                f"({elapsed_ms:.1f}ms, 쿼리 {len(trace.events)}건, {trace.total_duration * 1000:.1f}ms)\n"
+                f"{trace.format_timeline()}"
+            )
@@ -0,0 +1,131 @@
+"""
+Rate Limit Middleware
+
+로그인, 이미지 업로드, 관리자 주소 검색(네이버 Geocoding 쿼터 사용) 등
+비용이 큰 엔드포인트에 라우트별 요청 한도 적용
+- 한도 초과 요청은 라우트/인증 의존성 실행 전에 429 + Retry-After로 거절
+  (DB, Supabase Auth, 외부 API 호출이 발생하지 않음)
+- 키: 정책별로 클라이언트 IP, 또는 사용자 ID (+ IP 보호 버킷)
+
+사용자 ID는 Bearer 토큰의 sub 클레임에서 서명 검증 없이 읽음 (버킷 선택 용도)
+sub는 위조할 수 있으므로 사용자 기준 정책은 사용자 버킷과 함께 더 큰 한도(ip_limit)의 IP 버킷을 적용하여
+토큰마다 새 버킷을 얻는 우회를 막되, 같은 IP(NAT, 통신사 게이트웨이)를 공유하는 사용자끼리 한도를 나눠 쓰지 않게 함
+sub가 없는 요청은 IP 버킷에 사용자당 한도(limit)를 적용
+토큰 검증은 기존대로 인증 의존성에서 수행됨
+
+클라이언트 IP는 기본적으로 소켓 주소를 사용하고, 리버스 프록시 뒤에서는 X-Forwarded-For의
+오른쪽에서 trusted_proxy_hops번째 주소(신뢰하는 프록시가 덧붙인 주소)를 사용
+왼쪽 주소들은 클라이언트가 임의로 보낼 수 있으므로 사용하지 않음
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Literal, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.rate_limiter import RateLimiter
+from src.shared.schemas.response import ErrorResponse
+from src.shared.utils.token import unverified_token_subject
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """라우트별 요청 한도 정책"""
+
+    name: str
+    path_pattern: str
+    limit: int
+    window_seconds: float = 60.0
+    key_by: Literal["ip", "user"] = "ip"
+    methods: tuple[str, ...] = ("POST",)
+    # 사용자 기준 정책의 IP 보호 버킷 한도 (None이면 limit)
+    ip_limit: Optional[int] = None
+
+    def matches(self, method: str, path: str) -> bool:
+        """정책 적용 대상 요청인지 확인"""
+        return method in self.methods and re.fullmatch(self.path_pattern, path) is not None
+
+
+class RateLimitMiddleware:
+    """
+    라우트별 요청 한도 미들웨어
+
+    사용 예:
+    ```python
+    app.add_middleware(
+        RateLimitMiddleware,
+        policies=(RateLimitPolicy(name="login", path_pattern="/api/v1/auth/login", limit=10),),
+        limiter=get_rate_limiter(),
+        trusted_proxy_hops=1,
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: Iterable[RateLimitPolicy],
+        limiter: RateLimiter,
+        trusted_proxy_hops: int = 0,
+    ):
+        self.app = app
+        self.policies = tuple(policies)
+        self.limiter = limiter
+        self.trusted_proxy_hops = trusted_proxy_hops
+
+    def _client_ip(self, scope: Scope, headers: Headers) -> str:
+        """
+        클라이언트 IP
+        프록시 뒤에서는 X-Forwarded-For의 오른쪽에서 trusted_proxy_hops번째 주소
+        (주소 수가 부족하면 프록시를 거치지 않은 요청으로 보고 소켓 주소 사용)
+        """
+        if self.trusted_proxy_hops:
+            forwarded_for = [entry.strip() for entry in headers.get("x-forwarded-for", "").split(",")]
+            forwarded_for = [entry for entry in forwarded_for if entry]
+            if len(forwarded_for) >= self.trusted_proxy_hops:
+                return forwarded_for[-self.trusted_proxy_hops]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _limit_keys(self, policy: RateLimitPolicy, scope: Scope, headers: Headers) -> list[tuple[str, int]]:
+        """
+        정책과 요청으로 (버킷 키, 한도) 목록 생성
+        사용자 기준 정책은 IP 보호 버킷(ip_limit) + 사용자 버킷(limit), sub가 없으면 IP 버킷(limit)만 적용
+        """
+        ip_key = f"{policy.name}:ip:{self._client_ip(scope, headers)}"
+        if policy.key_by == "user":
+            subject = unverified_token_subject(headers.get("authorization", ""))
+            if subject is not None:
+                return [(ip_key, policy.ip_limit or policy.limit), (f"{policy.name}:user:{subject}", policy.limit)]
+        return [(ip_key, policy.limit)]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = next((p for p in self.policies if p.matches(scope["method"], scope["path"])), None)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        # IP 버킷에서 거절되면 사용자 버킷은 소모하지 않음
+        for key, limit in self._limit_keys(policy, scope, Headers(scope=scope)):
+            decision = await self.limiter.acquire(key, limit, policy.window_seconds)
+            if not decision.allowed:
+                break
+        if decision.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            status_code=429,
+            content=ErrorResponse.create(
+                message=f"요청이 너무 많습니다. {decision.retry_after_seconds}초 후 다시 시도해 주세요"
+            ).model_dump(),
+            headers={"Retry-After": str(decision.retry_after_seconds)},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,43 @@
+"""
+Read-Your-Writes Middleware
+
+읽기 복제본 사용 시 사용자가 방금 쓴 데이터를 복제 지연 때문에 못 보는 문제 방지
+- 쓰기 요청(POST/PUT/PATCH/DELETE)은 요청 전체를 주 DB로 고정하고 요청 사용자를 기록
+- 기록된 사용자의 이후 요청은 read_your_writes_seconds 동안 주 DB로 고정
+
+사용자 구분은 Bearer 토큰의 sub 클레임(서명 검증 없음)을 사용하며, 기록은 프로세스 단위
+"""
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.database.routing import RecentWriters, pin_primary
+from src.shared.utils.token import unverified_token_subject
+
+# 데이터를 변경하지 않는 요청 메서드
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReadYourWritesMiddleware:
+    """쓰기 요청과 최근 쓰기 사용자의 요청을 주 DB로 고정하는 미들웨어"""
+
+    def __init__(self, app: ASGIApp, recent_writers: RecentWriters):
+        self.app = app
+        self.recent_writers = recent_writers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        user_key = unverified_token_subject(Headers(scope=scope).get("authorization", ""))
+        is_write = scope["method"] not in SAFE_METHODS
+
+        if is_write or self.recent_writers.wrote_recently(user_key):
+            pin_primary()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if is_write and user_key is not None:
+                self.recent_writers.mark(user_key)
@@ -0,0 +1,69 @@
+"""
+Prebuilt OpenAPI Schema
+
+FastAPI는 첫 /openapi.json(/docs) 요청 시 전체 라우트를 순회하며 스키마를 생성하므로
+콜드 스타트 직후 첫 문서 요청이 수백 ms 지연됨
+미리 생성해 둔 스키마 파일(src/api/openapi.json)을 앱 생성 시 로드하여 이 비용을 제거
+
+스키마 갱신: python scripts/generate_openapi.py
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+# 미리 생성된 OpenAPI 스키마 파일 경로
+PREBUILT_OPENAPI_PATH = Path(__file__).with_name("openapi.json")
+
+
+def generate_openapi_schema(app: FastAPI) -> dict[str, Any]:
+    """라우트로부터 OpenAPI 스키마를 새로 생성 (미리 로드된 스키마 무시)"""
+    app.openapi_schema = None
+    return app.openapi()
+
+
+def load_prebuilt_openapi(path: Path = PREBUILT_OPENAPI_PATH) -> Optional[dict[str, Any]]:
+    """미리 생성된 OpenAPI 스키마 파일 로드 (없거나 손상되었으면 None)"""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"미리 생성된 OpenAPI 스키마 로드 실패: {str(e)}")
+        return None
+
+
+def install_prebuilt_openapi(app: FastAPI, api_prefix: str, path: Path = PREBUILT_OPENAPI_PATH) -> bool:
+    """
+    미리 생성된 스키마를 앱에 설치
+
+    앱 버전이나 API 경로 접두사가 스키마 생성 시점과 다르면 설치하지 않고
+    기존처럼 첫 요청 시 생성하도록 둠
+
+    Returns:
+        설치 여부
+    """
+    schema = load_prebuilt_openapi(path)
+    if schema is None:
+        return False
+
+    if schema.get("info", {}).get("version") != app.version:
+        logger.warning("미리 생성된 OpenAPI 스키마의 버전이 앱 버전과 달라 사용하지 않습니다")
+        return False
+
+    if not any(route_path.startswith(f"{api_prefix}/") for route_path in schema.get("paths", {})):
+        logger.warning("미리 생성된 OpenAPI 스키마의 API 경로 접두사가 달라 사용하지 않습니다")
+        return False
+
+    app.openapi_schema = schema
+
+    # 최근 FastAPI는 스키마 생성 시점의 라우트 버전도 비교하므로 현재 라우트 버전으로 맞춰 둠
+    get_routes_version = getattr(app.router, "_get_routes_version", None)
+    if get_routes_version is not None:
+        app._openapi_routes_version = get_routes_version()
+    return True
@@ -0,0 +1,110 @@
+"""
+Fast Response Serialization
+
+SuccessResponse 봉투(envelope)를 빠르게 직렬화하는 응답 클래스와 라우트 클래스
+- FastJSONResponse: Pydantic 모델은 pydantic-core(Rust) 직렬화기로 바로 JSON bytes 생성,
+  그 외 값은 orjson(설치 시) 또는 표준 json으로 인코딩
+- FastSerializationRoute: 엔드포인트가 이미 응답 스키마 타입으로 만든 데이터를 반환하면
+  FastAPI의 response_model 재검증을 건너뛰고 FastJSONResponse로 바로 응답
+
+fast_serialization_enabled 설정이 꺼져 있으면 기존 FastAPI 동작과 동일함
+"""
+
+import functools
+import inspect
+import json
+import types
+from typing import Any, Optional, Union, get_args, get_origin
+
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from src.config import get_settings
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
+
+
+class FastJSONResponse(Response):
+    """
+    Pydantic 모델을 중간 dict 없이 JSON bytes로 직렬화하는 응답
+    필드 직렬화기(field_serializer)도 그대로 적용됨
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _envelope_types(response_model: Any) -> Optional[tuple[type, Optional[type]]]:
+    """
+    response_model(예: SuccessResponse[StationListResponse])에서
+    (봉투 클래스, data 필드의 모델 클래스) 추출
+
+    data 타입이 Pydantic 모델이 아니면 data 클래스는 None
+    response_model이 Pydantic 모델이 아니면 None 반환 (빠른 경로 미적용)
+    """
+    if not (inspect.isclass(response_model) and issubclass(response_model, BaseModel)):
+        return None
+
+    envelope = response_model.__pydantic_generic_metadata__.get("origin") or response_model
+    data_field = response_model.model_fields.get("data")
+    if data_field is None:
+        return envelope, None
+
+    annotation = data_field.annotation
+    if get_origin(annotation) in (Union, types.UnionType):
+        candidates = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = candidates[0] if len(candidates) == 1 else None
+
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return envelope, annotation
+    return envelope, None
+
+
+class FastSerializationRoute(APIRoute):
+    """
+    응답 재검증을 건너뛰는 라우트 클래스 (fast_serialization_enabled 설정 시)
+
+    엔드포인트 반환값이 response_model의 봉투 타입이고 data가 선언된 스키마 타입의 인스턴스일 때만
+    빠른 경로를 사용하며, 그 외(dict 반환 등)는 기존 FastAPI 검증/직렬화 경로를 그대로 사용
+
+    사용 예:
+    ```python
+    router = APIRouter(prefix="/stations", tags=["Stations"], route_class=FastSerializationRoute)
+    ```
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if get_settings().fast_serialization_enabled and inspect.iscoroutinefunction(endpoint):
+            envelope_types = _envelope_types(kwargs.get("response_model"))
+            if envelope_types is not None:
+                endpoint = self._wrap_endpoint(endpoint, envelope_types, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def _wrap_endpoint(endpoint, envelope_types: tuple[type, Optional[type]], status_code: Optional[int]):
+        """반환값이 이미 타입이 맞는 봉투이면 FastJSONResponse로 감싸는 래퍼 생성"""
+        envelope, data_type = envelope_types
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            if not isinstance(result, envelope):
+                return result
+
+            data = getattr(result, "data", None)
+            if data is not None and (data_type is None or not isinstance(data, data_type)):
+                return result
+
+            return FastJSONResponse(result, status_code=status_code or 200)
+
+        return wrapper
@@ -2,38 +2,56 @@
 Admin API Routes
 
 관리자 전용 API 엔드포인트 정의
-여정 승인/반려, 역/주차장 CRUD 기능 제공
+여정 승인/반려, 역/주차장 CRUD 및 카탈로그 일괄 등록 기능 제공
 """
 
+import csv
+import io
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
 
 from src.api.dependencies.admin_deps import AdminUser
 from src.api.dependencies.admin_service_deps import get_admin_service
 from src.api.dependencies.station_deps import get_station_service
+from src.api.responses import FastSerializationRoute
 from src.api.schemas.admin_schemas import (
     AdminTripDetailResponse,
     AdminTripListResponse,
     AdminTripResponse,
+    AdminTripSummaryWithUserResponse,
     AdminTripWithUserResponse,
     DashboardStatsResponse,
     UserInfoResponse,
 )
 from src.api.schemas.station_schemas import (
+    CATALOG_IMPORT_MAX_ROWS,
     AddressSearchResponse,
+    CatalogImportRequest,
+    CatalogImportResponse,
     CreateParkingLotRequest,
     CreateStationRequest,
+    ParkingLotDistanceRecomputeResponse,
+    ParkingLotImportItem,
     ParkingLotResponse,
+    StationImportItem,
     StationResponse,
     UpdateParkingLotRequest,
     UpdateStationRequest,
 )
+from src.api.schemas.trip_schemas import TripListView
 from src.application.services.admin_service import AdminService
 from src.application.services.station_service import StationService
+from src.domain.repositories.trip_repository import CountMode
+from src.domain.value_objects.catalog_import import ParkingLotImportRow, StationImportRow
+from src.infrastructure.storage.signed_url_cache import prefetch_signed_image_urls
+from src.shared.exceptions import ValidationError
 from src.shared.schemas.response import SuccessResponse
 
-router = APIRouter(prefix="/admin", tags=["Admin"])
+router = APIRouter(prefix="/admin", tags=["Admin"], route_class=FastSerializationRoute)
 
 
 @router.get(
@@ -59,6 +77,22 @@ async def get_dashboard_stats(
     )
 
 
+def _admin_trip_list_items(
+    trips_with_users: list, view: TripListView
+) -> list[AdminTripWithUserResponse | AdminTripSummaryWithUserResponse]:
+    """(여정, 사용자 정보) 쌍을 목록 응답 형태(view)에 맞는 항목으로 변환"""
+    if view == "summary":
+        return [AdminTripSummaryWithUserResponse.from_trip(trip, user_info) for trip, user_info in trips_with_users]
+
+    # 목록 이미지의 Signed URL을 일괄 발급 (직렬화 시 행마다 발급 요청 방지)
+    prefetch_signed_image_urls(
+        image_url
+        for trip, _ in trips_with_users
+        for image_url in (trip.transfer_image_url, trip.arrival_image_url)
+    )
+    return [AdminTripWithUserResponse.from_trip(trip, user_info) for trip, user_info in trips_with_users]
+
+
 @router.get(
     "/trips",
     response_model=SuccessResponse[AdminTripListResponse],
@@ -96,11 +130,24 @@ async def get_all_trips(
         ge=0,
         description="건너뛸 여정 개수 (페이지네이션)",
     ),
+    include_total: bool = Query(
+        True,
+        description="전체 개수(total_count) 계산 여부 (false면 total_count는 null)",
+    ),
+    count: CountMode = Query(
+        "exact",
+        description="전체 개수 계산 방식 (exact: 정확, planned: 플래너 추정치, 필터 없는 큰 목록에 권장, estimated: 큰 결과만 추정치)",
+    ),
+    view: TripListView = Query(
+        "full",
+        description="목록 응답 형태 (full: 전체 필드, summary: 목록 카드용 요약 필드만)",
+    ),
 ):
     """
     전체 여정 목록 조회 엔드포인트
     상태, 사용자, 날짜 범위로 필터링 가능
     각 여정에 사용자 정보 포함
+    목록과 전체 개수는 한 번의 쿼리로 조회
     """
     # user_id 문자열을 UUID로 변환
     parsed_user_id = UUID(user_id) if user_id else None
@@ -112,10 +159,12 @@ async def get_all_trips(
         end_date=end_date,
         limit=limit,
         offset=offset,
+        include_total=include_total,
+        count=count,
+        summary=view == "summary",
     )
 
-    # dict를 AdminTripWithUserResponse로 변환
-    trip_responses = [AdminTripWithUserResponse(**trip) for trip in trips_with_users]
+    trip_responses = _admin_trip_list_items(trips_with_users, view)
     response_data = AdminTripListResponse(
         trips=trip_responses,
         total_count=total_count,
@@ -148,16 +197,34 @@ async def get_pending_trips(
         ge=0,
         description="건너뛸 여정 개수 (페이지네이션)",
     ),
+    include_total: bool = Query(
+        True,
+        description="전체 개수(total_count) 계산 여부 (false면 total_count는 null)",
+    ),
+    count: CountMode = Query(
+        "exact",
+        description="전체 개수 계산 방식 (exact: 정확, planned: 플래너 추정치, estimated: 큰 결과만 추정치)",
+    ),
+    view: TripListView = Query(
+        "full",
+        description="목록 응답 형태 (full: 전체 필드, summary: 목록 카드용 요약 필드만)",
+    ),
 ):
     """
     승인 대기 여정 목록 조회 엔드포인트
     COMPLETED 상태의 여정들을 최신순으로 반환
     각 여정에 사용자 정보 포함
+    목록과 전체 개수는 한 번의 쿼리로 조회
     """
-    trips_with_users, total_count = await admin_service.get_pending_trips(limit=limit, offset=offset)
+    trips_with_users, total_count = await admin_service.get_pending_trips(
+        limit=limit,
+        offset=offset,
+        include_total=include_total,
+        count=count,
+        summary=view == "summary",
+    )
 
-    # dict를 AdminTripWithUserResponse로 변환
-    trip_responses = [AdminTripWithUserResponse(**trip) for trip in trips_with_users]
+    trip_responses = _admin_trip_list_items(trips_with_users, view)
     response_data = AdminTripListResponse(
         trips=trip_responses,
         total_count=total_count,
@@ -282,7 +349,7 @@ async def create_station(
     response_model=SuccessResponse[StationResponse],
     status_code=status.HTTP_200_OK,
     summary="역 수정",
-    description="관리자 전용: 기존 역 정보를 수정합니다.",
+    description="관리자 전용: 기존 역 정보를 수정합니다. 좌표가 바뀌면 연결된 주차장의 역까지 거리도 함께 재계산됩니다.",
 )
 async def update_station(
     station_id: UUID,
@@ -343,7 +410,7 @@ async def create_parking_lot(
 
     어드민은 주소만 입력하면 백엔드에서 자동으로:
     1. 네이버 API로 주소 → 좌표 변환
-    2. PostGIS로 역-주차장 거리 계산
+    2. 역-주차장 거리 계산 (geography 측지선 거리)
     """
     parking_lot = await station_service.create_parking_lot(
         station_id=request.station_id,
@@ -357,6 +424,25 @@ async def create_parking_lot(
     )
 
 
+@router.post(
+    "/parking-lots/recompute-distances",
+    response_model=SuccessResponse[ParkingLotDistanceRecomputeResponse],
+    status_code=status.HTTP_200_OK,
+    summary="주차장 거리 일괄 재계산",
+    description="관리자 전용: 모든 주차장의 역까지 거리를 현재 좌표 기준으로 한 번의 UPDATE로 재계산합니다.",
+)
+async def recompute_parking_lot_distances(
+    admin_user: AdminUser,
+    station_service: StationService = Depends(get_station_service),
+):
+    """전체 주차장 거리 일괄 재계산 (값이 바뀐 주차장만 갱신)"""
+    updated_count = await station_service.recompute_parking_lot_distances()
+    return SuccessResponse.create(
+        message=f"{updated_count}개 주차장의 거리가 재계산되었습니다",
+        data=ParkingLotDistanceRecomputeResponse(updated_count=updated_count),
+    )
+
+
 @router.put(
     "/parking-lots/{parking_lot_id}",
     response_model=SuccessResponse[ParkingLotResponse],
@@ -404,6 +490,109 @@ async def delete_parking_lot(
     return SuccessResponse.create(message="주차장이 삭제되었습니다", data=None)
 
 
+# ============================================================================
+# 카탈로그 일괄 등록 API
+# ============================================================================
+
+
+async def _import_catalog(
+    station_service: StationService,
+    stations: list[StationImportItem],
+    parking_lots: list[ParkingLotImportItem],
+) -> SuccessResponse:
+    """요청 행을 도메인 행으로 변환하여 일괄 등록하고 행별 결과 응답 생성"""
+    results = await station_service.import_catalog(
+        stations=[StationImportRow(**item.model_dump()) for item in stations],
+        parking_lots=[ParkingLotImportRow(**item.model_dump()) for item in parking_lots],
+    )
+    response = CatalogImportResponse.from_results(results)
+    return SuccessResponse.create(
+        message=(
+            f"카탈로그 일괄 등록 완료 (생성 {response.created_count}건, "
+            f"수정 {response.updated_count}건, 실패 {response.failed_count}건)"
+        ),
+        data=response,
+    )
+
+
+async def _read_csv_items(file: Optional[UploadFile], model: type[BaseModel]) -> list:
+    """
+    CSV 파일(첫 행 = 필드명)을 요청 행 목록으로 변환
+    빈 칸은 값 없음으로 처리하며, 형식 오류가 있으면 오류 행 번호와 함께 422 반환
+    """
+    if file is None:
+        return []
+
+    try:
+        content = (await file.read()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValidationError(f"{file.filename}: UTF-8 CSV 파일만 지원합니다")
+
+    items, errors = [], []
+    # 헤더가 1행이므로 데이터는 2행부터
+    for line, record in enumerate(csv.DictReader(io.StringIO(content)), start=2):
+        try:
+            items.append(model.model_validate({key: value or None for key, value in record.items() if key}))
+        except PydanticValidationError as e:
+            errors.extend(
+                f"{line}행 {'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+            )
+
+    if errors:
+        raise ValidationError(f"{file.filename} 형식 오류: {'; '.join(errors[:10])}")
+    if len(items) > CATALOG_IMPORT_MAX_ROWS:
+        raise ValidationError(f"{file.filename}: 최대 {CATALOG_IMPORT_MAX_ROWS}행까지 등록할 수 있습니다")
+    return items
+
+
+@router.post(
+    "/catalog/import",
+    response_model=SuccessResponse[CatalogImportResponse],
+    status_code=status.HTTP_200_OK,
+    summary="역/주차장 일괄 등록",
+    description=(
+        "관리자 전용: 역과 주차장을 한 번에 등록하거나 수정합니다. "
+        "역은 (이름, 노선), 주차장은 (연계 역, 이름)이 같으면 수정됩니다. "
+        "좌표가 없는 행은 주소로 Geocoding하고 주차장-역 거리는 자동 계산하며, 전체를 단일 트랜잭션으로 반영합니다. "
+        "실패한 행은 건너뛰고 행별 결과에 사유를 반환합니다."
+    ),
+)
+async def import_catalog(
+    request: CatalogImportRequest,
+    admin_user: AdminUser,
+    station_service: StationService = Depends(get_station_service),
+):
+    """역/주차장 카탈로그 일괄 등록 (JSON)"""
+    return await _import_catalog(station_service, request.stations, request.parking_lots)
+
+
+@router.post(
+    "/catalog/import/csv",
+    response_model=SuccessResponse[CatalogImportResponse],
+    status_code=status.HTTP_200_OK,
+    summary="역/주차장 일괄 등록 (CSV)",
+    description=(
+        "관리자 전용: CSV 파일로 역과 주차장을 일괄 등록합니다. (multipart/form-data) "
+        "첫 행은 필드명이며 필드 구성과 처리 방식은 JSON 일괄 등록과 같습니다."
+    ),
+)
+async def import_catalog_csv(
+    admin_user: AdminUser,
+    stations_file: Optional[UploadFile] = File(
+        None, description="역 CSV (name, line_number, latitude, longitude, address)"
+    ),
+    parking_lots_file: Optional[UploadFile] = File(
+        None,
+        description="주차장 CSV (station_name, station_line_number, name, address, latitude, longitude, fee_info)",
+    ),
+    station_service: StationService = Depends(get_station_service),
+):
+    """역/주차장 카탈로그 일괄 등록 (CSV)"""
+    stations = await _read_csv_items(stations_file, StationImportItem)
+    parking_lots = await _read_csv_items(parking_lots_file, ParkingLotImportItem)
+    return await _import_catalog(station_service, stations, parking_lots)
+
+
 # ============================================================================
 # 주소 검색 API (네이버 Geocoding)
 # ============================================================================
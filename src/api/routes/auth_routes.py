@@ -8,6 +8,7 @@ Auth API Routes
 from fastapi import APIRouter, Depends, status
 
 from src.api.dependencies.auth_deps import CurrentUser, get_auth_service
+from src.api.responses import FastSerializationRoute
 from src.api.schemas.auth_schemas import (
     LoginRequest,
     LoginResponse,
@@ -19,7 +20,7 @@ from src.api.schemas.auth_schemas import (
 from src.application.services.auth_service import AuthService
 from src.shared.schemas.response import SuccessResponse
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=FastSerializationRoute)
 
 
 @router.post(
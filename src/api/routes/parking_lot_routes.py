@@ -10,6 +10,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 
 from src.api.dependencies.station_deps import get_station_service
+from src.api.responses import FastSerializationRoute
 from src.api.schemas.station_schemas import (
     ParkingLotListResponse,
     ParkingLotResponse,
@@ -17,7 +18,7 @@ from src.api.schemas.station_schemas import (
 from src.application.services.station_service import StationService
 from src.shared.schemas.response import SuccessResponse
 
-router = APIRouter(prefix="/parking-lots", tags=["ParkingLots"])
+router = APIRouter(prefix="/parking-lots", tags=["ParkingLots"], route_class=FastSerializationRoute)
 
 
 @router.get(
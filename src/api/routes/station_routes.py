@@ -10,6 +10,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 
 from src.api.dependencies.station_deps import get_station_service
+from src.api.responses import FastSerializationRoute
 from src.api.schemas.station_schemas import (
     ParkingLotListResponse,
     ParkingLotResponse,
@@ -20,7 +21,7 @@ from src.api.schemas.station_schemas import (
 from src.application.services.station_service import StationService
 from src.shared.schemas.response import SuccessResponse
 
-router = APIRouter(prefix="/stations", tags=["Stations"])
+router = APIRouter(prefix="/stations", tags=["Stations"], route_class=FastSerializationRoute)
 
 
 @router.get(
@@ -33,7 +34,7 @@ router = APIRouter(prefix="/stations", tags=["Stations"])
 async def get_all_stations(
     service: Annotated[StationService, Depends(get_station_service)],
     keyword: Annotated[
-        Optional[str], Query(min_length=1, max_length=50, description="역 이름 검색 키워드 (부분 일치)")
+        Optional[str], Query(min_length=1, max_length=50, description="역 이름 검색 키워드 (접두/부분 일치, 초성 검색, 오타 허용 - 관련도순)")
     ] = None,
     line: Annotated[
         Optional[int], Query(ge=1, le=4, description="Filter by line number (1=1호선, 2=2호선, 3=3호선, 4=대경선)", alias="line")
@@ -44,7 +45,7 @@ async def get_all_stations(
     """
     지하철 역 목록 조회 (키워드 검색, 노선 필터링, 페이지네이션)
 
-    - **keyword**: 역 이름 검색 (예: "구미", "반월당")
+    - **keyword**: 역 이름 검색 (예: "구미", "반월당", 초성 "ㅂㅇㄷ") - 관련도순 정렬
     - **line**: 노선 번호 (1, 2, 3, 4) - 미지정 시 전체 조회
     - **limit**: 반환할 결과 수 (최대 100)
     - **offset**: 건너뛸 결과 수
@@ -86,11 +87,8 @@ async def get_station_detail(
 
     - **station_id**: 역 고유 식별자 (UUID)
     """
-    # 역 기본 정보 조회
-    station = await service.get_station_by_id(station_id)
-
-    # 주차장 목록 조회
-    parking_lots = await service.get_station_parking_lots(station_id)
+    # 역 기본 정보와 주차장 목록을 한 번의 쿼리로 조회
+    station, parking_lots = await service.get_station_with_parking_lots(station_id)
 
     return SuccessResponse.create(
         message=f"{station.name} 상세 정보를 조회했습니다",
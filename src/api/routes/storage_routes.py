@@ -11,11 +11,12 @@ from fastapi import APIRouter, Depends, File, Form, UploadFile, status
 
 from src.api.dependencies.auth_deps import CurrentUser
 from src.api.dependencies.storage_deps import get_storage_service
+from src.api.responses import FastSerializationRoute
 from src.api.schemas.storage_schemas import ImageUploadResponse
 from src.application.services.storage_service import StorageService
 from src.shared.schemas.response import SuccessResponse
 
-router = APIRouter(prefix="/storage", tags=["Storage"])
+router = APIRouter(prefix="/storage", tags=["Storage"], route_class=FastSerializationRoute)
 
 
 @router.post(
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.api.dependencies.auth_deps import CurrentUser
 from src.api.dependencies.trip_deps import get_trip_service
+from src.api.responses import FastSerializationRoute
 from src.api.schemas.trip_schemas import (
     ArrivalTripRequest,
     ArrivalTripResponse,
@@ -19,13 +20,16 @@ from src.api.schemas.trip_schemas import (
     TransferTripRequest,
     TransferTripResponse,
     TripListResponse,
+    TripListView,
     TripResponse,
+    TripSummaryResponse,
 )
 from src.application.services.trip_service import TripService
 from src.domain.entities.trip import TripStatus
+from src.domain.repositories.trip_repository import CountMode
 from src.shared.schemas.response import SuccessResponse
 
-router = APIRouter(prefix="/trips", tags=["Trips"])
+router = APIRouter(prefix="/trips", tags=["Trips"], route_class=FastSerializationRoute)
 
 
 @router.post(
@@ -147,7 +151,7 @@ async def arrive_trip(
     response_model=SuccessResponse[TripListResponse],
     status_code=status.HTTP_200_OK,
     summary="여행 목록 조회",
-    description="현재 사용자의 여행 목록을 조회합니다. 상태별 필터링 및 페이지네이션을 지원합니다. (JWT 인증 필요)",
+    description="현재 사용자의 여행 목록을 조회합니다. 상태별 필터링 및 페이지네이션을 지원합니다. include_total=false로 전체 개수 계산을 생략할 수 있습니다. (JWT 인증 필요)",
 )
 async def get_trips(
     current_user: CurrentUser,
@@ -168,24 +172,36 @@ async def get_trips(
         ge=0,
         description="건너뛸 여행 개수 (페이지네이션)",
     ),
+    include_total: bool = Query(
+        True,
+        description="전체 개수(total_count) 계산 여부 (false면 total_count는 null)",
+    ),
+    count: CountMode = Query(
+        "exact",
+        description="전체 개수 계산 방식 (exact: 정확, planned: 플래너 추정치, estimated: 큰 결과만 추정치)",
+    ),
+    view: TripListView = Query(
+        "full",
+        description="목록 응답 형태 (full: 전체 필드, summary: 목록 카드용 요약 필드만)",
+    ),
 ):
     """
     여행 목록 조회 엔드포인트
     사용자의 여행 목록을 상태별 필터링 및 페이지네이션하여 반환
+    목록과 전체 개수는 한 번의 쿼리로 조회
     """
-    trips = await trip_service.get_trips(
+    trips, total_count = await trip_service.get_trip_page(
         user_id=current_user.id,
         status=status_filter,
         limit=limit,
         offset=offset,
+        include_total=include_total,
+        count=count,
+        summary=view == "summary",
     )
 
-    total_count = await trip_service.get_trip_count(
-        user_id=current_user.id,
-        status=status_filter,
-    )
-
-    trip_responses = [TripResponse.model_validate(trip) for trip in trips]
+    response_type = TripSummaryResponse if view == "summary" else TripResponse
+    trip_responses = [response_type.model_validate(trip) for trip in trips]
     response_data = TripListResponse(
         trips=trip_responses,
         total_count=total_count,
@@ -6,12 +6,13 @@ Admin API Schemas
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, field_serializer
 
 from src.domain.entities.trip import TripStatus
+from src.infrastructure.storage.signed_url_cache import sign_image_url
 from src.shared.schemas.base import BaseRequest, BaseResponse
 
 
@@ -20,7 +21,19 @@ from src.shared.schemas.base import BaseRequest, BaseResponse
 # ============================================================================
 
 
-class AdminTripResponse(BaseResponse):
+class SignedImageUrlResponse(BaseResponse):
+    """
+    여정 이미지 필드를 Signed URL로 직렬화하는 베이스 스키마
+    DB에는 객체 경로만 저장되며, 응답 직렬화 시 프로세스 캐시를 통해 URL 발급
+    """
+
+    @field_serializer("transfer_image_url", "arrival_image_url", check_fields=False)
+    def serialize_image_url(self, value: Optional[str]) -> Optional[str]:
+        """객체 경로 → Signed URL 변환 (외부 URL은 그대로 유지)"""
+        return sign_image_url(value)
+
+
+class AdminTripResponse(SignedImageUrlResponse):
     """
     관리자용 여정 상세 응답 스키마
     모든 여정 정보 포함 (일반 사용자보다 더 많은 정보)
@@ -76,7 +89,7 @@ class AdminTripResponse(BaseResponse):
         }
 
 
-class AdminTripWithUserResponse(BaseResponse):
+class AdminTripWithUserResponse(SignedImageUrlResponse):
     """
     관리자용 여정 + 사용자 정보 응답 스키마
     목록 조회 시 사용자 정보를 함께 반환
@@ -113,6 +126,16 @@ class AdminTripWithUserResponse(BaseResponse):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_trip(cls, trip, user_info: Optional[dict]) -> "AdminTripWithUserResponse":
+        """
+        여정 엔티티와 사용자 정보로 응답 생성
+        엔티티 속성을 직접 읽어 중간 dict 변환 없이 생성
+        """
+        response = cls.model_validate(trip)
+        response.user = UserInfoResponse(**user_info) if user_info else None
+        return response
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -135,14 +158,38 @@ class AdminTripWithUserResponse(BaseResponse):
         }
 
 
+class AdminTripSummaryWithUserResponse(BaseResponse):
+    """
+    관리자용 여정 요약 + 사용자 정보 응답 스키마 (view=summary)
+    목록 카드에 필요한 필드만 반환 (이미지 URL, 환승/도착 좌표, 관리자 메모 제외)
+    """
+
+    id: UUID
+    user_id: UUID
+    user: Optional["UserInfoResponse"] = None
+    start_latitude: float
+    start_longitude: float
+    status: TripStatus
+    points: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_trip(cls, trip, user_info: Optional[dict]) -> "AdminTripSummaryWithUserResponse":
+        """여정 요약(또는 엔티티)과 사용자 정보로 응답 생성"""
+        response = cls.model_validate(trip)
+        response.user = UserInfoResponse(**user_info) if user_info else None
+        return response
+
+
 class AdminTripListResponse(BaseResponse):
     """
     관리자용 여정 목록 응답 스키마
     페이지네이션 정보 포함, 각 여정에 사용자 정보 포함
     """
 
-    trips: list[AdminTripWithUserResponse]
-    total_count: int
+    trips: list[Union[AdminTripWithUserResponse, AdminTripSummaryWithUserResponse]]
+    total_count: Optional[int]
 
     class Config:
         json_schema_extra = {
@@ -9,7 +9,12 @@ from uuid import UUID
 
 from pydantic import Field
 
-from src.infrastructure.external.naver_geocoding_service import AddressSearchResult
+from src.domain.value_objects.address import AddressSearchResult
+from src.domain.value_objects.catalog_import import (
+    CatalogImportAction,
+    CatalogImportKind,
+    CatalogImportRowResult,
+)
 from src.shared.schemas.base import BaseRequest, BaseResponse
 
 
@@ -63,6 +68,69 @@ class UpdateParkingLotRequest(BaseRequest):
     fee_info: Optional[str] = Field(None, max_length=200, description="요금 정보")
 
 
+# 카탈로그 일괄 등록 요청당 최대 행 수 (역, 주차장 각각)
+CATALOG_IMPORT_MAX_ROWS = 1000
+
+
+class StationImportItem(BaseRequest):
+    """
+    카탈로그 일괄 등록 - 역 행
+    (name, line_number)가 같은 역이 있으면 좌표 수정, 없으면 생성
+    """
+
+    name: str = Field(..., min_length=1, max_length=50, description="역 이름")
+    line_number: int = Field(..., ge=1, le=4, description="노선 번호 (1=1호선, 2=2호선, 3=3호선, 4=대경선)")
+    latitude: Optional[float] = Field(None, ge=33, le=39, description="위도 (없으면 address로 Geocoding)")
+    longitude: Optional[float] = Field(None, ge=124, le=132, description="경도 (없으면 address로 Geocoding)")
+    address: Optional[str] = Field(None, max_length=200, description="좌표가 없을 때 Geocoding에 사용할 주소")
+
+
+class ParkingLotImportItem(BaseRequest):
+    """
+    카탈로그 일괄 등록 - 주차장 행
+    연계 역은 역 이름과 노선 번호로 지정 (같은 요청에서 등록하는 역도 가능)
+    같은 역의 같은 이름 주차장이 있으면 수정, 없으면 생성
+    """
+
+    station_name: str = Field(..., min_length=1, max_length=50, description="연계 역 이름")
+    station_line_number: int = Field(..., ge=1, le=4, description="연계 역 노선 번호")
+    name: str = Field(..., min_length=1, max_length=100, description="주차장 이름")
+    address: str = Field(..., min_length=1, max_length=200, description="도로명 또는 지번 주소")
+    latitude: Optional[float] = Field(None, ge=33, le=39, description="위도 (없으면 주소로 Geocoding)")
+    longitude: Optional[float] = Field(None, ge=124, le=132, description="경도 (없으면 주소로 Geocoding)")
+    fee_info: Optional[str] = Field(None, max_length=200, description="요금 정보")
+
+
+class CatalogImportRequest(BaseRequest):
+    """
+    역/주차장 카탈로그 일괄 등록 요청 스키마
+    좌표가 없는 행은 Geocoding, 주차장-역 거리는 자동 계산되며 전체가 단일 트랜잭션으로 반영됨
+    """
+
+    stations: list[StationImportItem] = Field(
+        default_factory=list, max_length=CATALOG_IMPORT_MAX_ROWS, description="역 행 목록"
+    )
+    parking_lots: list[ParkingLotImportItem] = Field(
+        default_factory=list, max_length=CATALOG_IMPORT_MAX_ROWS, description="주차장 행 목록"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "stations": [{"name": "반월당역", "line_number": 1, "latitude": 35.8575, "longitude": 128.5974}],
+                "parking_lots": [
+                    {
+                        "station_name": "반월당역",
+                        "station_line_number": 1,
+                        "name": "반월당역 환승주차장",
+                        "address": "대구광역시 중구 동성로2가 123",
+                        "fee_info": "1시간 1,000원",
+                    }
+                ],
+            }
+        }
+
+
 # ============================================================================
 # Response Schemas
 # ============================================================================
@@ -237,3 +305,74 @@ class AddressSearchResponse(BaseResponse):
                 "total_count": 5,
             }
         }
+
+
+class ParkingLotDistanceRecomputeResponse(BaseResponse):
+    """
+    주차장 거리 일괄 재계산 결과 응답 스키마
+    """
+
+    updated_count: int = Field(..., description="거리 값이 바뀐 주차장 수")
+
+    class Config:
+        json_schema_extra = {"example": {"updated_count": 3}}
+
+
+class CatalogImportRowResponse(BaseResponse):
+    """카탈로그 일괄 등록 행별 처리 결과"""
+
+    kind: CatalogImportKind = Field(..., description="행 종류 (station/parking_lot)")
+    row: int = Field(..., description="종류별 행 번호 (1부터)")
+    name: str = Field(..., description="역 또는 주차장 이름")
+    action: CatalogImportAction = Field(..., description="처리 결과 (created/updated/failed)")
+    id: Optional[UUID] = Field(None, description="생성/수정된 역 또는 주차장 ID")
+    message: Optional[str] = Field(None, description="실패 사유")
+
+
+class CatalogImportResponse(BaseResponse):
+    """
+    카탈로그 일괄 등록 결과 응답 스키마
+    처리 건수와 행별 결과 포함
+    """
+
+    created_count: int
+    updated_count: int
+    failed_count: int
+    rows: list[CatalogImportRowResponse]
+
+    @classmethod
+    def from_results(cls, results: list[CatalogImportRowResult]) -> "CatalogImportResponse":
+        """행별 처리 결과로 응답 생성"""
+        return cls(
+            created_count=sum(1 for result in results if result.action == "created"),
+            updated_count=sum(1 for result in results if result.action == "updated"),
+            failed_count=sum(1 for result in results if result.action == "failed"),
+            rows=[CatalogImportRowResponse.model_validate(result) for result in results],
+        )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "created_count": 1,
+                "updated_count": 0,
+                "failed_count": 1,
+                "rows": [
+                    {
+                        "kind": "station",
+                        "row": 1,
+                        "name": "반월당역",
+                        "action": "created",
+                        "id": "550e8400-e29b-41d4-a716-446655440000",
+                        "message": None,
+                    },
+                    {
+                        "kind": "parking_lot",
+                        "row": 1,
+                        "name": "반월당역 환승주차장",
+                        "action": "failed",
+                        "id": None,
+                        "message": "주소를 좌표로 변환할 수 없습니다: 대구광역시 중구 동성로2가 123",
+                    },
+                ],
+            }
+        }
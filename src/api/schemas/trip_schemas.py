@@ -6,12 +6,13 @@ Trip API Schemas
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional, Union
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_serializer, field_validator
 
 from src.domain.entities.trip import TripStatus
+from src.infrastructure.storage.signed_url_cache import public_image_url
 from src.shared.schemas.base import BaseRequest, BaseResponse
 
 
@@ -209,6 +210,11 @@ class TripResponse(BaseResponse):
     created_at: datetime = Field(..., description="레코드 생성 시각")
     updated_at: datetime = Field(..., description="최종 수정 시각")
 
+    @field_serializer("transfer_image_url", "arrival_image_url")
+    def serialize_image_url(self, value: Optional[str]) -> Optional[str]:
+        """저장된 객체 경로 → Public URL 변환 (외부 URL은 그대로 유지)"""
+        return public_image_url(value)
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -231,14 +237,36 @@ class TripResponse(BaseResponse):
     }
 
 
+# 목록 응답 형태 (full: 전체 필드, summary: 목록 카드용 요약 필드)
+TripListView = Literal["full", "summary"]
+
+
+class TripSummaryResponse(BaseResponse):
+    """
+    여행 요약 응답 스키마 (view=summary)
+    목록 카드에 필요한 필드만 반환 (이미지 URL, 환승/도착 좌표 제외)
+    """
+
+    id: UUID = Field(..., description="여행 ID")
+    user_id: UUID = Field(..., description="사용자 ID")
+    start_latitude: float = Field(..., description="출발 위치 위도")
+    start_longitude: float = Field(..., description="출발 위치 경도")
+    status: TripStatus = Field(..., description="여행 상태")
+    points: Optional[int] = Field(..., description="포인트 (출발 시 0, 도착 후 실제 포인트)")
+    created_at: datetime = Field(..., description="레코드 생성 시각")
+    updated_at: datetime = Field(..., description="최종 수정 시각")
+
+
 class TripListResponse(BaseResponse):
     """
     여행 목록 응답 스키마
     여행 목록과 총 개수를 반환
     """
 
-    trips: list[TripResponse] = Field(..., description="여행 목록")
-    total_count: int = Field(..., description="전체 여행 개수")
+    trips: list[Union[TripResponse, TripSummaryResponse]] = Field(
+        ..., description="여행 목록 (view=summary면 요약 필드만 포함)"
+    )
+    total_count: Optional[int] = Field(..., description="전체 여행 개수 (include_total=false면 null)")
 
     model_config = {
         "json_schema_extra": {
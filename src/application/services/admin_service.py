@@ -5,14 +5,19 @@ Admin Application Service
 여정 승인/반려 및 승인 대기 여정 관리 기능 제공
 """
 
-from typing import Optional
+import asyncio
+from typing import TYPE_CHECKING, NoReturn, Optional
 from uuid import UUID
 
 from src.application.services.auth_service import AuthService
 from src.domain.entities.trip import Trip, TripStatus
-from src.domain.repositories.trip_repository import ITripRepository
+from src.domain.repositories.trip_repository import CountMode, ITripRepository
+from src.domain.value_objects.trip_summary import TripSummary
 from src.shared.exceptions import NotFoundError, ValidationError
 
+if TYPE_CHECKING:
+    from src.infrastructure.jobs.queue import JobQueue
+
 
 class AdminService:
     """
@@ -20,13 +25,20 @@ class AdminService:
     여정 승인/반려 및 포인트 지급 등의 유스케이스 구현
     """
 
-    def __init__(self, trip_repository: ITripRepository, auth_service: AuthService):
+    def __init__(
+        self,
+        trip_repository: ITripRepository,
+        auth_service: AuthService,
+        job_queue: Optional["JobQueue"] = None,
+    ):
         """
         AdminService 초기화
         TripRepository와 AuthService를 의존성으로 주입받음
+        job_queue가 있으면 포인트 지급을 백그라운드 작업으로 처리
         """
         self.trip_repository = trip_repository
         self.auth_service = auth_service
+        self.job_queue = job_queue
 
     async def get_all_trips(
         self,
@@ -36,11 +48,16 @@ class AdminService:
         end_date: Optional[str] = None,
         limit: int = 10,
         offset: int = 0,
-    ) -> tuple[list[dict], int]:
+        include_total: bool = True,
+        count: CountMode = "exact",
+        summary: bool = False,
+    ) -> tuple[list[tuple[Trip | TripSummary, Optional[dict]]], Optional[int]]:
         """
         전체 여정 목록 조회 (필터링 가능, 사용자 정보 포함)
         상태, 사용자, 날짜 범위로 필터링 지원
-        각 여정에 사용자 정보를 포함하여 반환
+        각 여정을 (여정 엔티티, 사용자 정보) 쌍으로 반환 (중간 dict 변환 없음)
+        목록과 전체 개수는 한 번의 쿼리로 조회, include_total=False면 개수 대신 None
+        summary=True면 여정 엔티티 대신 목록 카드용 요약(TripSummary) 조회
         """
         trip_status = None
         if status:
@@ -48,31 +65,27 @@ class AdminService:
                 trip_status = TripStatus(status)
             except ValueError:
                 # 잘못된 상태값이면 빈 목록 반환
-                return [], 0
+                return [], 0 if include_total else None
 
-        # 필터링된 조회
-        trips = await self.trip_repository.get_with_filters(
+        # 필터링된 목록 + 전체 개수 조회
+        get_page = (
+            self.trip_repository.get_summary_page_with_filters if summary else self.trip_repository.get_page_with_filters
+        )
+        trips, total_count = await get_page(
             status=trip_status,
             user_id=user_id,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
             offset=offset,
-        )
-        total_count = await self.trip_repository.count_with_filters(
-            status=trip_status,
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date,
+            count=count if include_total else None,
         )
 
         # 각 여정에 사용자 정보 추가
         trips_with_users = []
         for trip in trips:
             user_info = await self._get_user_info_safe(trip.user_id)
-            trip_dict = trip.model_dump()
-            trip_dict["user"] = user_info
-            trips_with_users.append(trip_dict)
+            trips_with_users.append((trip, user_info))
 
         return trips_with_users, total_count
 
@@ -94,51 +107,57 @@ class AdminService:
             # 사용자 조회 실패 시 None 반환
             return None
 
-    async def get_pending_trips(self, limit: int = 10, offset: int = 0) -> tuple[list[dict], int]:
+    async def get_pending_trips(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        include_total: bool = True,
+        count: CountMode = "exact",
+        summary: bool = False,
+    ) -> tuple[list[tuple[Trip | TripSummary, Optional[dict]]], Optional[int]]:
         """
         승인 대기 중인 여정 목록 조회 (사용자 정보 포함)
         COMPLETED 상태의 여정들을 최신순으로 반환
+        목록과 전체 개수는 한 번의 쿼리로 조회, include_total=False면 개수 대신 None
+        summary=True면 여정 엔티티 대신 목록 카드용 요약(TripSummary) 조회
         """
-        # COMPLETED 상태의 여정 조회
-        trips = await self.trip_repository.get_by_status(
+        get_page = (
+            self.trip_repository.get_summary_page_by_status if summary else self.trip_repository.get_page_by_status
+        )
+        trips, total_count = await get_page(
             status=TripStatus.COMPLETED,
             limit=limit,
             offset=offset,
+            count=count if include_total else None,
         )
 
-        # 전체 개수 조회 (페이지네이션용)
-        total_count = await self.trip_repository.count_by_status(TripStatus.COMPLETED)
-
         # 각 여정에 사용자 정보 추가
         trips_with_users = []
         for trip in trips:
             user_info = await self._get_user_info_safe(trip.user_id)
-            trip_dict = trip.model_dump()
-            trip_dict["user"] = user_info
-            trips_with_users.append(trip_dict)
+            trips_with_users.append((trip, user_info))
 
         return trips_with_users, total_count
 
     async def approve_trip(self, trip_id: UUID) -> Trip:
         """
         여정 승인 및 포인트 지급
-        1. 여정 조회 및 승인 가능 여부 확인
-        2. 여정 상태를 APPROVED로 변경
-        3. 사용자에게 포인트 지급
+        1. 조건부 UPDATE로 COMPLETED → APPROVED 전이 (동시 승인 시 하나만 성공)
+        2. 전이에 성공한 요청만 사용자에게 포인트 지급 (중복 지급 방지)
+           작업 큐 사용 시 전이와 지급 작업 등록을 한 트랜잭션으로 처리하고 바로 응답
+           (등록 실패 시 승인도 롤백되어 재시도 가능)
         """
-        # 여정 조회
-        trip = await self.trip_repository.get_by_id(trip_id)
-        if not trip:
-            raise NotFoundError(f"여정을 찾을 수 없습니다 (ID: {trip_id})")
+        if self.job_queue is not None:
+            from src.infrastructure.jobs.trip_approval import approve_trip_with_point_credit
 
-        # 승인 가능 여부 확인 (비즈니스 로직에서 검증)
-        try:
-            trip.approve()
-        except ValueError as e:
-            raise ValidationError(str(e))
+            updated_trip = await asyncio.to_thread(approve_trip_with_point_credit, self.job_queue, trip_id)
+            if updated_trip is None:
+                await self._raise_transition_error(trip_id, "승인")
+            return updated_trip
 
-        # DB 업데이트
-        updated_trip = await self.trip_repository.update(trip)
+        updated_trip = await self.trip_repository.transition(trip_id, TripStatus.APPROVED, {})
+        if updated_trip is None:
+            await self._raise_transition_error(trip_id, "승인")
 
         # 사용자에게 포인트 지급
         if updated_trip.points and updated_trip.points > 0:
@@ -158,24 +177,23 @@ class AdminService:
     async def reject_trip(self, trip_id: UUID, admin_note: Optional[str] = None) -> Trip:
         """
         여정 반려 처리
-        1. 여정 조회 및 반려 가능 여부 확인
-        2. 여정 상태를 REJECTED로 변경하고 반려 사유 기록
+        조건부 UPDATE로 COMPLETED → REJECTED 전이하고 반려 사유 기록
         """
-        # 여정 조회
+        updated_trip = await self.trip_repository.transition(
+            trip_id, TripStatus.REJECTED, {"admin_note": admin_note}
+        )
+        if updated_trip is None:
+            await self._raise_transition_error(trip_id, "반려")
+
+        return updated_trip
+
+    async def _raise_transition_error(self, trip_id: UUID, action: str) -> NoReturn:
+        """조건부 UPDATE가 0건일 때 원인에 맞는 도메인 에러 발생"""
         trip = await self.trip_repository.get_by_id(trip_id)
         if not trip:
             raise NotFoundError(f"여정을 찾을 수 없습니다 (ID: {trip_id})")
 
-        # 반려 가능 여부 확인 (비즈니스 로직에서 검증)
-        try:
-            trip.reject(admin_note)
-        except ValueError as e:
-            raise ValidationError(str(e))
-
-        # DB 업데이트
-        updated_trip = await self.trip_repository.update(trip)
-
-        return updated_trip
+        raise ValidationError(f"현재 상태({trip.status})에서는 {action}할 수 없습니다")
 
     async def get_trip_count_by_status(self, status: TripStatus) -> int:
         """
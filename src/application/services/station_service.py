@@ -4,13 +4,93 @@ Station Application Service
 지하철 역 및 주차장 조회 비즈니스 로직을 조율하는 서비스
 """
 
-from typing import Optional
+import asyncio
+from dataclasses import replace
+from typing import Hashable, Optional, TypeVar, Union
 from uuid import UUID
 
 from src.domain.entities.parking_lot import ParkingLot
 from src.domain.entities.station import Station
 from src.domain.repositories.station_repository import IStationRepository
-from src.shared.exceptions import NotFoundError
+from src.domain.value_objects.catalog_import import (
+    CatalogImportKind,
+    CatalogImportRowResult,
+    CatalogUpsertOutcome,
+    ParkingLotImportRow,
+    StationImportRow,
+)
+from src.shared.exceptions import BaseAppException, NotFoundError
+from src.shared.utils.distance import geography_distance_m
+
+ImportRow = TypeVar("ImportRow", StationImportRow, ParkingLotImportRow)
+
+
+def _duplicate_row_errors(keys: list[Hashable], message: str) -> dict[int, str]:
+    """같은 키가 앞서 나온 행을 실패로 표시 (첫 행만 처리)"""
+    seen: set[Hashable] = set()
+    errors: dict[int, str] = {}
+    for index, key in enumerate(keys):
+        if key in seen:
+            errors[index] = message
+        seen.add(key)
+    return errors
+
+
+def _missing_coordinates(row: Union[StationImportRow, ParkingLotImportRow]) -> bool:
+    """좌표가 비어 있어 Geocoding이 필요한 행인지 확인"""
+    return row.latitude is None or row.longitude is None
+
+
+def _apply_geocoding(
+    rows: list[ImportRow],
+    errors: dict[int, str],
+    geocoded: dict[str, tuple[float, float]],
+    geocode_errors: dict[str, str],
+) -> dict[int, ImportRow]:
+    """실패하지 않은 행에 Geocoding 좌표를 채워 행 번호별로 반환 (변환 실패 행은 errors에 기록)"""
+    resolved: dict[int, ImportRow] = {}
+    for index, row in enumerate(rows):
+        if index in errors:
+            continue
+        if not _missing_coordinates(row):
+            resolved[index] = row
+        elif not row.address:
+            errors[index] = "좌표 또는 주소가 필요합니다"
+        elif row.address in geocoded:
+            latitude, longitude = geocoded[row.address]
+            resolved[index] = replace(row, latitude=latitude, longitude=longitude)
+        else:
+            errors[index] = geocode_errors[row.address]
+    return resolved
+
+
+def _import_results(
+    kind: CatalogImportKind,
+    rows: list[ImportRow],
+    outcomes: dict[int, CatalogUpsertOutcome],
+    errors: dict[int, str],
+) -> list[CatalogImportRowResult]:
+    """행별 처리 결과 생성 (행 번호는 1부터)"""
+    results = []
+    for index, row in enumerate(rows):
+        outcome = outcomes.get(index)
+        if outcome is None:
+            results.append(
+                CatalogImportRowResult(
+                    kind=kind, row=index + 1, name=row.name, action="failed", message=errors[index]
+                )
+            )
+        else:
+            results.append(
+                CatalogImportRowResult(
+                    kind=kind,
+                    row=index + 1,
+                    name=row.name,
+                    action="created" if outcome.created else "updated",
+                    id=outcome.id,
+                )
+            )
+    return results
 
 
 class StationService:
@@ -35,7 +115,7 @@ class StationService:
 
         Args:
             line_number: 노선 번호 (1, 2, 3, 4) - None이면 전체 조회
-            keyword: 역 이름 검색 키워드 (부분 일치)
+            keyword: 역 이름 검색 키워드 (접두/부분 일치, 초성, 오타 허용 - 관련도순 정렬)
             limit: 반환할 결과 수
             offset: 건너뛸 결과 수
 
@@ -64,9 +144,28 @@ class StationService:
             raise NotFoundError(f"역 ID {station_id}를 찾을 수 없습니다")
         return station
 
+    async def get_station_with_parking_lots(self, station_id: UUID) -> tuple[Station, list[ParkingLot]]:
+        """
+        역 상세와 주차장 목록 조회 (한 번의 쿼리)
+
+        Args:
+            station_id: 역 고유 식별자
+
+        Returns:
+            (Station 엔티티, 역까지 거리순 ParkingLot 엔티티 리스트)
+
+        Raises:
+            NotFoundError: 역을 찾을 수 없을 때
+        """
+        result = await self.repository.get_with_parking_lots(station_id)
+        if result is None:
+            raise NotFoundError(f"역 ID {station_id}를 찾을 수 없습니다")
+        return result
+
     async def get_station_parking_lots(self, station_id: UUID) -> list[ParkingLot]:
         """
         특정 역의 주차장 목록 조회
+        역 존재 확인과 주차장 조회를 한 번의 쿼리로 처리
 
         Args:
             station_id: 역 고유 식별자
@@ -77,11 +176,8 @@ class StationService:
         Raises:
             NotFoundError: 역을 찾을 수 없을 때
         """
-        # 역 존재 여부 확인
-        await self.get_station_by_id(station_id)
-
-        # 주차장 목록 조회
-        return await self.repository.get_parking_lots(station_id)
+        _, parking_lots = await self.get_station_with_parking_lots(station_id)
+        return parking_lots
 
     async def get_all_parking_lots(
         self,
@@ -164,7 +260,7 @@ class StationService:
             name, line_number, latitude, longitude: 수정할 필드 (None이면 변경 안함)
 
         Returns:
-            수정된 Station 엔티티
+            수정된 Station 엔티티 (좌표 변경 시 연결된 주차장 거리도 같은 트랜잭션에서 재계산)
         """
         # 역 존재 여부 확인
         await self.get_station_by_id(station_id)
@@ -177,6 +273,16 @@ class StationService:
             longitude=longitude,
         )
 
+    async def recompute_parking_lot_distances(self) -> int:
+        """
+        전체 주차장의 역까지 거리 일괄 재계산 (UPDATE 1회)
+        역 좌표 수정 시에는 update_station이 해당 역만 자동으로 재계산함
+
+        Returns:
+            거리 값이 바뀐 주차장 수
+        """
+        return await self.repository.recompute_parking_lot_distances()
+
     async def delete_station(self, station_id: UUID) -> None:
         """
         역 삭제 (연결된 주차장도 함께 삭제됨 - CASCADE)
@@ -201,8 +307,8 @@ class StationService:
 
         프로세스:
         1. 네이버 API로 주소 → 좌표 변환
-        2. PostGIS로 역-주차장 거리 자동 계산
-        3. DB 저장
+        2. 역-주차장 거리 계산 (프로세스 내 측지선 거리, PostGIS geography와 같은 기준)
+        3. DB 저장 (INSERT 1회)
 
         Args:
             station_id: 연계 역 ID
@@ -237,13 +343,8 @@ class StationService:
 
         latitude, longitude = coords
 
-        # 3. 거리 계산 (PostGIS)
-        distance_m = await self.repository.calculate_distance(
-            lat1=latitude,
-            lng1=longitude,
-            lat2=station.latitude,
-            lng2=station.longitude,
-        )
+        # 3. 거리 계산 (DB 왕복 없이 프로세스 내 계산)
+        distance_m = geography_distance_m(latitude, longitude, station.latitude, station.longitude)
 
         # 4. 주차장 생성
         return await self.repository.create_parking_lot(
@@ -300,3 +401,118 @@ class StationService:
             parking_lot_id: 주차장 ID
         """
         await self.repository.delete_parking_lot(parking_lot_id)
+
+    # ========================================================================
+    # 카탈로그 일괄 등록
+    # ========================================================================
+
+    async def import_catalog(
+        self,
+        stations: list[StationImportRow],
+        parking_lots: list[ParkingLotImportRow],
+    ) -> list[CatalogImportRowResult]:
+        """
+        역/주차장 카탈로그 일괄 등록 (업서트)
+
+        프로세스:
+        1. 같은 요청 안에서 키가 중복된 행 제외
+        2. 좌표가 없는 행의 주소를 동시에 Geocoding (동시 요청 수 제한, 같은 주소는 1회만 요청)
+        3. 연계 역 좌표(요청의 역 + 기존 역)로 주차장-역 거리 계산 (프로세스 내 측지선 거리)
+        4. 유효한 행 전체를 단일 트랜잭션으로 업서트
+
+        실패한 행은 건너뛰고 사유를 결과에 기록하며, 나머지 행은 그대로 반영
+
+        Args:
+            stations: 역 행 목록
+            parking_lots: 주차장 행 목록
+
+        Returns:
+            행별 처리 결과 (역 행 → 주차장 행 순서)
+        """
+        # 1. 키 중복 행 제외 (같은 행을 한 트랜잭션에서 두 번 업서트할 수 없음)
+        station_errors = _duplicate_row_errors(
+            [row.key for row in stations], "같은 역(이름, 노선)이 요청에 중복되었습니다"
+        )
+        parking_lot_errors = _duplicate_row_errors(
+            [row.key for row in parking_lots], "같은 역의 같은 이름 주차장이 요청에 중복되었습니다"
+        )
+
+        # 2. 좌표가 없는 행의 주소 Geocoding
+        addresses = {
+            row.address
+            for rows, errors in ((stations, station_errors), (parking_lots, parking_lot_errors))
+            for index, row in enumerate(rows)
+            if index not in errors and _missing_coordinates(row) and row.address
+        }
+        geocoded, geocode_errors = await self._geocode_addresses(addresses)
+        resolved_stations = _apply_geocoding(stations, station_errors, geocoded, geocode_errors)
+        resolved_parking_lots = _apply_geocoding(parking_lots, parking_lot_errors, geocoded, geocode_errors)
+
+        # 3. 주차장-역 거리 계산 (요청의 역 좌표가 기존 역 좌표보다 우선)
+        station_coordinates = {
+            (station.name, station.line_number): (station.latitude, station.longitude)
+            for station in await self.repository.get_all()
+        }
+        station_coordinates.update(
+            {row.key: (row.latitude, row.longitude) for row in resolved_stations.values()}
+        )
+        for index, row in list(resolved_parking_lots.items()):
+            coordinates = station_coordinates.get(row.station_key)
+            if coordinates is None or None in coordinates:
+                parking_lot_errors[index] = (
+                    f"연계 역을 찾을 수 없습니다: {row.station_name} ({row.station_line_number}호선)"
+                )
+                del resolved_parking_lots[index]
+                continue
+            resolved_parking_lots[index] = replace(
+                row, distance_to_station_m=geography_distance_m(row.latitude, row.longitude, *coordinates)
+            )
+
+        # 4. 단일 트랜잭션 업서트
+        station_outcomes, parking_lot_outcomes = await self.repository.upsert_catalog(
+            stations=list(resolved_stations.values()),
+            parking_lots=list(resolved_parking_lots.values()),
+        )
+
+        return _import_results(
+            "station", stations, dict(zip(resolved_stations, station_outcomes)), station_errors
+        ) + _import_results(
+            "parking_lot", parking_lots, dict(zip(resolved_parking_lots, parking_lot_outcomes)), parking_lot_errors
+        )
+
+    async def _geocode_addresses(
+        self, addresses: set[str]
+    ) -> tuple[dict[str, tuple[float, float]], dict[str, str]]:
+        """
+        주소 목록 동시 Geocoding (동시 요청 수는 catalog_import_geocode_concurrency로 제한)
+
+        Returns:
+            (주소별 좌표, 변환에 실패한 주소별 사유)
+        """
+        if not addresses:
+            return {}, {}
+
+        from src.config import get_settings
+        from src.infrastructure.external.naver_geocoding_service import NaverGeocodingService
+
+        settings = get_settings()
+        geocoding_service = NaverGeocodingService(
+            client_id=settings.naver_client_id,
+            client_secret=settings.naver_client_secret,
+        )
+        semaphore = asyncio.Semaphore(settings.catalog_import_geocode_concurrency)
+
+        async def geocode(address: str) -> Union[tuple[float, float], str]:
+            async with semaphore:
+                try:
+                    coords = await geocoding_service.geocode_address(address)
+                except BaseAppException as e:
+                    return e.message
+            return coords or f"주소를 좌표로 변환할 수 없습니다: {address}"
+
+        ordered = list(addresses)
+        results = await asyncio.gather(*(geocode(address) for address in ordered))
+
+        geocoded = {address: result for address, result in zip(ordered, results) if isinstance(result, tuple)}
+        errors = {address: result for address, result in zip(ordered, results) if isinstance(result, str)}
+        return geocoded, errors
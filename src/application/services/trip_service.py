@@ -6,17 +6,19 @@ Trip Application Service
 """
 
 import logging
-from typing import Optional
+from typing import NoReturn, Optional
 from uuid import UUID
 
 from src.domain.entities.trip import Trip, TripStatus
-from src.domain.repositories.trip_repository import ITripRepository
+from src.domain.repositories.trip_repository import CountMode, ITripRepository
+from src.domain.value_objects.trip_summary import TripSummary
 from src.shared.exceptions import ConflictError, ForbiddenError, NotFoundError, ValidationError
 from src.shared.utils.distance import (
     calculate_points_from_distance,
     calculate_trip_total_distance,
     validate_points_consistency,
 )
+from src.shared.utils.storage_path import extract_object_path
 
 logger = logging.getLogger(__name__)
 
@@ -37,16 +39,9 @@ class TripService:
     async def start_trip(self, user_id: UUID, latitude: float, longitude: float) -> Trip:
         """
         여행 시작
-        활성 여행이 있는지 확인 후 새로운 여행 생성
+        사용자당 진행 중 여행 1건은 DB 부분 유니크 인덱스가 보장하므로 INSERT 1회로 처리
+        (동시에 시작 요청이 와도 하나만 성공)
         """
-        # 활성 여행이 있는지 확인
-        active_trip = await self.trip_repository.get_active_trip(user_id)
-        if active_trip:
-            raise ConflictError(
-                f"이미 진행 중인 여행이 있습니다 (ID: {active_trip.id}, 상태: {active_trip.status.value})"
-            )
-
-        # 새로운 여행 생성
         new_trip = Trip(
             user_id=user_id,
             start_latitude=latitude,
@@ -54,7 +49,16 @@ class TripService:
             status=TripStatus.DRIVING,
         )
 
-        return await self.trip_repository.create(new_trip)
+        try:
+            return await self.trip_repository.create(new_trip)
+        except ConflictError:
+            # 충돌 시에만 기존 활성 여행을 조회하여 안내 메시지 구성
+            active_trip = await self.trip_repository.get_active_trip(user_id)
+            if active_trip is None:
+                raise
+            raise ConflictError(
+                f"이미 진행 중인 여행이 있습니다 (ID: {active_trip.id}, 상태: {active_trip.status.value})"
+            )
 
     async def transfer_trip(
         self,
@@ -66,25 +70,24 @@ class TripService:
     ) -> Trip:
         """
         환승 기록
-        소유권 확인 후 환승 정보 업데이트
+        소유권/상태 확인과 변경을 조건부 UPDATE 1회로 처리
+        (동시에 같은 요청이 와도 하나만 성공)
         """
-        # 여행 조회
-        trip = await self.trip_repository.get_by_id(trip_id)
-        if not trip:
-            raise NotFoundError(f"여행을 찾을 수 없습니다 (ID: {trip_id})")
-
-        # 소유권 확인
-        if trip.user_id != user_id:
-            raise ForbiddenError("다른 사용자의 여행을 수정할 수 없습니다")
-
-        # 상태 확인 및 환승 기록
-        try:
-            trip.transfer(latitude=latitude, longitude=longitude, image_url=image_url)
-        except ValueError as e:
-            raise ValidationError(str(e))
+        # Storage 이미지는 만료되지 않는 객체 경로로 저장
+        trip = await self.trip_repository.transition(
+            trip_id,
+            TripStatus.TRANSFERRED,
+            {
+                "transfer_latitude": latitude,
+                "transfer_longitude": longitude,
+                "transfer_image_url": extract_object_path(image_url) or image_url,
+            },
+            user_id=user_id,
+        )
+        if trip is None:
+            await self._raise_transition_error(trip_id, user_id, "환승")
 
-        # 업데이트 저장
-        return await self.trip_repository.update(trip)
+        return trip
 
     async def arrive_trip(
         self,
@@ -135,19 +138,40 @@ class TripService:
                     f"(거리={total_distance:.2f}m, 사용자={user_id})"
                 )
 
-        # 상태 확인 및 도착 기록 (서버 계산 포인트 사용)
-        try:
-            trip.arrive(
-                latitude=latitude,
-                longitude=longitude,
-                image_url=image_url,
-                points=server_points,  # 서버 계산값 사용 (보안)
-            )
-        except ValueError as e:
-            raise ValidationError(str(e))
+        # 상태 확인 및 도착 기록 (서버 계산 포인트 사용, 이미지는 객체 경로로 저장)
+        if not trip.can_arrive():
+            raise ValidationError(f"도착 불가능한 상태입니다: {trip.status}")
+
+        # 조회 이후 상태가 바뀌었을 수 있으므로 조건부 UPDATE로 저장
+        arrived_trip = await self.trip_repository.transition(
+            trip_id,
+            TripStatus.COMPLETED,
+            {
+                "arrival_latitude": latitude,
+                "arrival_longitude": longitude,
+                "arrival_image_url": extract_object_path(image_url) or image_url,
+                "points": server_points,  # 서버 계산값 사용 (보안)
+            },
+            user_id=user_id,
+        )
+        if arrived_trip is None:
+            await self._raise_transition_error(trip_id, user_id, "도착")
+
+        return arrived_trip
+
+    async def _raise_transition_error(self, trip_id: UUID, user_id: UUID, action: str) -> NoReturn:
+        """
+        조건부 UPDATE가 0건일 때 원인에 맞는 도메인 에러 발생
+        실패 경로에서만 여행을 조회함
+        """
+        trip = await self.trip_repository.get_by_id(trip_id)
+        if not trip:
+            raise NotFoundError(f"여행을 찾을 수 없습니다 (ID: {trip_id})")
+
+        if trip.user_id != user_id:
+            raise ForbiddenError("다른 사용자의 여행을 수정할 수 없습니다")
 
-        # 업데이트 저장
-        return await self.trip_repository.update(trip)
+        raise ValidationError(f"{action} 불가능한 상태입니다: {trip.status}")
 
     async def get_trips(
         self,
@@ -173,6 +197,38 @@ class TripService:
             offset=offset,
         )
 
+    async def get_trip_page(
+        self,
+        user_id: UUID,
+        status: Optional[TripStatus] = None,
+        limit: int = 10,
+        offset: int = 0,
+        include_total: bool = True,
+        count: CountMode = "exact",
+        summary: bool = False,
+    ) -> tuple[list[Trip] | list[TripSummary], Optional[int]]:
+        """
+        사용자의 여행 목록과 전체 개수 조회 (한 번의 쿼리)
+        include_total=False면 개수를 계산하지 않고 None 반환
+        summary=True면 목록 카드용 요약(TripSummary)만 조회
+        """
+        if limit < 1 or limit > 100:
+            raise ValidationError("limit은 1에서 100 사이여야 합니다")
+
+        if offset < 0:
+            raise ValidationError("offset은 0 이상이어야 합니다")
+
+        get_page = (
+            self.trip_repository.get_summary_page_by_user_id if summary else self.trip_repository.get_page_by_user_id
+        )
+        return await get_page(
+            user_id=user_id,
+            status=status,
+            limit=limit,
+            offset=offset,
+            count=count if include_total else None,
+        )
+
     async def get_trip_by_id(self, trip_id: UUID, user_id: UUID) -> Trip:
         """
         특정 여행 조회
@@ -6,6 +6,7 @@ pydantic-settings를 사용한 환경 변수 기반 설정 관리
 """
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -50,15 +51,233 @@ class Settings(BaseSettings):
     supabase_key: str = Field(..., description="Supabase anon/service 키")
     supabase_service_role_key: str = Field(default="", description="Supabase service role 키 (Admin API용, 테스트 전용)")
 
+    # Storage Signed URL 설정 (trips 테이블에는 객체 경로만 저장, 응답 시 발급)
+    signed_url_expires_in: int = Field(default=86400, ge=60, description="Signed URL 유효 시간 (초)")
+    signed_url_cache_margin_seconds: int = Field(
+        default=600,
+        ge=1,
+        description="Signed URL 캐시 TTL 여유 (초, 만료 시간보다 이만큼 먼저 캐시에서 제거)",
+    )
+
+    # 응답 직렬화 설정
+    fast_serialization_enabled: bool = Field(
+        default=False,
+        description="응답 스키마 재검증을 건너뛰고 pydantic-core/orjson으로 바로 직렬화하는 빠른 경로 사용 여부",
+    )
+
+    # 콜드 스타트 설정
+    prebuilt_openapi_enabled: bool = Field(
+        default=True,
+        description="미리 생성된 OpenAPI 스키마(src/api/openapi.json) 사용 여부 (첫 /docs 요청 시 스키마 생성 비용 제거)",
+    )
+
+    # 시작 워밍업 설정 (완료 전까지 /ready는 503)
+    warmup_enabled: bool = Field(
+        default=True,
+        description="시작 시 DB 연결 풀, PostgREST, 역 데이터, Auth 서명 키 워밍업 실행 여부",
+    )
+    warmup_db_connections: int = Field(
+        default=5,
+        ge=0,
+        description="워밍업 시 미리 열어 둘 DB 연결 수 (연결 풀 크기 이하)",
+    )
+    warmup_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="워밍업 전체 제한 시간 (초, 초과 시 남은 단계를 건너뛰고 준비 완료 처리)",
+    )
+
+    # 응답 압축 설정 (brotli 패키지 설치 시 br 우선, 미설치 시 gzip)
+    compression_enabled: bool = Field(default=True, description="Accept-Encoding 협상 기반 응답 압축 사용 여부")
+    compression_minimum_size: int = Field(
+        default=1024,
+        ge=0,
+        description="압축을 적용할 최소 응답 크기 (바이트, 미만이면 압축하지 않음)",
+    )
+    compression_gzip_level: int = Field(default=6, ge=1, le=9, description="gzip 압축 레벨 (1~9)")
+    compression_brotli_quality: int = Field(default=5, ge=0, le=11, description="brotli 압축 품질 (0~11)")
+
+    # 카탈로그(역/주차장 조회) HTTP 조건부 캐싱 설정
+    catalog_cache_enabled: bool = Field(
+        default=True,
+        description="역/주차장 조회 API에 ETag/Last-Modified/Cache-Control 헤더 및 304 응답 적용 여부",
+    )
+    catalog_cache_max_age_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="카탈로그 응답 Cache-Control max-age (초)",
+    )
+    catalog_cache_stale_while_revalidate_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="카탈로그 응답 Cache-Control stale-while-revalidate (초, 0이면 생략)",
+    )
+    catalog_version_ttl_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="카탈로그 버전(max(updated_at) + 행 수) 프로세스 캐시 유지 시간 (초)",
+    )
+
+    # 여행 시작/환승/도착 API Idempotency-Key 재시도 처리 설정
+    idempotency_enabled: bool = Field(
+        default=True,
+        description="Idempotency-Key 헤더로 재시도된 여행 요청에 저장된 응답 반환 여부",
+    )
+    idempotency_backend: Literal["memory", "postgres"] = Field(
+        default="memory",
+        description="멱등성 응답 저장소 (memory: 프로세스 LRU, postgres: 프로세스 LRU + idempotency_keys 테이블)",
+    )
+    idempotency_ttl_seconds: float = Field(
+        default=86400.0,
+        gt=0,
+        description="멱등성 응답 보관 시간 (초)",
+    )
+    idempotency_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="프로세스 LRU에 보관할 최대 멱등성 키 수",
+    )
+
+    # 라우트별 요청 한도 (분당 요청 수, 초과 시 429 + Retry-After)
+    rate_limit_enabled: bool = Field(default=True, description="로그인/업로드/주소 검색 API 요청 한도 적용 여부")
+    rate_limit_backend: Literal["memory", "postgres"] = Field(
+        default="memory",
+        description="요청 한도 저장소 (memory: 프로세스 토큰 버킷, postgres: 토큰 버킷 + rate_limit_counters 공유 카운터)",
+    )
+    rate_limit_auth_per_minute: int = Field(default=10, ge=1, description="IP당 로그인/회원가입 분당 요청 수")
+    rate_limit_upload_per_minute: int = Field(default=30, ge=1, description="사용자당 이미지 업로드 분당 요청 수")
+    rate_limit_address_search_per_minute: int = Field(
+        default=30,
+        ge=1,
+        description="사용자당 관리자 주소 검색(네이버 Geocoding) 분당 요청 수",
+    )
+    rate_limit_user_ip_multiplier: int = Field(
+        default=10,
+        ge=1,
+        description=(
+            "사용자 기준 정책(업로드/주소 검색)의 IP 보호 버킷 한도 배수 "
+            "(IP 버킷 한도 = 사용자당 한도 x 배수, NAT/통신사 게이트웨이 뒤 사용자들이 IP를 공유하므로 여유를 둠)"
+        ),
+    )
+    rate_limit_trusted_proxy_hops: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "클라이언트 IP 앞단의 신뢰하는 리버스 프록시 수 "
+            "(0: 소켓 주소 사용, N: X-Forwarded-For의 오른쪽에서 N번째 주소 사용)"
+        ),
+    )
+
+    # 백그라운드 작업 큐 (jobs 테이블, 워커: python -m src.worker)
+    jobs_enabled: bool = Field(
+        default=False,
+        description="여정 승인 포인트 지급을 작업 큐로 처리 (워커 프로세스 실행 필요)",
+    )
+    job_max_attempts: int = Field(default=5, ge=1, description="작업당 최대 시도 횟수 (초과 시 failed)")
+    job_backoff_base_seconds: float = Field(default=5.0, gt=0, description="첫 재시도 대기 시간 (초, 이후 2배씩 증가)")
+    job_backoff_max_seconds: float = Field(default=600.0, gt=0, description="재시도 대기 시간 상한 (초)")
+    worker_concurrency: int = Field(default=4, ge=1, description="워커 프로세스당 동시 처리 작업 수")
+    worker_poll_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="큐가 비었을 때 워커의 작업 조회 간격 (초)",
+    )
+    job_retention_days: int = Field(default=7, ge=1, description="완료(done) 작업 보관 기간 (일)")
+
+    # 주기 유지보수 작업 스케줄러 (pg_try_advisory_lock으로 전체 인스턴스 중 하나만 실행)
+    scheduler_enabled: bool = Field(default=True, description="앱 프로세스에서 주기 유지보수 작업 실행 여부")
+    scheduler_timezone: str = Field(default="Asia/Seoul", description="cron 스케줄 기준 시간대")
+    scheduler_jitter_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="실행 시각에 더하는 임의 지연 최대값 (초, 인스턴스 간 동시 기상 분산)",
+    )
+    signed_url_refresh_cron: str = Field(
+        default="",
+        description=(
+            "만료 임박 Signed URL 갱신 cron 스케줄 (빈 값이면 비활성, 기본 비활성) - "
+            "이미지는 객체 경로로 저장되므로 scripts/convert_image_urls_to_paths.py로 변환 전인 DB에서만 사용"
+        ),
+    )
+    coordinate_check_cron: str = Field(
+        default="0 5 * * *",
+        description="역/주차장 latitude/longitude 컬럼과 location 일치 확인 cron 스케줄 (빈 값이면 비활성)",
+    )
+
     # Database 연결 정보 (SQLModel용)
     database_url: str = Field(
         ...,
         description="PostgreSQL 연결 URL (SQLModel용, 비밀번호의 @ 문자는 %40으로 인코딩)",
     )
 
+    # 읽기 복제본 (get_*/count_* 레포지토리 호출을 복제본으로, 쓰기는 주 DB로)
+    database_replica_urls: str = Field(
+        default="",
+        description="읽기 복제본 PostgreSQL 연결 URL 목록 (쉼표 구분, 비어 있으면 주 DB만 사용)",
+    )
+    supabase_replica_urls: str = Field(
+        default="",
+        description="읽기 복제본 Supabase API URL 목록 (쉼표 구분, 비어 있으면 주 API만 사용)",
+    )
+    read_your_writes_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="사용자의 쓰기 요청 후 해당 사용자의 조회를 주 DB로 고정하는 시간 (초)",
+    )
+
+    @property
+    def database_replica_urls_list(self) -> list[str]:
+        """쉼표로 구분된 database_replica_urls를 리스트로 변환"""
+        return [url.strip() for url in self.database_replica_urls.split(",") if url.strip()]
+
+    @property
+    def supabase_replica_urls_list(self) -> list[str]:
+        """쉼표로 구분된 supabase_replica_urls를 리스트로 변환"""
+        return [url.strip() for url in self.supabase_replica_urls.split(",") if url.strip()]
+
     # 네이버 클라우드 Maps API (Geocoding)
     naver_client_id: str = Field(..., description="네이버 클라우드 플랫폼 Client ID")
     naver_client_secret: str = Field(..., description="네이버 클라우드 플랫폼 Client Secret")
+    catalog_import_geocode_concurrency: int = Field(
+        default=5,
+        ge=1,
+        description="카탈로그 일괄 등록 시 동시에 보내는 Geocoding 요청 수 (네이버 API 쿼터 보호)",
+    )
+
+    # 관측성 (Observability) 설정
+    metrics_enabled: bool = Field(
+        default=False,
+        description="라우트별 지연 시간 및 DB 왕복 메트릭 수집, /metrics 엔드포인트 노출 여부",
+    )
+    metrics_token: str = Field(
+        default="",
+        description="/metrics 접근 토큰 (Authorization: Bearer <토큰>, 비어 있으면 토큰 검사 없음 - 내부망 바인딩 환경에서만 사용)",
+    )
+    slow_query_threshold_ms: float = Field(
+        default=500.0,
+        description="느린 쿼리 로그 임계값 (밀리초, 0 이하이면 비활성)",
+    )
+    query_trace_enabled: bool = Field(
+        default=False,
+        description="요청 헤더(query_trace_header)로 요청 단위 쿼리 타임라인 트레이스 허용 여부",
+    )
+    query_trace_header: str = Field(default="X-Query-Trace", description="쿼리 트레이스를 요청하는 헤더 이름")
+
+    @property
+    def db_instrumentation_enabled(self) -> bool:
+        """
+        DB 왕복 계측 훅(SQLAlchemy 이벤트, Supabase httpx 훅) 설치 여부
+        메트릭, 느린 쿼리 로그, 쿼리 트레이스 중 하나라도 사용하면 설치
+        """
+        return self.metrics_enabled or self.slow_query_threshold_ms > 0 or self.query_trace_enabled
+
+    @property
+    def catalog_cache_control(self) -> str:
+        """카탈로그 응답 Cache-Control 헤더 값"""
+        directives = ["public", f"max-age={self.catalog_cache_max_age_seconds}"]
+        if self.catalog_cache_stale_while_revalidate_seconds > 0:
+            directives.append(f"stale-while-revalidate={self.catalog_cache_stale_while_revalidate_seconds}")
+        return ", ".join(directives)
 
     # Uvicorn 서버 설정
     host: str = Field(default="0.0.0.0", description="서버 바인딩 호스트")
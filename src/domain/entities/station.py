@@ -53,14 +53,14 @@ class Station(SQLModel, table=True):
         description="GPS 좌표 (PostGIS geography)",
         exclude=True,  # API 응답에서 제외
     )
-    # 좌표는 latitude, longitude 필드로 별도 제공 (computed)
+    # 좌표는 latitude, longitude 컬럼으로 저장 (트리거가 location 자동 동기화)
     latitude: Optional[float] = Field(
         default=None,
-        description="위도 (PostGIS ST_Y 함수로 추출)",
+        description="위도 (트리거로 location과 동기화)",
     )
     longitude: Optional[float] = Field(
         default=None,
-        description="경도 (PostGIS ST_X 함수로 추출)",
+        description="경도 (트리거로 location과 동기화)",
     )
     created_at: datetime = Field(
         default_factory=utc_now,
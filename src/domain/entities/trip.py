@@ -34,6 +34,21 @@ class TripStatus(str, Enum):
     REJECTED = "REJECTED"  # 관리자 거부 (포인트 미지급)
 
 
+# 상태 전이 규칙: 목표 상태 → 전이 가능한 현재 상태 목록
+# 레포지토리의 조건부 UPDATE(WHERE status IN ...)도 이 규칙을 사용
+TRIP_TRANSITIONS: dict[TripStatus, tuple[TripStatus, ...]] = {
+    TripStatus.TRANSFERRED: (TripStatus.DRIVING,),
+    TripStatus.COMPLETED: (TripStatus.TRANSFERRED,),
+    TripStatus.APPROVED: (TripStatus.COMPLETED,),
+    TripStatus.REJECTED: (TripStatus.COMPLETED,),
+}
+
+
+def allowed_from_states(target: TripStatus) -> tuple[TripStatus, ...]:
+    """목표 상태로 전이할 수 있는 현재 상태 목록 반환"""
+    return TRIP_TRANSITIONS.get(target, ())
+
+
 class Trip(SQLModel, table=True):
     """
     Trip 엔티티 (DB 테이블)
@@ -136,77 +151,25 @@ class Trip(SQLModel, table=True):
         환승 가능 여부 확인
         현재 상태가 DRIVING일 때만 환승 가능
         """
-        return self.status == TripStatus.DRIVING
+        return self.status in allowed_from_states(TripStatus.TRANSFERRED)
 
     def can_arrive(self) -> bool:
         """
         도착 기록 가능 여부 확인
         현재 상태가 TRANSFERRED일 때만 도착 가능
         """
-        return self.status == TripStatus.TRANSFERRED
-
-    def transfer(self, latitude: float, longitude: float, image_url: str) -> None:
-        """
-        환승 정보 기록 (비즈니스 로직)
-        상태를 TRANSFERRED로 변경하고 환승 위치와 이미지 저장
-        """
-        if not self.can_transfer():
-            raise ValueError(f"환승 불가능한 상태입니다: {self.status}")
-
-        self.transfer_latitude = latitude
-        self.transfer_longitude = longitude
-        self.transfer_image_url = image_url
-        self.status = TripStatus.TRANSFERRED
-        self.updated_at = utc_now()
-
-    def arrive(self, latitude: float, longitude: float, image_url: str, points: int) -> None:
-        """
-        도착 정보 기록 (비즈니스 로직)
-        상태를 COMPLETED로 변경하고 도착 위치, 이미지, 포인트 저장
-        """
-        if not self.can_arrive():
-            raise ValueError(f"도착 불가능한 상태입니다: {self.status}")
-
-        self.arrival_latitude = latitude
-        self.arrival_longitude = longitude
-        self.arrival_image_url = image_url
-        self.points = points
-        self.status = TripStatus.COMPLETED
-        self.updated_at = utc_now()
+        return self.status in allowed_from_states(TripStatus.COMPLETED)
 
     def can_approve(self) -> bool:
         """
         승인 가능 여부 확인
         COMPLETED 상태일 때만 승인 가능
         """
-        return self.status == TripStatus.COMPLETED
+        return self.status in allowed_from_states(TripStatus.APPROVED)
 
     def can_reject(self) -> bool:
         """
         반려 가능 여부 확인
         COMPLETED 상태일 때만 반려 가능
         """
-        return self.status == TripStatus.COMPLETED
-
-    def approve(self) -> None:
-        """
-        여정 승인 처리 (비즈니스 로직)
-        상태를 APPROVED로 변경 (포인트는 그대로 유지)
-        """
-        if not self.can_approve():
-            raise ValueError(f"현재 상태({self.status})에서는 승인할 수 없습니다")
-
-        self.status = TripStatus.APPROVED
-        self.updated_at = utc_now()
-
-    def reject(self, admin_note: Optional[str] = None) -> None:
-        """
-        여정 반려 처리 (비즈니스 로직)
-        상태를 REJECTED로 변경하고 반려 사유 기록
-        """
-        if not self.can_reject():
-            raise ValueError(f"현재 상태({self.status})에서는 반려할 수 없습니다")
-
-        self.status = TripStatus.REJECTED
-        self.admin_note = admin_note
-        self.updated_at = utc_now()
+        return self.status in allowed_from_states(TripStatus.REJECTED)
@@ -10,6 +10,12 @@ from uuid import UUID
 
 from src.domain.entities.parking_lot import ParkingLot
 from src.domain.entities.station import Station
+from src.domain.value_objects.catalog_import import (
+    CatalogUpsertOutcome,
+    ParkingLotImportRow,
+    StationImportRow,
+)
+from src.domain.value_objects.catalog_version import CatalogVersion
 
 
 class IStationRepository(ABC):
@@ -32,7 +38,7 @@ class IStationRepository(ABC):
 
         Args:
             line_number: 노선 번호 (1, 2, 3, 4) - None이면 전체 조회
-            keyword: 역 이름 검색 키워드 (부분 일치)
+            keyword: 역 이름 검색 키워드 (접두/부분 일치, 초성, 오타 허용 - 관련도순 정렬)
             limit: 반환할 결과 수
             offset: 건너뛸 결과 수
 
@@ -67,6 +73,19 @@ class IStationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_with_parking_lots(self, station_id: UUID) -> Optional[tuple[Station, list[ParkingLot]]]:
+        """
+        역과 주차장 목록을 한 번의 쿼리로 조회 (stations LEFT JOIN parking_lots)
+
+        Args:
+            station_id: 역 고유 식별자
+
+        Returns:
+            (Station 엔티티, 역까지 거리순 ParkingLot 엔티티 리스트) 또는 None (역이 없을 때)
+        """
+        pass
+
     @abstractmethod
     async def get_all_parking_lots(
         self,
@@ -98,6 +117,16 @@ class IStationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_catalog_version(self) -> CatalogVersion:
+        """
+        역/주차장 카탈로그 버전 조회 (HTTP 조건부 캐싱용)
+
+        Returns:
+            두 테이블의 max(updated_at)과 행 수로 구성된 CatalogVersion
+        """
+        pass
+
     # ========================================================================
     # 관리자용 CRUD 메서드
     # ========================================================================
@@ -161,17 +190,35 @@ class IStationRepository(ABC):
         pass
 
     @abstractmethod
-    async def calculate_distance(
-        self, lat1: float, lng1: float, lat2: float, lng2: float
-    ) -> int:
+    async def recompute_parking_lot_distances(self, station_id: Optional[UUID] = None) -> int:
+        """
+        주차장-역 거리(distance_to_station_m)를 현재 좌표로 일괄 재계산 (UPDATE 1회)
+
+        Args:
+            station_id: 지정 시 해당 역의 주차장만, None이면 전체 카탈로그
+
+        Returns:
+            거리 값이 바뀐 주차장 수
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_catalog(
+        self,
+        stations: list[StationImportRow],
+        parking_lots: list[ParkingLotImportRow],
+    ) -> tuple[list[CatalogUpsertOutcome], list[CatalogUpsertOutcome]]:
         """
-        두 좌표 간 거리 계산 (PostGIS ST_Distance)
+        역/주차장 일괄 업서트 (단일 트랜잭션)
+
+        역은 (name, line_number), 주차장은 (연계 역, name)으로 기존 행과 매칭하여 수정, 없으면 생성
+        모든 행은 좌표가 채워져 있어야 하며 키 중복이 없어야 함 (호출자가 검증)
 
         Args:
-            lat1, lng1: 첫 번째 지점 좌표
-            lat2, lng2: 두 번째 지점 좌표
+            stations: 역 행 목록
+            parking_lots: 주차장 행 목록 (연계 역은 기존 역 또는 stations에 포함된 역)
 
         Returns:
-            거리 (미터 단위)
+            (역 행별 결과, 주차장 행별 결과) - 입력 순서와 같음
         """
         pass
@@ -6,10 +6,18 @@ Trip Repository Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from src.domain.entities.trip import Trip, TripStatus
+from src.domain.value_objects.trip_summary import TripSummary
+
+# 사용자당 진행 중(DRIVING/TRANSFERRED) 여행 1건을 보장하는 부분 유니크 인덱스 이름
+ACTIVE_TRIP_UNIQUE_INDEX = "trips_one_active_per_user_idx"
+
+# 목록 total_count 계산 방식
+# exact: 정확한 개수 / planned: 플래너 추정치 / estimated: 일정 개수까지 정확, 이후 추정치
+CountMode = Literal["exact", "planned", "estimated"]
 
 
 class ITripRepository(ABC):
@@ -23,6 +31,33 @@ class ITripRepository(ABC):
         """
         새로운 여행 생성
         생성된 Trip 엔티티 반환
+
+        Raises:
+            ConflictError: 사용자에게 이미 진행 중인 여행이 있을 때 (ACTIVE_TRIP_UNIQUE_INDEX 위반)
+        """
+        pass
+
+    @abstractmethod
+    async def transition(
+        self,
+        trip_id: UUID,
+        to_status: TripStatus,
+        changes: dict[str, Any],
+        user_id: Optional[UUID] = None,
+    ) -> Optional[Trip]:
+        """
+        조건부 상태 전이 (UPDATE ... WHERE id AND user_id AND status IN (...) RETURNING *)
+        전이 가능한 현재 상태는 Trip 상태 전이 규칙(allowed_from_states)에서 가져옴
+
+        Args:
+            trip_id: 여행 ID
+            to_status: 목표 상태
+            changes: 상태와 함께 변경할 컬럼 값
+            user_id: 지정 시 소유자 조건 추가
+
+        Returns:
+            전이된 Trip 엔티티, 조건에 맞는 행이 없으면 None
+            (존재하지 않음/소유자 불일치/전이 불가 상태 구분은 호출자가 처리)
         """
         pass
 
@@ -48,6 +83,36 @@ class ITripRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TripStatus] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        사용자 ID로 여행 목록과 전체 개수를 한 번의 왕복으로 조회
+        count가 None이면 전체 개수를 계산하지 않고 None 반환
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TripStatus] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        get_page_by_user_id의 요약 조회 (TRIP_SUMMARY_COLUMNS만 조회)
+        목록 카드처럼 이미지/관리자 메모가 필요 없는 화면용
+        """
+        pass
+
     @abstractmethod
     async def get_active_trip(self, user_id: UUID) -> Optional[Trip]:
         """
@@ -89,6 +154,34 @@ class ITripRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_page_by_status(
+        self,
+        status: TripStatus,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        특정 상태의 여행 목록과 전체 개수를 한 번의 왕복으로 조회 (관리자용)
+        count가 None이면 전체 개수를 계산하지 않고 None 반환
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary_page_by_status(
+        self,
+        status: TripStatus,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        특정 상태의 여행 요약 목록과 전체 개수 조회 (관리자용)
+        TRIP_SUMMARY_COLUMNS만 조회
+        """
+        pass
+
     @abstractmethod
     async def count_by_status(self, status: TripStatus) -> int:
         """
@@ -133,6 +226,39 @@ class ITripRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_page_with_filters(
+        self,
+        status: Optional[TripStatus] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        필터를 적용하여 여행 목록과 전체 개수를 한 번의 왕복으로 조회 (관리자용)
+        count가 None이면 전체 개수를 계산하지 않고 None 반환
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary_page_with_filters(
+        self,
+        status: Optional[TripStatus] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        get_page_with_filters의 요약 조회 (관리자용, TRIP_SUMMARY_COLUMNS만 조회)
+        """
+        pass
+
     @abstractmethod
     async def count_with_filters(
         self,
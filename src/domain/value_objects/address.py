@@ -0,0 +1,31 @@
+"""
+Address Value Object
+
+주소 검색(Geocoding) 결과를 나타내는 값 객체
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class AddressSearchResult(BaseModel):
+    """
+    주소 검색 결과
+    네이버 Geocoding API 응답 파싱
+    """
+
+    address: str  # 도로명 주소
+    jibun_address: Optional[str] = None  # 지번 주소
+    latitude: float  # 위도
+    longitude: float  # 경도
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "address": "대구광역시 중구 동성로2가 123",
+                "jibun_address": "대구광역시 중구 동성로2가 123",
+                "latitude": 35.8580,
+                "longitude": 128.5980,
+            }
+        }
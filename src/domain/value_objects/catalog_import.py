@@ -0,0 +1,83 @@
+"""
+Catalog Import Value Objects
+
+역/주차장 카탈로그 일괄 등록(업서트) 입력 행과 행별 처리 결과
+"""
+
+from dataclasses import dataclass
+from typing import Literal, Optional
+from uuid import UUID
+
+CatalogImportKind = Literal["station", "parking_lot"]
+CatalogImportAction = Literal["created", "updated", "failed"]
+
+
+@dataclass(frozen=True)
+class StationImportRow:
+    """
+    역 일괄 등록 행
+
+    (name, line_number)로 기존 역과 매칭 (stations UNIQUE 제약과 같은 키)
+    좌표가 없으면 address를 Geocoding하여 채움
+    """
+
+    name: str
+    line_number: int
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    address: Optional[str] = None
+
+    @property
+    def key(self) -> tuple[str, int]:
+        """역 식별 키 (역 이름, 노선 번호)"""
+        return (self.name, self.line_number)
+
+
+@dataclass(frozen=True)
+class ParkingLotImportRow:
+    """
+    주차장 일괄 등록 행
+
+    연계 역은 (station_name, station_line_number)로 지정하여 같은 요청에서 새로 등록하는 역도 참조 가능
+    같은 역의 같은 이름 주차장이 있으면 수정, 없으면 생성
+    좌표가 없으면 address를 Geocoding하여 채움
+    """
+
+    station_name: str
+    station_line_number: int
+    name: str
+    address: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    fee_info: Optional[str] = None
+    distance_to_station_m: Optional[int] = None
+
+    @property
+    def station_key(self) -> tuple[str, int]:
+        """연계 역 식별 키 (역 이름, 노선 번호)"""
+        return (self.station_name, self.station_line_number)
+
+    @property
+    def key(self) -> tuple[str, int, str]:
+        """주차장 식별 키 (역 이름, 노선 번호, 주차장 이름)"""
+        return (self.station_name, self.station_line_number, self.name)
+
+
+@dataclass(frozen=True)
+class CatalogUpsertOutcome:
+    """업서트된 행의 ID와 신규 생성 여부"""
+
+    id: UUID
+    created: bool
+
+
+@dataclass(frozen=True)
+class CatalogImportRowResult:
+    """일괄 등록 행별 처리 결과"""
+
+    kind: CatalogImportKind
+    row: int
+    name: str
+    action: CatalogImportAction
+    id: Optional[UUID] = None
+    message: Optional[str] = None
@@ -0,0 +1,30 @@
+"""
+Catalog Version Value Object
+
+역/주차장 카탈로그의 현재 버전 (HTTP 조건부 캐싱의 ETag/Last-Modified 기준)
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CatalogVersion:
+    """
+    역/주차장 카탈로그 버전
+
+    max(updated_at)만으로는 행 삭제를 감지할 수 없으므로 행 수를 함께 사용
+    """
+
+    last_modified: Optional[datetime]
+    station_count: int
+    parking_lot_count: int
+
+    @property
+    def tag(self) -> str:
+        """버전 식별 문자열 (수정 시각 + 행 수의 해시)"""
+        timestamp = self.last_modified.isoformat() if self.last_modified else "-"
+        source = f"{timestamp}|{self.station_count}|{self.parking_lot_count}"
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
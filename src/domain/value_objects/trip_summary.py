@@ -0,0 +1,46 @@
+"""
+Trip Summary Value Object
+
+목록 카드용 여행 요약 (이미지 URL, 환승/도착 좌표, 관리자 메모 제외)
+목록 조회 시 필요한 컬럼만 읽어 전송량과 파싱 비용을 줄임
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities.trip import TripStatus
+
+# 요약 조회 시 읽는 trips 컬럼 (TripSummary 필드와 동일한 순서)
+TRIP_SUMMARY_COLUMNS: tuple[str, ...] = (
+    "id",
+    "user_id",
+    "start_latitude",
+    "start_longitude",
+    "status",
+    "points",
+    "created_at",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True)
+class TripSummary:
+    """여행 목록 요약"""
+
+    id: UUID
+    user_id: UUID
+    start_latitude: float
+    start_longitude: float
+    status: TripStatus
+    points: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_row(cls, row) -> "TripSummary":
+        """TRIP_SUMMARY_COLUMNS 컬럼을 가진 행(dict/매핑)으로 생성"""
+        values = {name: row[name] for name in TRIP_SUMMARY_COLUMNS}
+        values["status"] = TripStatus(values["status"])
+        return cls(**values)
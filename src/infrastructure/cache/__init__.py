@@ -0,0 +1,5 @@
+"""
+Cache Infrastructure
+
+프로세스 단위 캐시 구성 요소 (카탈로그 버전, 멱등성 응답 등)
+"""
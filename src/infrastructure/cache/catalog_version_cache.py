@@ -0,0 +1,81 @@
+"""
+Catalog Version Cache
+
+역/주차장 카탈로그 버전을 짧은 TTL로 프로세스 단위 캐시
+조건부 요청(If-None-Match)이 캐시 적중 시 DB 조회 없이 304로 응답되도록 함
+
+같은 프로세스의 관리자 쓰기는 즉시 무효화되고,
+다른 인스턴스/스크립트에서의 변경은 최대 TTL만큼 늦게 반영됨
+"""
+
+import logging
+import time
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional
+
+from src.config import get_settings
+from src.domain.value_objects.catalog_version import CatalogVersion
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogVersionCache:
+    """카탈로그 버전 TTL 캐시"""
+
+    def __init__(self, loader: Callable[[], Awaitable[CatalogVersion]], ttl_seconds: float):
+        """
+        Args:
+            loader: 현재 카탈로그 버전을 DB에서 조회하는 비동기 함수
+            ttl_seconds: 캐시 유지 시간 (초)
+        """
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._version: Optional[CatalogVersion] = None
+        self._cached_until = 0.0
+
+    async def get(self) -> Optional[CatalogVersion]:
+        """
+        현재 카탈로그 버전 반환 (만료 시 재조회)
+        조회 실패 시 None 반환 (조건부 캐싱 없이 일반 응답)
+        """
+        now = time.monotonic()
+        if self._version is not None and now < self._cached_until:
+            return self._version
+
+        try:
+            version = await self._loader()
+        except Exception as e:
+            logger.warning(f"카탈로그 버전 조회 실패: {str(e)}")
+            return None
+
+        self._version = version
+        self._cached_until = now + self.ttl_seconds
+        return version
+
+    def invalidate(self) -> None:
+        """캐시된 버전 제거 (역/주차장 변경 직후 호출)"""
+        self._version = None
+        self._cached_until = 0.0
+
+
+async def _load_catalog_version() -> CatalogVersion:
+    """
+    요청 세션과 별도의 세션으로 카탈로그 버전 조회
+    카탈로그 조회와 같은 DB(복제본 설정 시 복제본)에서 읽도록 RoutingSession 사용
+    """
+    from src.infrastructure.database.routing import RoutingSession
+    from src.infrastructure.database.session import get_engine
+    from src.infrastructure.repositories.station_repository_impl import SQLModelStationRepository
+
+    with RoutingSession(get_engine()) as session:
+        return await SQLModelStationRepository(session=session).get_catalog_version()
+
+
+@lru_cache
+def get_catalog_version_cache() -> CatalogVersionCache:
+    """CatalogVersionCache 싱글톤 인스턴스 반환"""
+    settings = get_settings()
+    return CatalogVersionCache(
+        loader=_load_catalog_version,
+        ttl_seconds=settings.catalog_version_ttl_seconds,
+    )
@@ -0,0 +1,179 @@
+"""
+Idempotency Store
+
+Idempotency-Key 헤더로 들어온 요청의 최종 응답을 TTL 동안 보관
+같은 키로 재시도된 요청은 저장된 응답을 그대로 돌려주어 여행 레포지토리를 다시 거치지 않음
+
+- memory: 프로세스 단위 LRU (기본값, 인스턴스 1대 또는 sticky 라우팅 환경)
+- postgres: 프로세스 LRU + idempotency_keys 테이블 (인스턴스 간 재시도 공유)
+
+처리 중(in-flight) 표시는 프로세스 단위로만 관리됨
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """저장된 응답 (요청 본문 지문 포함)"""
+
+    fingerprint: str
+    status_code: int
+    content_type: str
+    body: bytes
+
+
+class InMemoryIdempotencyStore:
+    """프로세스 단위 LRU + TTL 멱등성 저장소"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        Args:
+            max_entries: 보관할 최대 키 수 (초과 시 가장 오래 사용되지 않은 키부터 제거)
+            ttl_seconds: 응답 보관 시간 (초)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+        self._in_flight: set[str] = set()
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        """저장된 응답 조회 (만료 시 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    async def save(self, key: str, response: StoredResponse) -> None:
+        """응답 저장"""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def begin(self, key: str) -> bool:
+        """
+        처리 시작 표시
+        같은 키의 요청이 이미 처리 중이면 False
+        """
+        if key in self._in_flight:
+            return False
+        self._in_flight.add(key)
+        return True
+
+    def finish(self, key: str) -> None:
+        """처리 완료 표시 해제"""
+        self._in_flight.discard(key)
+
+
+class PostgresIdempotencyStore(InMemoryIdempotencyStore):
+    """
+    프로세스 LRU 앞단 + idempotency_keys 테이블 저장소
+    프로세스 캐시에 없을 때만 테이블을 조회하고, 저장은 양쪽에 모두 기록
+    테이블 조회/저장 실패 시 프로세스 캐시만으로 동작
+    """
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        response = await super().get(key)
+        if response is not None:
+            return response
+
+        try:
+            response = await asyncio.to_thread(self._select, key)
+        except Exception as e:
+            logger.warning(f"멱등성 키 조회 실패: {str(e)}")
+            return None
+
+        if response is not None:
+            await super().save(key, response)
+        return response
+
+    async def save(self, key: str, response: StoredResponse) -> None:
+        await super().save(key, response)
+        try:
+            await asyncio.to_thread(self._insert, key, response)
+        except Exception as e:
+            logger.warning(f"멱등성 키 저장 실패: {str(e)}")
+
+    def _select(self, key: str) -> Optional[StoredResponse]:
+        from sqlalchemy import text
+
+        from src.infrastructure.database.session import get_engine
+
+        with get_engine().connect() as connection:
+            row = connection.execute(
+                text(
+                    "SELECT fingerprint, status_code, content_type, body FROM idempotency_keys "
+                    "WHERE key = :key AND expires_at > now()"
+                ),
+                {"key": key},
+            ).first()
+
+        if row is None:
+            return None
+        return StoredResponse(
+            fingerprint=row.fingerprint,
+            status_code=row.status_code,
+            content_type=row.content_type,
+            body=bytes(row.body),
+        )
+
+    def _insert(self, key: str, response: StoredResponse) -> None:
+        from sqlalchemy import text
+
+        from src.infrastructure.database.session import get_engine
+
+        # 만료된 키는 같은 키로 다시 저장할 수 있도록 덮어씀
+        with get_engine().begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO idempotency_keys (key, fingerprint, status_code, content_type, body, expires_at) "
+                    "VALUES (:key, :fingerprint, :status_code, :content_type, :body, "
+                    "now() + make_interval(secs => :ttl_seconds)) "
+                    "ON CONFLICT (key) DO UPDATE SET "
+                    "fingerprint = EXCLUDED.fingerprint, status_code = EXCLUDED.status_code, "
+                    "content_type = EXCLUDED.content_type, body = EXCLUDED.body, "
+                    "created_at = now(), expires_at = EXCLUDED.expires_at "
+                    "WHERE idempotency_keys.expires_at <= now()"
+                ),
+                {
+                    "key": key,
+                    "fingerprint": response.fingerprint,
+                    "status_code": response.status_code,
+                    "content_type": response.content_type,
+                    "body": response.body,
+                    "ttl_seconds": self.ttl_seconds,
+                },
+            )
+
+
+@lru_cache
+def get_idempotency_store() -> InMemoryIdempotencyStore:
+    """설정(idempotency_backend)에 맞는 멱등성 저장소 싱글톤 반환"""
+    settings = get_settings()
+    store_class = (
+        PostgresIdempotencyStore
+        if settings.idempotency_backend == "postgres" and settings.database_url
+        else InMemoryIdempotencyStore
+    )
+    return store_class(
+        max_entries=settings.idempotency_max_entries,
+        ttl_seconds=settings.idempotency_ttl_seconds,
+    )
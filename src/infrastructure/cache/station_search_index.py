@@ -0,0 +1,198 @@
+"""
+Station Search Index
+
+역 이름 검색용 프로세스 단위 메모리 인덱스
+- 접두/부분 일치, 한글 초성 검색 ("ㅂㅇㄷ" → 반월당역), 입력 중인 마지막 음절 ("반월다" → 반월당역)
+- 자모 단위 오타 허용 ("반얼당" → 반월당역)
+- 정확 일치 → 접두 일치 → 부분 일치(앞쪽 위치 우선) → 오타 허용 순으로 정렬
+
+역 카탈로그는 수백 건 이하이므로 정규화/초성/자모 분해 결과를 미리 계산해 두고 선형 탐색
+(초성만으로 된 검색어는 미리 계산한 초성 문자열에서 부분 문자열 검색)
+카탈로그 버전(CatalogVersionCache)이 바뀔 때만 다시 만들어 검색마다 DB를 조회하지 않음
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional
+
+from src.domain.entities.station import Station
+from src.infrastructure.cache.catalog_version_cache import get_catalog_version_cache
+from src.shared.utils.hangul import (
+    choseong_of,
+    decompose,
+    has_jongseong,
+    is_choseong,
+    is_syllable,
+    strip_jongseong,
+    to_choseong,
+)
+
+# 일치 등급 (작을수록 상위)
+EXACT, PREFIX, INFIX, TYPO = range(4)
+
+# 역 이름 접미사 ("반월당" 검색 시 "반월당역"을 정확 일치로 취급)
+STATION_SUFFIX = "역"
+
+
+def _normalize(text: str) -> str:
+    """검색 비교용 정규화 (공백 제거, 영문 소문자)"""
+    return "".join(text.split()).lower()
+
+
+def _char_matches(query_char: str, name_char: str, is_last: bool) -> bool:
+    """
+    검색어 한 글자와 역 이름 한 글자 비교
+    - 초성만 입력된 글자는 같은 초성의 음절과 일치
+    - 입력 중인 마지막 음절은 받침이 없으면 받침 있는 음절과도 일치 ("다" → "당")
+    """
+    if query_char == name_char:
+        return True
+    if is_choseong(query_char):
+        return choseong_of(name_char) == query_char
+    return (
+        is_last
+        and is_syllable(query_char)
+        and not has_jongseong(query_char)
+        and strip_jongseong(name_char) == query_char
+    )
+
+
+def _find(name: str, query: str) -> Optional[int]:
+    """역 이름에서 검색어가 처음 일치하는 위치 (없으면 None)"""
+    last = len(query) - 1
+    for start in range(len(name) - len(query) + 1):
+        if all(_char_matches(char, name[start + i], i == last) for i, char in enumerate(query)):
+            return start
+    return None
+
+
+def _edit_distance(a: str, b: str, max_distance: int) -> int:
+    """편집 거리 (max_distance를 넘으면 max_distance + 1)"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """역 1건의 미리 계산된 검색 키"""
+
+    station: Station
+    name: str
+    base: str
+    choseong: str
+    jamo: str
+
+
+class StationSearchIndex:
+    """역 이름 검색 인덱스 (생성 후 변경 없음)"""
+
+    def __init__(self, stations: list[Station]):
+        self._entries = []
+        for station in stations:
+            name = _normalize(station.name)
+            base = name.removesuffix(STATION_SUFFIX) or name
+            self._entries.append(
+                _Entry(station=station, name=name, base=base, choseong=to_choseong(name), jamo=decompose(base))
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _position(entry: _Entry, query: str, choseong_only: bool) -> Optional[int]:
+        """역 이름에서 검색어가 처음 일치하는 위치 (초성만으로 된 검색어는 초성 문자열에서 검색)"""
+        if choseong_only:
+            position = entry.choseong.find(query)
+            return position if position >= 0 else None
+        return _find(entry.name, query)
+
+    def search(self, keyword: str, line_number: Optional[int] = None) -> list[Station]:
+        """
+        키워드로 역 검색 (관련도순)
+
+        Args:
+            keyword: 검색어 (역 이름 일부, 초성, 오타 포함 가능)
+            line_number: 노선 번호 필터 (None이면 전체)
+
+        Returns:
+            관련도 → 이름 길이 → 이름 → 노선 순으로 정렬된 Station 리스트
+        """
+        query = _normalize(keyword)
+        if not query:
+            return []
+
+        # 초성만으로 된 검색어는 초성 문자열에서 바로 찾고, 초성이 섞인 검색어는 오타 허용 비교에서 제외
+        # (자모 분해 기준이 달라짐)
+        choseong_only = all(map(is_choseong, query))
+        typo_query = decompose(query) if len(query) >= 2 and not any(map(is_choseong, query)) else None
+        max_typos = 1 if typo_query is None or len(typo_query) < 6 else 2
+
+        ranked = []
+        for entry in self._entries:
+            if line_number is not None and entry.station.line_number != line_number:
+                continue
+
+            if query in (entry.name, entry.base):
+                rank = (EXACT, 0)
+            elif (position := self._position(entry, query, choseong_only)) is not None:
+                rank = (PREFIX, 0) if position == 0 else (INFIX, position)
+            elif typo_query is not None:
+                # 전체 이름 또는 입력 길이만큼의 접두어와 비교 (입력 중인 검색어 허용)
+                distance = min(
+                    _edit_distance(typo_query, entry.jamo, max_typos),
+                    _edit_distance(typo_query, entry.jamo[: len(typo_query)], max_typos),
+                )
+                if distance > max_typos:
+                    continue
+                rank = (TYPO, distance)
+            else:
+                continue
+
+            ranked.append((rank, len(entry.name), entry.name, entry.station.line_number, entry.station))
+
+        ranked.sort(key=lambda item: item[:4])
+        return [item[4] for item in ranked]
+
+
+class StationSearchIndexCache:
+    """
+    카탈로그 버전별 역 검색 인덱스 캐시
+
+    같은 프로세스의 관리자 쓰기는 카탈로그 버전 캐시 무효화로 즉시 반영되고,
+    다른 인스턴스에서의 변경은 catalog_version_ttl_seconds 이내에 반영됨
+    """
+
+    def __init__(self):
+        self._index: Optional[StationSearchIndex] = None
+        self._tag: Optional[str] = None
+
+    async def get(self, loader: Callable[[], Awaitable[list[Station]]]) -> StationSearchIndex:
+        """
+        현재 카탈로그 버전의 인덱스 반환 (버전이 바뀌었으면 loader로 역 목록을 읽어 다시 생성)
+        버전 조회에 실패하면 캐시 없이 매번 새로 생성
+        """
+        # 역 목록보다 버전을 먼저 읽어, 그 사이 변경이 있어도 다음 조회에서 다시 생성되도록 함
+        version = await get_catalog_version_cache().get()
+        tag = version.tag if version is not None else None
+        if self._index is not None and tag is not None and tag == self._tag:
+            return self._index
+
+        index = StationSearchIndex(await loader())
+        if tag is not None:
+            self._index, self._tag = index, tag
+        return index
+
+
+@lru_cache
+def get_station_search_index_cache() -> StationSearchIndexCache:
+    """StationSearchIndexCache 싱글톤 인스턴스 반환"""
+    return StationSearchIndexCache()
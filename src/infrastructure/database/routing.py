@@ -0,0 +1,134 @@
+"""
+Read Replica Routing
+
+읽기 전용 레포지토리 호출(get_*, count_*)을 읽기 복제본으로, 그 외(쓰기)는 주 DB로 보냄
+- SQLModel: RoutingSession.get_bind가 호출 맥락에 따라 복제본 엔진 선택 (flush/쓰기 문은 항상 주 DB)
+- Supabase: ReplicaRoutedClient.table()이 호출 맥락에 따라 복제본 PostgREST 클라이언트 선택
+  (auth, storage, rpc 등 나머지는 항상 주 클라이언트)
+
+Read-your-writes: 쓰기 요청(POST/PUT/PATCH/DELETE)은 요청 전체를 주 DB로 고정하고,
+같은 사용자의 이후 요청도 read_your_writes_seconds 동안 주 DB로 고정 (ReadYourWritesMiddleware)
+
+복제본이 설정되지 않으면 모든 호출이 기존처럼 주 DB로 감
+"""
+
+import functools
+import inspect
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import Delete, Insert, Update
+from sqlmodel import Session
+
+# 읽기 전용 레포지토리 메서드 실행 중 여부
+_read_only_call: ContextVar[bool] = ContextVar("read_only_call", default=False)
+
+# 현재 요청을 주 DB로 고정할지 여부 (쓰기 요청 또는 최근 쓰기 사용자)
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+# 복제본으로 보내는 레포지토리 메서드 접두사
+READ_METHOD_PREFIXES = ("get_", "count_")
+
+
+def use_replica() -> bool:
+    """현재 호출을 복제본으로 보내도 되는지 확인"""
+    return _read_only_call.get() and not _primary_pinned.get()
+
+
+def pin_primary() -> None:
+    """현재 요청(컨텍스트)의 모든 DB 호출을 주 DB로 고정"""
+    _primary_pinned.set(True)
+
+
+def read_only(method):
+    """비동기 레포지토리 메서드를 읽기 전용 호출로 표시"""
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = _read_only_call.set(True)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _read_only_call.reset(token)
+
+    return wrapper
+
+
+def route_reads(cls):
+    """
+    레포지토리 클래스 데코레이터
+    get_*/count_* 비동기 메서드를 읽기 전용 호출로 표시하여 복제본으로 보냄
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith(READ_METHOD_PREFIXES) and inspect.iscoroutinefunction(member):
+            setattr(cls, name, read_only(member))
+    return cls
+
+
+class RoutingSession(Session):
+    """
+    복제본 라우팅 SQLModel Session
+    읽기 전용 호출의 SELECT만 복제본 엔진으로 보내고, flush와 INSERT/UPDATE/DELETE는 주 DB로 보냄
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        from src.infrastructure.database.session import get_replica_engines
+
+        replicas = get_replica_engines()
+        if (
+            replicas
+            and use_replica()
+            and not self._flushing
+            and not isinstance(clause, (Insert, Update, Delete))
+        ):
+            return random.choice(replicas)
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+class ReplicaRoutedClient:
+    """
+    복제본 라우팅 Supabase 클라이언트 프록시
+    읽기 전용 호출의 table() 조회만 복제본 클라이언트로 보내고 나머지 속성은 주 클라이언트에 위임
+    """
+
+    def __init__(self, primary: Any, replicas: list[Any]):
+        self._primary = primary
+        self._replicas = replicas
+
+    def table(self, table_name: str):
+        client = random.choice(self._replicas) if use_replica() else self._primary
+        return client.table(table_name)
+
+    def from_(self, table_name: str):
+        return self.table(table_name)
+
+    def __getattr__(self, name: str):
+        return getattr(self._primary, name)
+
+
+class RecentWriters:
+    """
+    최근 쓰기 요청을 보낸 사용자 기록 (프로세스 단위)
+    기록된 사용자의 요청은 window_seconds 동안 주 DB로 고정
+    """
+
+    def __init__(self, window_seconds: float, max_entries: int = 100_000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._deadlines: dict[str, float] = {}
+
+    def mark(self, user_key: str) -> None:
+        """쓰기 요청 기록"""
+        now = time.monotonic()
+        if len(self._deadlines) >= self.max_entries:
+            self._deadlines = {key: deadline for key, deadline in self._deadlines.items() if deadline > now}
+        self._deadlines[user_key] = now + self.window_seconds
+
+    def wrote_recently(self, user_key: Optional[str]) -> bool:
+        """window_seconds 이내에 쓰기 요청을 보냈는지 확인"""
+        if user_key is None:
+            return False
+        deadline = self._deadlines.get(user_key)
+        return deadline is not None and deadline > time.monotonic()
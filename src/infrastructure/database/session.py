@@ -7,6 +7,7 @@ FastAPI 의존성 주입용 Session 팩토리 제공
 
 from typing import Generator
 
+from sqlalchemy import text
 from sqlmodel import Session, create_engine
 
 from src.config import get_settings
@@ -14,6 +15,9 @@ from src.config import get_settings
 # 전역 Engine 인스턴스 (앱 시작 시 초기화)
 _engine = None
 
+# 읽기 복제본 Engine 목록 (DATABASE_REPLICA_URLS 설정 시)
+_replica_engines: list = []
+
 
 def init_db() -> None:
     """
@@ -36,6 +40,19 @@ def init_db() -> None:
         max_overflow=10,  # 최대 추가 연결 수
     )
 
+    # 읽기 복제본 연결 풀 (get_*/count_* 레포지토리 호출용)
+    _replica_engines[:] = [
+        create_engine(url, echo=settings.debug, pool_pre_ping=True, pool_size=5, max_overflow=10)
+        for url in settings.database_replica_urls_list
+    ]
+
+    # DB 왕복 계측 (메트릭, 느린 쿼리 로그, 쿼리 트레이스)
+    if settings.db_instrumentation_enabled:
+        from src.infrastructure.observability.instrumentation import instrument_engine
+
+        for engine in (_engine, *_replica_engines):
+            instrument_engine(engine)
+
 
 def get_engine():
     """
@@ -47,10 +64,44 @@ def get_engine():
     return _engine
 
 
+def get_replica_engines() -> list:
+    """
+    읽기 복제본 Engine 목록 반환
+    설정되지 않았으면 빈 리스트 (모든 호출이 주 DB로 감)
+    """
+    return _replica_engines
+
+
+def warm_up_pool(connections: int) -> int:
+    """
+    연결 풀에 미리 연결을 열어 둠 (첫 요청의 TCP/TLS/인증 비용 제거)
+    N개 연결을 동시에 체크아웃해 각각 SELECT 1을 실행한 뒤 풀에 반납
+
+    Args:
+        connections: 미리 열 연결 수 (풀 크기를 넘으면 풀 크기로 제한)
+
+    Returns:
+        실제로 연 연결 수
+    """
+    engine = get_engine()
+    count = min(connections, engine.pool.size())
+    opened = []
+    try:
+        for _ in range(count):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
 def get_session() -> Generator[Session, None, None]:
     """
     FastAPI 의존성 주입용 Session 제공
     요청마다 새로운 세션을 생성하고 자동으로 종료
+    읽기 전용 레포지토리 호출은 복제본으로 라우팅 (RoutingSession)
 
     사용 예:
     ```python
@@ -60,8 +111,10 @@ def get_session() -> Generator[Session, None, None]:
         return users
     ```
     """
+    from src.infrastructure.database.routing import RoutingSession
+
     engine = get_engine()
-    with Session(engine) as session:
+    with RoutingSession(engine) as session:
         yield session
 
 
@@ -74,3 +127,6 @@ def close_db() -> None:
     if _engine:
         _engine.dispose()
         _engine = None
+    for engine in _replica_engines:
+        engine.dispose()
+    _replica_engines.clear()
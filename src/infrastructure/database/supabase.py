@@ -11,6 +11,22 @@ from supabase import Client, create_client
 from src.config import get_settings
 
 
+def _create_client(url: str, key: str) -> Client:
+    """Supabase 클라이언트 생성 (DB 왕복 계측 설정 반영)"""
+    settings = get_settings()
+
+    # Storage API는 URL 끝에 슬래시가 필요함
+    url = url.rstrip("/") + "/"
+
+    # DB 왕복 계측 시 PostgREST/Storage/Auth 호출을 계측하는 클라이언트 사용
+    if settings.db_instrumentation_enabled:
+        from src.infrastructure.observability.instrumentation import InstrumentedSupabaseClient
+
+        return InstrumentedSupabaseClient.create(url, key)
+
+    return create_client(url, key)
+
+
 @lru_cache
 def get_supabase_client() -> Client:
     """
@@ -22,15 +38,35 @@ def get_supabase_client() -> Client:
     if not settings.supabase_url or not settings.supabase_key:
         raise ValueError("Supabase URL과 KEY가 환경 변수에 설정되어야 합니다")
 
-    # Storage API는 URL 끝에 슬래시가 필요함
-    supabase_url = settings.supabase_url.rstrip("/") + "/"
+    return _create_client(settings.supabase_url, settings.supabase_key)
+
+
+@lru_cache
+def get_supabase_replica_clients() -> tuple[Client, ...]:
+    """읽기 복제본 API 클라이언트 목록 반환 (SUPABASE_REPLICA_URLS 설정 시)"""
+    settings = get_settings()
+    return tuple(_create_client(url, settings.supabase_key) for url in settings.supabase_replica_urls_list)
+
+
+@lru_cache
+def get_routed_supabase_client() -> Client:
+    """
+    복제본 라우팅 Supabase 클라이언트 반환 (싱글톤)
+    복제본이 없으면 주 클라이언트를 그대로 반환
+    """
+    replicas = get_supabase_replica_clients()
+    if not replicas:
+        return get_supabase_client()
+
+    from src.infrastructure.database.routing import ReplicaRoutedClient
 
-    return create_client(supabase_url, settings.supabase_key)
+    return ReplicaRoutedClient(get_supabase_client(), list(replicas))
 
 
 def get_db() -> Client:
     """
     FastAPI 의존성 주입용 Supabase 클라이언트 제공
     각 요청마다 동일한 클라이언트 인스턴스 재사용
+    읽기 복제본 설정 시 읽기 전용 레포지토리 호출의 조회는 복제본으로 라우팅
     """
-    return get_supabase_client()
+    return get_routed_supabase_client()
@@ -9,33 +9,10 @@ Naver Geocoding Service
 import httpx
 from typing import Optional
 
-from pydantic import BaseModel
-
+from src.domain.value_objects.address import AddressSearchResult
 from src.shared.exceptions import InternalServerError
 
 
-class AddressSearchResult(BaseModel):
-    """
-    주소 검색 결과
-    네이버 Geocoding API 응답 파싱
-    """
-
-    address: str  # 도로명 주소
-    jibun_address: Optional[str] = None  # 지번 주소
-    latitude: float  # 위도
-    longitude: float  # 경도
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "address": "대구광역시 중구 동성로2가 123",
-                "jibun_address": "대구광역시 중구 동성로2가 123",
-                "latitude": 35.8580,
-                "longitude": 128.5980,
-            }
-        }
-
-
 class NaverGeocodingService:
     """
     네이버 클라우드 Maps API 통합 서비스
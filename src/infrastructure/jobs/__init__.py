@@ -0,0 +1,6 @@
+"""
+Background Jobs
+
+Postgres jobs 테이블 기반 백그라운드 작업 큐
+요청 처리 중 느린 부수 작업을 큐에 넣고 워커(python -m src.worker)가 처리
+"""
@@ -0,0 +1,35 @@
+"""
+Job Handlers
+
+작업 종류별 처리 함수
+핸들러는 작업을 잠근 연결에서 실행되며, 핸들러의 변경과 작업 완료 기록이 한 트랜잭션으로 커밋됨
+(재시도되어도 이미 완료된 변경이 다시 적용되지 않음)
+"""
+
+from typing import Any
+
+from sqlalchemy import Connection, text
+
+from src.infrastructure.jobs.queue import JobHandler
+
+# 여정 승인 포인트 지급
+CREDIT_TRIP_POINTS = "credit_trip_points"
+
+
+def credit_trip_points(connection: Connection, payload: dict[str, Any]) -> None:
+    """
+    여정 승인 포인트 지급
+    payload: {"trip_id": str, "user_id": str, "points": int}
+    """
+    result = connection.execute(
+        text("UPDATE users SET total_points = total_points + :points, updated_at = now() WHERE id = :user_id"),
+        {"user_id": payload["user_id"], "points": payload["points"]},
+    )
+    if result.rowcount == 0:
+        raise LookupError(f"사용자를 찾을 수 없습니다 (ID: {payload['user_id']})")
+
+
+# 작업 종류 → 핸들러
+HANDLERS: dict[str, JobHandler] = {
+    CREDIT_TRIP_POINTS: credit_trip_points,
+}
@@ -0,0 +1,167 @@
+"""
+Job Queue
+
+jobs 테이블을 큐로 사용
+- enqueue: INSERT 1회 (dedupe_key가 같은 작업은 한 번만 등록, 호출자 트랜잭션에 포함 가능)
+- run_next: FOR UPDATE SKIP LOCKED로 실행할 작업 1건을 잠그고 같은 트랜잭션에서 처리 후 완료 기록
+  (여러 워커가 동시에 꺼내도 같은 작업을 중복 처리하지 않음)
+- 실패 시 지수 백오프로 run_at을 미루고, max_attempts를 넘으면 failed로 전환
+
+핸들러는 작업을 잠근 연결을 그대로 받으므로 핸들러의 DB 변경과 완료 기록이 함께 커밋됨
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Connection, text
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 작업 핸들러: (작업을 잠근 연결, payload) → None
+JobHandler = Callable[[Connection, dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """작업 1건 처리 결과"""
+
+    job_id: int
+    kind: str
+    succeeded: bool
+    error: Optional[str] = None
+
+
+class JobQueue:
+    """Postgres jobs 테이블 작업 큐"""
+
+    def __init__(self, max_attempts: int, backoff_base_seconds: float, backoff_max_seconds: float):
+        """
+        Args:
+            max_attempts: 작업당 기본 최대 시도 횟수
+            backoff_base_seconds: 첫 재시도 대기 시간 (이후 2배씩 증가)
+            backoff_max_seconds: 재시도 대기 시간 상한
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """attempts번 실패한 작업의 다음 실행까지 대기 시간"""
+        return min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempts - 1))
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        dedupe_key: Optional[str] = None,
+        delay_seconds: float = 0,
+        connection: Optional[Connection] = None,
+    ) -> Optional[int]:
+        """
+        작업 등록
+
+        Args:
+            connection: 호출자의 트랜잭션 연결 (지정 시 그 트랜잭션의 변경과 함께 커밋/롤백)
+
+        Returns:
+            등록된 작업 ID (같은 dedupe_key 작업이 이미 있으면 None)
+        """
+        if connection is None:
+            from src.infrastructure.database.session import get_engine
+
+            with get_engine().begin() as connection:
+                return self.enqueue(kind, payload, dedupe_key, delay_seconds, connection)
+
+        return connection.execute(
+            text(
+                "INSERT INTO jobs (kind, payload, dedupe_key, max_attempts, run_at) "
+                "VALUES (:kind, CAST(:payload AS jsonb), :dedupe_key, :max_attempts, "
+                "now() + make_interval(secs => :delay_seconds)) "
+                "ON CONFLICT (dedupe_key) DO NOTHING "
+                "RETURNING id"
+            ),
+            {
+                "kind": kind,
+                "payload": json.dumps(payload),
+                "dedupe_key": dedupe_key,
+                "max_attempts": self.max_attempts,
+                "delay_seconds": delay_seconds,
+            },
+        ).scalar_one_or_none()
+
+    def run_next(self, handlers: dict[str, JobHandler]) -> Optional[JobResult]:
+        """
+        실행 가능한 작업 1건을 잠그고 처리
+
+        Returns:
+            처리 결과 (실행할 작업이 없으면 None)
+        """
+        from src.infrastructure.database.session import get_engine
+
+        with get_engine().begin() as connection:
+            job = connection.execute(
+                text(
+                    "SELECT id, kind, payload, attempts, max_attempts FROM jobs "
+                    "WHERE status = 'queued' AND run_at <= now() "
+                    "ORDER BY run_at, id "
+                    "FOR UPDATE SKIP LOCKED "
+                    "LIMIT 1"
+                )
+            ).first()
+            if job is None:
+                return None
+
+            attempts = job.attempts + 1
+            handler = handlers.get(job.kind)
+            try:
+                if handler is None:
+                    raise LookupError(f"등록되지 않은 작업 종류입니다: {job.kind}")
+                # 핸들러 실패 시 핸들러의 변경만 되돌리고 작업 잠금은 유지
+                with connection.begin_nested():
+                    handler(connection, job.payload)
+            except Exception as e:
+                error = f"{type(e).__name__}: {str(e)}"
+                exhausted = attempts >= job.max_attempts
+                connection.execute(
+                    text(
+                        "UPDATE jobs SET attempts = :attempts, last_error = :error, "
+                        "status = CASE WHEN :exhausted THEN 'failed' ELSE 'queued' END, "
+                        "run_at = now() + make_interval(secs => :backoff_seconds), updated_at = now() "
+                        "WHERE id = :id"
+                    ),
+                    {
+                        "id": job.id,
+                        "attempts": attempts,
+                        "error": error[:1000],
+                        "exhausted": exhausted,
+                        "backoff_seconds": self.backoff_seconds(attempts),
+                    },
+                )
+                log = logger.error if exhausted else logger.warning
+                log(f"작업 실패 (id={job.id}, kind={job.kind}, 시도={attempts}/{job.max_attempts}): {error}")
+                return JobResult(job_id=job.id, kind=job.kind, succeeded=False, error=error)
+
+            connection.execute(
+                text(
+                    "UPDATE jobs SET status = 'done', attempts = :attempts, last_error = NULL, updated_at = now() "
+                    "WHERE id = :id"
+                ),
+                {"id": job.id, "attempts": attempts},
+            )
+            return JobResult(job_id=job.id, kind=job.kind, succeeded=True)
+
+
+@lru_cache
+def get_job_queue() -> JobQueue:
+    """JobQueue 싱글톤 인스턴스 반환"""
+    settings = get_settings()
+    return JobQueue(
+        max_attempts=settings.job_max_attempts,
+        backoff_base_seconds=settings.job_backoff_base_seconds,
+        backoff_max_seconds=settings.job_backoff_max_seconds,
+    )
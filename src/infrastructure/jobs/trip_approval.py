@@ -0,0 +1,56 @@
+"""
+Trip Approval With Point Credit
+
+여정 승인(COMPLETED → APPROVED)과 포인트 지급 작업 등록을 한 트랜잭션으로 처리
+상태 전이만 커밋되고 작업 등록이 실패하면 재시도해도 "이미 승인됨"으로 거부되어
+포인트가 영영 지급되지 않으므로, 둘 중 하나가 실패하면 함께 롤백됨
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+
+from src.domain.entities.trip import Trip, TripStatus, allowed_from_states
+from src.infrastructure.jobs.handlers import CREDIT_TRIP_POINTS
+from src.infrastructure.jobs.queue import JobQueue
+
+# RETURNING 컬럼 (Trip 엔티티 필드)
+TRIP_COLUMNS = ", ".join(column.name for column in Trip.__table__.columns)
+
+
+def approve_trip_with_point_credit(queue: JobQueue, trip_id: UUID) -> Optional[Trip]:
+    """
+    조건부 UPDATE ... RETURNING으로 여정을 승인하고 같은 트랜잭션에서 포인트 지급 작업 등록
+    (작업 스레드에서 호출)
+
+    Returns:
+        승인된 Trip (현재 상태에서 승인할 수 없거나 여정이 없으면 None)
+    """
+    from src.infrastructure.database.session import get_engine
+
+    with get_engine().begin() as connection:
+        row = connection.execute(
+            text(
+                "UPDATE trips SET status = :to_status "
+                "WHERE id = :trip_id AND status = ANY(:from_statuses) "
+                f"RETURNING {TRIP_COLUMNS}"
+            ),
+            {
+                "trip_id": str(trip_id),
+                "to_status": TripStatus.APPROVED.value,
+                "from_statuses": [status.value for status in allowed_from_states(TripStatus.APPROVED)],
+            },
+        ).first()
+        if row is None:
+            return None
+
+        trip = Trip(**{**row._mapping, "status": TripStatus(row.status)})
+        if trip.points > 0:
+            queue.enqueue(
+                CREDIT_TRIP_POINTS,
+                {"trip_id": str(trip.id), "user_id": str(trip.user_id), "points": trip.points},
+                dedupe_key=f"{CREDIT_TRIP_POINTS}:{trip.id}",
+                connection=connection,
+            )
+        return trip
@@ -0,0 +1,138 @@
+"""
+Maintenance Tasks
+
+스케줄러로 주기 실행하는 유지보수 작업 목록
+- purge_idempotency_keys: 만료된 멱등성 키 삭제 (IDEMPOTENCY_BACKEND=postgres)
+- purge_rate_limit_counters: 지난 요청 한도 윈도 삭제 (RATE_LIMIT_BACKEND=postgres)
+- purge_finished_jobs: 보관 기간이 지난 완료 작업 삭제 (JOBS_ENABLED=True)
+- refresh_signed_urls: 만료 임박 Signed URL 갱신 (scripts/refresh_expired_signed_urls.py 실행,
+  SIGNED_URL_REFRESH_CRON 설정 시에만 등록 - 경로 변환 전 DB용)
+- check_coordinate_consistency: 역/주차장 latitude/longitude 컬럼과 location 일치 확인
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from src.config import Settings
+from src.infrastructure.scheduler import ScheduledTask
+
+project_root = Path(__file__).parent.parent.parent
+
+# latitude/longitude 컬럼과 location 좌표의 허용 오차 (도, 약 1cm)
+COORDINATE_TOLERANCE_DEGREES = 1e-7
+
+
+def _execute(sql: str, **params) -> None:
+    """SQLAlchemy 엔진으로 DML 1건 실행 (작업 스레드에서 호출)"""
+    from sqlalchemy import text
+
+    from src.infrastructure.database.session import get_engine
+
+    with get_engine().begin() as connection:
+        connection.execute(text(sql), params)
+
+
+async def purge_idempotency_keys() -> None:
+    """만료된 멱등성 키 삭제"""
+    await asyncio.to_thread(_execute, "DELETE FROM idempotency_keys WHERE expires_at <= now()")
+
+
+async def purge_rate_limit_counters() -> None:
+    """지난 요청 한도 윈도 삭제"""
+    await asyncio.to_thread(_execute, "DELETE FROM rate_limit_counters WHERE expires_at <= now()")
+
+
+def _purge_finished_jobs(retention_days: int):
+    async def purge_finished_jobs() -> None:
+        """보관 기간이 지난 완료(done) 작업 삭제 (failed 작업은 확인을 위해 유지)"""
+        await asyncio.to_thread(
+            _execute,
+            "DELETE FROM jobs WHERE status = 'done' AND updated_at < now() - make_interval(days => :days)",
+            days=retention_days,
+        )
+
+    return purge_finished_jobs
+
+
+async def refresh_signed_urls() -> None:
+    """만료 임박 Signed URL 갱신 스크립트를 별도 프로세스로 실행"""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(project_root / "scripts" / "refresh_expired_signed_urls.py"),
+        cwd=project_root,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+    if process.returncode != 0:
+        raise RuntimeError(f"exit {process.returncode}: {stderr.decode(errors='replace')[-500:]}")
+
+
+def _count_coordinate_mismatches(table: str) -> int:
+    """latitude/longitude 컬럼이 location과 다른 행 수 (한쪽만 NULL인 행 포함)"""
+    from sqlalchemy import text
+
+    from src.infrastructure.database.session import get_engine
+
+    sql = f"""
+        SELECT count(*) FROM {table}
+        WHERE (location IS NULL) <> (latitude IS NULL OR longitude IS NULL)
+           OR abs(ST_Y(location::geometry) - latitude) > :tolerance
+           OR abs(ST_X(location::geometry) - longitude) > :tolerance
+    """
+    with get_engine().connect() as connection:
+        return connection.execute(text(sql), {"tolerance": COORDINATE_TOLERANCE_DEGREES}).scalar_one()
+
+
+async def check_coordinate_consistency() -> None:
+    """
+    역/주차장 latitude/longitude 컬럼과 location 일치 확인
+    조회는 latitude/longitude 컬럼만 읽으므로, 트리거를 우회한 변경으로 어긋난 행이 있으면 실패로 기록
+    (복구: UPDATE <table> SET latitude = latitude WHERE ... 로 트리거를 다시 실행)
+    """
+    mismatches = {}
+    for table in ("stations", "parking_lots"):
+        count = await asyncio.to_thread(_count_coordinate_mismatches, table)
+        if count:
+            mismatches[table] = count
+    if mismatches:
+        details = ", ".join(f"{table} {count}건" for table, count in mismatches.items())
+        raise RuntimeError(f"좌표 컬럼과 location 불일치: {details}")
+
+
+def build_maintenance_tasks(settings: Settings) -> list[ScheduledTask]:
+    """설정에 맞는 유지보수 작업 목록 생성"""
+    jitter = settings.scheduler_jitter_seconds
+    tasks = []
+    if settings.idempotency_backend == "postgres":
+        tasks.append(ScheduledTask("purge_idempotency_keys", purge_idempotency_keys, cron="15 * * * *", jitter_seconds=jitter))
+    if settings.rate_limit_backend == "postgres":
+        tasks.append(ScheduledTask("purge_rate_limit_counters", purge_rate_limit_counters, interval_seconds=600, jitter_seconds=jitter))
+    if settings.jobs_enabled:
+        tasks.append(
+            ScheduledTask(
+                "purge_finished_jobs",
+                _purge_finished_jobs(settings.job_retention_days),
+                cron="30 4 * * *",
+                jitter_seconds=jitter,
+            )
+        )
+    if settings.signed_url_refresh_cron:
+        tasks.append(
+            ScheduledTask("refresh_signed_urls", refresh_signed_urls, cron=settings.signed_url_refresh_cron, jitter_seconds=jitter)
+        )
+    if settings.coordinate_check_cron:
+        tasks.append(
+            ScheduledTask(
+                "check_coordinate_consistency",
+                check_coordinate_consistency,
+                cron=settings.coordinate_check_cron,
+                jitter_seconds=jitter,
+            )
+        )
+    return tasks
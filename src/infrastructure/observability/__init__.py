@@ -0,0 +1,5 @@
+"""
+Observability Infrastructure
+
+요청 지연 시간 및 DB 왕복(round trip) 메트릭 수집 구성 요소
+"""
@@ -0,0 +1,129 @@
+"""
+DB Round Trip Instrumentation
+
+SQLAlchemy Engine 이벤트 훅과 Supabase 클라이언트(httpx) 이벤트 훅으로
+DB 왕복을 query_log 모듈에 기록 (메트릭, 느린 쿼리 로그, 요청 트레이스)
+"""
+
+import time
+
+import httpx
+from postgrest import SyncPostgrestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from storage3 import SyncStorageClient
+from supabase import Client
+
+from src.infrastructure.observability.metrics import (
+    BACKEND_AUTH,
+    BACKEND_POSTGREST,
+    BACKEND_SQLALCHEMY,
+    BACKEND_STORAGE,
+)
+from src.infrastructure.observability.query_log import (
+    describe_http_params,
+    describe_sql_params,
+    record_query,
+)
+
+# httpx Request.extensions에 요청 시작 시각을 저장할 키
+_STARTED_AT_KEY = "ecopass_started_at"
+
+
+# ============================================================================
+# SQLAlchemy
+# ============================================================================
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """쿼리 실행 시작 시각 기록"""
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """쿼리 실행 완료 시 왕복 1회 기록"""
+    started_at = conn.info["query_started_at"].pop()
+    record_query(
+        BACKEND_SQLALCHEMY,
+        statement,
+        lambda: describe_sql_params(parameters, executemany),
+        started_at,
+        time.perf_counter() - started_at,
+    )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    SQLAlchemy Engine에 쿼리 계측 이벤트 훅 등록
+    init_db()에서 Engine 생성 직후 호출
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ============================================================================
+# Supabase (PostgREST / Storage / Auth HTTP API)
+# ============================================================================
+
+
+def _make_hooks(backend: str):
+    """백엔드 라벨이 고정된 httpx request/response 이벤트 훅 생성"""
+
+    def on_request(request: httpx.Request) -> None:
+        request.extensions[_STARTED_AT_KEY] = time.perf_counter()
+
+    def on_response(response: httpx.Response) -> None:
+        request = response.request
+        started_at = request.extensions.get(_STARTED_AT_KEY)
+        if started_at is None:
+            return
+        record_query(
+            backend,
+            f"{request.method} {request.url.path}",
+            lambda: describe_http_params(
+                request.url.params,
+                int(request.headers.get("content-length", 0)),
+            ),
+            started_at,
+            time.perf_counter() - started_at,
+        )
+
+    return on_request, on_response
+
+
+def _instrument_http_client(http_client: httpx.Client, backend: str) -> None:
+    """httpx 클라이언트에 계측 훅 추가 (이미 추가된 경우 무시)"""
+    if getattr(http_client, "_ecopass_instrumented", False):
+        return
+    on_request, on_response = _make_hooks(backend)
+    http_client.event_hooks["request"].append(on_request)
+    http_client.event_hooks["response"].append(on_response)
+    http_client._ecopass_instrumented = True
+
+
+class InstrumentedSupabaseClient(Client):
+    """
+    DB 왕복을 계측하는 Supabase 클라이언트
+
+    PostgREST(/rest), Storage(/storage), Auth(/auth) 호출을 각각 구분하여 기록
+    로그인 등 인증 이벤트 시 PostgREST/Storage 하위 클라이언트가 재생성되므로
+    하위 클라이언트에 접근할 때마다 계측 여부를 확인
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _instrument_http_client(self.auth._http_client, BACKEND_AUTH)
+
+    @property
+    def postgrest(self) -> SyncPostgrestClient:
+        client = super().postgrest
+        _instrument_http_client(client.session, BACKEND_POSTGREST)
+        return client
+
+    @property
+    def storage(self) -> SyncStorageClient:
+        client = super().storage
+        _instrument_http_client(client.session, BACKEND_STORAGE)
+        return client
@@ -0,0 +1,235 @@
+"""
+Metrics Registry
+
+Prometheus 텍스트 포맷으로 노출되는 프로세스 단위 메트릭 (Counter, Histogram)
+외부 라이브러리 없이 라벨별 값을 메모리에 누적하며 `/metrics` 엔드포인트에서 렌더링
+"""
+
+import bisect
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+# 요청 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 DB 왕복 횟수 버킷 (N+1 패턴 감지용)
+ROUND_TRIP_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 주기 작업 실행 시간 히스토그램 버킷 (초)
+SCHEDULED_TASK_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+# DB 왕복 구분 (SQLAlchemy 직접 연결 / Supabase HTTP API)
+BACKEND_SQLALCHEMY = "sqlalchemy"
+BACKEND_POSTGREST = "postgrest"
+BACKEND_STORAGE = "storage"
+BACKEND_AUTH = "auth"
+
+
+def _escape_label(value: str) -> str:
+    """라벨 값의 역슬래시/따옴표/개행 이스케이프"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    """라벨 이름/값을 Prometheus 라벨 문자열로 변환"""
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """정수 값은 소수점 없이 출력"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """단조 증가 카운터 메트릭"""
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """라벨 조합의 값을 amount만큼 증가"""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> list[str]:
+        """Prometheus 텍스트 포맷 라인 목록 반환"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """누적 버킷 히스토그램 메트릭"""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합 → [버킷별 카운트..., 합계, 전체 카운트]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """관측값 기록"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(label_values)
+            if state is None:
+                state = self._values[label_values] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> list[str]:
+        """Prometheus 텍스트 포맷 라인 목록 반환 (버킷은 누적값으로 출력)"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, list(state)) for labels, state in self._values.items())
+        for label_values, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                labels = _format_labels(self.label_names, label_values, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.label_names, label_values, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {_format_value(state[-1])}")
+            plain = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{plain} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{plain} {_format_value(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음 (등록 순서대로 렌더링)"""
+
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+
+    def register(self, metric):
+        """메트릭 등록 후 그대로 반환"""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """전체 메트릭을 Prometheus 텍스트 포맷으로 렌더링"""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(
+    Counter(
+        "http_requests_total",
+        "처리된 HTTP 요청 수",
+        ("method", "route", "status"),
+    )
+)
+http_request_duration_seconds = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "라우트별 HTTP 요청 처리 시간 (초)",
+        ("method", "route"),
+    )
+)
+http_request_db_round_trips = registry.register(
+    Histogram(
+        "http_request_db_round_trips",
+        "HTTP 요청 1건당 DB 왕복 횟수 (백엔드별)",
+        ("method", "route", "backend"),
+        buckets=ROUND_TRIP_BUCKETS,
+    )
+)
+db_round_trips_total = registry.register(
+    Counter(
+        "db_round_trips_total",
+        "DB 왕복 횟수 (요청 외부 호출 포함)",
+        ("backend",),
+    )
+)
+db_round_trip_duration_seconds = registry.register(
+    Histogram(
+        "db_round_trip_duration_seconds",
+        "DB 왕복 1회 소요 시간 (초)",
+        ("backend",),
+    )
+)
+scheduled_task_runs_total = registry.register(
+    Counter(
+        "scheduled_task_runs_total",
+        "주기 작업 실행 결과 수 (success/failure/skipped)",
+        ("task", "result"),
+    )
+)
+scheduled_task_duration_seconds = registry.register(
+    Histogram(
+        "scheduled_task_duration_seconds",
+        "주기 작업 1회 실행 시간 (초)",
+        ("task",),
+        buckets=SCHEDULED_TASK_BUCKETS,
+    )
+)
+
+
+# ============================================================================
+# 요청 단위 DB 왕복 집계
+# ============================================================================
+
+
+@dataclass
+class RequestStats:
+    """한 요청 동안 발생한 백엔드별 DB 왕복 횟수"""
+
+    round_trips: dict[str, int] = field(default_factory=dict)
+
+
+_current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+def start_request_stats() -> tuple[RequestStats, object]:
+    """
+    현재 컨텍스트에 요청 단위 집계 시작
+    반환된 토큰은 end_request_stats()에 전달
+    """
+    stats = RequestStats()
+    return stats, _current_request_stats.set(stats)
+
+
+def end_request_stats(token) -> None:
+    """요청 단위 집계 종료"""
+    _current_request_stats.reset(token)
+
+
+def record_round_trip(backend: str, duration: float) -> None:
+    """
+    DB 왕복 1회 기록
+    전역 카운터/히스토그램에 누적하고, 요청 처리 중이면 요청 단위 집계에도 반영
+    """
+    db_round_trips_total.inc(backend)
+    db_round_trip_duration_seconds.observe(duration, backend)
+
+    stats = _current_request_stats.get()
+    if stats is not None:
+        stats.round_trips[backend] = stats.round_trips.get(backend, 0) + 1
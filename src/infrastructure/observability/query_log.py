@@ -0,0 +1,186 @@
+"""
+Slow Query Log / Query Trace
+
+SQLAlchemy 쿼리와 Supabase(PostgREST 등) HTTP 호출을 하나의 쿼리 이벤트로 기록
+- 임계값을 넘는 쿼리는 SQL/요청 경로, 파라미터 형태, 소요 시간, 호출한 레포지토리 메서드와 함께 경고 로그
+- 요청 단위 트레이스가 활성화되어 있으면 쿼리 타임라인에 추가
+
+파라미터는 값이 아닌 형태(이름/타입)만 기록하여 개인정보가 로그에 남지 않도록 함
+"""
+
+import logging
+import sys
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.config import get_settings
+from src.infrastructure.observability.metrics import record_round_trip
+
+logger = logging.getLogger(__name__)
+
+# 로그에 남길 SQL 최대 길이
+MAX_STATEMENT_LENGTH = 1000
+
+# 호출 위치로 인정할 모듈 경로 (레포지토리 구현체)
+REPOSITORY_MODULE_PREFIX = "src.infrastructure.repositories."
+
+
+@dataclass
+class QueryEvent:
+    """쿼리(DB 왕복) 1건의 기록"""
+
+    backend: str
+    statement: str
+    params_shape: str
+    started_at: float
+    duration: float
+    origin: Optional[str]
+
+
+class QueryTrace:
+    """요청 1건 동안 발생한 쿼리 타임라인"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.events: list[QueryEvent] = []
+
+    @property
+    def total_duration(self) -> float:
+        """쿼리 소요 시간 합계 (초)"""
+        return sum(event.duration for event in self.events)
+
+    def format_timeline(self) -> str:
+        """로그 출력용 타임라인 문자열 (요청 시작 기준 오프셋, 소요 시간, 백엔드, 쿼리, 호출 위치)"""
+        lines = []
+        for index, event in enumerate(self.events, start=1):
+            offset_ms = (event.started_at - self.started_at) * 1000
+            lines.append(
+                f"  #{index} +{offset_ms:.1f}ms {event.duration * 1000:.1f}ms [{event.backend}] "
+                f"{event.statement} params={event.params_shape} origin={event.origin or '-'}"
+            )
+        return "\n".join(lines)
+
+
+_current_trace: ContextVar[Optional[QueryTrace]] = ContextVar("current_query_trace", default=None)
+
+
+@lru_cache
+def get_slow_query_threshold() -> Optional[float]:
+    """
+    느린 쿼리 임계값 (초) 반환, 0 이하로 설정되면 None (느린 쿼리 로그 비활성)
+    """
+    threshold_ms = get_settings().slow_query_threshold_ms
+    return threshold_ms / 1000 if threshold_ms > 0 else None
+
+
+def start_trace() -> tuple[QueryTrace, object]:
+    """
+    현재 컨텍스트에서 쿼리 트레이스 시작
+    반환된 토큰은 end_trace()에 전달
+    """
+    trace = QueryTrace()
+    return trace, _current_trace.set(trace)
+
+
+def end_trace(token) -> None:
+    """쿼리 트레이스 종료"""
+    _current_trace.reset(token)
+
+
+def find_repository_origin() -> Optional[str]:
+    """
+    호출 스택에서 쿼리를 발생시킨 레포지토리 메서드 탐색
+    예: "SupbaseTripRepository.get_by_id"
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(REPOSITORY_MODULE_PREFIX):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            return f"{type(owner).__name__}.{name}" if owner is not None else f"{module}.{name}"
+        frame = frame.f_back
+    return None
+
+
+def describe_sql_params(parameters: Any, executemany: bool = False) -> str:
+    """
+    SQLAlchemy 바인드 파라미터의 형태 설명 (값은 포함하지 않음)
+    예: "{id_1: UUID, param_1: int}", "[3 rows x {id: str}]"
+    """
+    if parameters is None:
+        return "-"
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = describe_sql_params(parameters[0]) if parameters else "-"
+        return f"[{len(parameters)} rows x {first}]"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+def describe_http_params(query_params, body_size: int) -> str:
+    """
+    PostgREST 요청 파라미터의 형태 설명 (필터 값은 연산자만 남김)
+    예: "select, id=eq, status=in, order, limit body=0B"
+    """
+    parts = []
+    for key, value in query_params.multi_items():
+        if key in ("select", "order", "limit", "offset", "on_conflict", "columns"):
+            parts.append(key)
+        elif key in ("or", "and"):
+            parts.append(f"{key}=(...)")
+        else:
+            operator = value.split(".", 1)[0] if "." in value else "?"
+            parts.append(f"{key}={operator}")
+    return (", ".join(parts) or "-") + f" body={body_size}B"
+
+
+def record_query(
+    backend: str,
+    statement: str,
+    params_shape_factory,
+    started_at: float,
+    duration: float,
+) -> None:
+    """
+    쿼리 1건 기록
+
+    - 메트릭(DB 왕복 횟수/시간)에 항상 반영
+    - 느린 쿼리 또는 트레이스 활성 시에만 파라미터 형태와 호출 위치를 계산 (평상시 오버헤드 최소화)
+
+    Args:
+        params_shape_factory: 파라미터 형태 문자열을 반환하는 함수 (필요할 때만 호출)
+    """
+    record_round_trip(backend, duration)
+
+    trace = _current_trace.get()
+    threshold = get_slow_query_threshold()
+    is_slow = threshold is not None and duration >= threshold
+    if trace is None and not is_slow:
+        return
+
+    if len(statement) > MAX_STATEMENT_LENGTH:
+        statement = statement[:MAX_STATEMENT_LENGTH] + "..."
+
+    event = QueryEvent(
+        backend=backend,
+        statement=" ".join(statement.split()),
+        params_shape=params_shape_factory(),
+        started_at=started_at,
+        duration=duration,
+        origin=find_repository_origin(),
+    )
+
+    if trace is not None:
+        trace.events.append(event)
+
+    if is_slow:
+        logger.warning(
+            f"느린 쿼리 감지 ({event.duration * 1000:.1f}ms, backend={event.backend}, "
+            f"origin={event.origin or '-'}): {event.statement} params={event.params_shape}"
+        )
@@ -0,0 +1,168 @@
+"""
+Rate Limiter
+
+라우트별 요청 한도를 키(사용자 ID 또는 IP) 단위로 적용
+- TokenBucketLimiter: 프로세스 단위 토큰 버킷 (이벤트 루프 단일 스레드에서만 갱신되므로 락 불필요)
+- PostgresWindowCounter: rate_limit_counters 테이블 고정 윈도 카운터 (여러 워커/인스턴스가 한도 공유)
+
+공유 카운터는 로컬 버킷을 통과한 요청에만 조회하므로 폭주 트래픽은 DB에 닿기 전에 걸러짐
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """요청 허용 여부와 재시도 대기 시간"""
+
+    allowed: bool
+    retry_after_seconds: int = 0
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """토큰 버킷 상태 (정책별 채움 속도와 용량을 버킷에 보관)"""
+
+    tokens: float
+    updated_at: float
+    rate: float
+    capacity: float
+
+    def refill(self, now: float) -> float:
+        """now 시점의 토큰 수"""
+        return min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+
+
+class TokenBucketLimiter:
+    """
+    키별 토큰 버킷
+    limit개의 토큰이 window_seconds에 걸쳐 균등하게 다시 채워짐 (순간 최대 limit건 허용)
+    버킷은 최근 사용 순(LRU)으로 보관하여 max_keys 초과 시 가장 오래 쓰지 않은 버킷부터 O(1)로 제거
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        """
+        Args:
+            max_keys: 보관할 최대 버킷 수 (초과 시 가장 오래 쓰지 않은 버킷부터 정리)
+        """
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, _Bucket] = OrderedDict()
+
+    def acquire(self, key: str, limit: int, window_seconds: float) -> RateLimitDecision:
+        """토큰 1개 사용 시도"""
+        now = time.monotonic()
+        rate = limit / window_seconds
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._evict(now)
+            bucket = self._buckets[key] = _Bucket(
+                tokens=float(limit), updated_at=now, rate=rate, capacity=float(limit)
+            )
+        else:
+            self._buckets.move_to_end(key)
+
+        tokens = bucket.refill(now)
+        bucket.updated_at = now
+
+        if tokens >= 1:
+            bucket.tokens = tokens - 1
+            return RateLimitDecision(allowed=True)
+
+        bucket.tokens = tokens
+        return RateLimitDecision(allowed=False, retry_after_seconds=max(1, math.ceil((1 - tokens) / rate)))
+
+    def reset(self) -> None:
+        """모든 버킷 제거"""
+        self._buckets.clear()
+
+    def _evict(self, now: float) -> None:
+        """
+        가장 오래 쓰지 않은 버킷 1개를 제거하고,
+        이어지는 버킷 중 다시 가득 찬(= 제거해도 한도에 영향 없는) 버킷도 함께 정리
+        """
+        self._buckets.popitem(last=False)
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if bucket.refill(now) < bucket.capacity:
+                break
+            del self._buckets[key]
+
+
+class PostgresWindowCounter:
+    """
+    rate_limit_counters 테이블 고정 윈도 카운터
+    (키, 윈도 시작 시각) 행을 INSERT ... ON CONFLICT DO UPDATE로 1회 왕복에 증가시키고 결과 카운트로 판단
+    """
+
+    async def acquire(self, key: str, limit: int, window_seconds: float) -> RateLimitDecision:
+        """공유 카운터 1 증가 (조회 실패 시 허용)"""
+        window = int(window_seconds)
+        window_start = int(time.time()) // window * window
+        try:
+            count = await asyncio.to_thread(self._increment, key, window_start, window)
+        except Exception as e:
+            logger.warning(f"공유 요청 한도 카운터 갱신 실패: {str(e)}")
+            return RateLimitDecision(allowed=True)
+
+        if count <= limit:
+            return RateLimitDecision(allowed=True)
+        return RateLimitDecision(
+            allowed=False,
+            retry_after_seconds=max(1, window_start + window - int(time.time())),
+        )
+
+    def _increment(self, key: str, window_start: int, window: int) -> int:
+        from sqlalchemy import text
+
+        from src.infrastructure.database.session import get_engine
+
+        with get_engine().begin() as connection:
+            return connection.execute(
+                text(
+                    "INSERT INTO rate_limit_counters (key, window_start, expires_at, count) "
+                    "VALUES (:key, to_timestamp(:window_start), to_timestamp(:window_end), 1) "
+                    "ON CONFLICT (key, window_start) DO UPDATE SET count = rate_limit_counters.count + 1 "
+                    "RETURNING count"
+                ),
+                {"key": key, "window_start": window_start, "window_end": window_start + window},
+            ).scalar_one()
+
+
+class RateLimiter:
+    """로컬 토큰 버킷 + (선택) 공유 카운터"""
+
+    def __init__(self, local: TokenBucketLimiter, shared: Optional[PostgresWindowCounter] = None):
+        self.local = local
+        self.shared = shared
+
+    async def acquire(self, key: str, limit: int, window_seconds: float) -> RateLimitDecision:
+        """로컬 버킷을 먼저 확인하고 통과한 요청만 공유 카운터 확인"""
+        decision = self.local.acquire(key, limit, window_seconds)
+        if not decision.allowed or self.shared is None:
+            return decision
+        return await self.shared.acquire(key, limit, window_seconds)
+
+
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    """설정(rate_limit_backend)에 맞는 RateLimiter 싱글톤 반환"""
+    settings = get_settings()
+    shared = (
+        PostgresWindowCounter()
+        if settings.rate_limit_backend == "postgres" and settings.database_url
+        else None
+    )
+    return RateLimiter(local=TokenBucketLimiter(), shared=shared)
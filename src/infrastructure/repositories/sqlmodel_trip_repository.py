@@ -4,15 +4,42 @@ SQLModel Trip Repository Implementation
 SQLModel Session을 사용한 Trip 데이터 접근 구현
 """
 
-from typing import Optional
+import json
+from typing import Any, Optional
 from uuid import UUID
 
+from sqlalchemy import func, literal_column, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from sqlmodel import Session, select
 
-from src.domain.entities.trip import Trip, TripStatus
-from src.domain.repositories.trip_repository import ITripRepository
+from src.domain.entities.trip import Trip, TripStatus, allowed_from_states
+from src.domain.repositories.trip_repository import ACTIVE_TRIP_UNIQUE_INDEX, CountMode, ITripRepository
+from src.domain.value_objects.trip_summary import TRIP_SUMMARY_COLUMNS, TripSummary
+from src.infrastructure.database.routing import route_reads
+from src.shared.exceptions import ConflictError
 
+# count="estimated"에서 정확한 개수를 계산하는 플래너 추정치 상한
+# (Supabase PostgREST의 기본 max_rows와 같은 값, 이를 넘으면 추정치 반환)
+ESTIMATED_COUNT_EXACT_LIMIT = 1000
 
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement> (실행하지 않고 플래너 추정치만 조회)"""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON)
+def _compile_explain_json(element: _ExplainJSON, compiler, **kwargs) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kwargs)
+
+
+@route_reads
 class SQLModelTripRepository(ITripRepository):
     """
     SQLModel을 사용한 Trip Repository 구현
@@ -28,12 +55,43 @@ class SQLModelTripRepository(ITripRepository):
     async def create(self, trip: Trip) -> Trip:
         """
         새로운 여행 생성
+        진행 중 여행 유일성은 부분 유니크 인덱스가 보장
         """
         self.session.add(trip)
-        self.session.commit()
+        try:
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            if ACTIVE_TRIP_UNIQUE_INDEX in str(e.orig):
+                raise ConflictError("이미 진행 중인 여행이 있습니다")
+            raise
         self.session.refresh(trip)
         return trip
 
+    async def transition(
+        self,
+        trip_id: UUID,
+        to_status: TripStatus,
+        changes: dict[str, Any],
+        user_id: Optional[UUID] = None,
+    ) -> Optional[Trip]:
+        """
+        조건부 상태 전이 (UPDATE ... RETURNING)
+        """
+        statement = (
+            update(Trip)
+            .where(Trip.id == trip_id)
+            .where(Trip.status.in_([status.value for status in allowed_from_states(to_status)]))
+            .values(**changes, status=to_status.value)
+            .returning(Trip)
+        )
+        if user_id is not None:
+            statement = statement.where(Trip.user_id == user_id)
+
+        trip = self.session.exec(statement).scalars().first()
+        self.session.commit()
+        return trip
+
     async def get_by_id(self, trip_id: UUID) -> Optional[Trip]:
         """
         ID로 특정 여행 조회
@@ -60,6 +118,151 @@ class SQLModelTripRepository(ITripRepository):
         statement = statement.order_by(Trip.created_at.desc()).offset(offset).limit(limit)
         return list(self.session.exec(statement).all())
 
+    def _get_page(
+        self,
+        conditions: list,
+        count: Optional[CountMode],
+        limit: int,
+        offset: int,
+        summary: bool = False,
+    ) -> tuple[list, Optional[int]]:
+        """
+        조건에 맞는 여행 목록과 전체 개수 조회
+        - exact: count(*) OVER ()로 목록과 정확한 개수를 한 번에 조회
+        - planned: 목록만 조회하고 개수는 플래너 추정치 (EXPLAIN, 조건 스캔 없음)
+        - estimated: 추정치가 ESTIMATED_COUNT_EXACT_LIMIT 이하이면 exact, 넘으면 planned
+        summary=True면 TRIP_SUMMARY_COLUMNS만 조회하여 TripSummary 목록 반환
+        """
+        if count in ("planned", "estimated"):
+            planned_count = self._planned_count(conditions)
+            if count == "planned" or planned_count > ESTIMATED_COUNT_EXACT_LIMIT:
+                items, _ = self._get_page(conditions, None, limit, offset, summary)
+                return items, planned_count
+            count = "exact"
+
+        columns = [getattr(Trip, name) for name in TRIP_SUMMARY_COLUMNS] if summary else [Trip]
+        if count is not None:
+            columns.append(func.count().over().label("total_count"))
+
+        statement = (
+            select(*columns).where(*conditions).order_by(Trip.created_at.desc()).offset(offset).limit(limit)
+        )
+        rows = self.session.exec(statement).all()
+
+        if summary:
+            items = [TripSummary.from_row(row._mapping) for row in rows]
+        elif count is not None:
+            items = [row[0] for row in rows]
+        else:
+            items = list(rows)
+
+        if count is None:
+            return items, None
+        if rows:
+            return items, rows[0].total_count
+        if offset == 0:
+            return [], 0
+
+        # 마지막 페이지를 넘어선 offset: 윈도 집계 결과가 없으므로 개수만 따로 조회
+        total_count = self.session.exec(select(func.count()).select_from(Trip).where(*conditions)).one()
+        return [], total_count
+
+    def _planned_count(self, conditions: list) -> int:
+        """
+        조건에 맞는 여행 수의 플래너 추정치 (EXPLAIN의 최상위 Plan Rows)
+        타입 없는 컬럼을 조회하여 EXPLAIN 결과(json)에 엔티티 컬럼 타입 변환이 적용되지 않게 함
+        """
+        statement = select(literal_column("1")).select_from(Trip).where(*conditions)
+        plan = self.session.execute(_ExplainJSON(statement)).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def get_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TripStatus] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        사용자 ID로 여행 목록과 전체 개수 조회
+        """
+        conditions = [Trip.user_id == user_id]
+        if status is not None:
+            conditions.append(Trip.status == status.value)
+
+        return self._get_page(conditions, count, limit, offset)
+
+    async def get_summary_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TripStatus] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        사용자 ID로 여행 요약 목록과 전체 개수 조회 (요약 컬럼만 조회)
+        """
+        conditions = [Trip.user_id == user_id]
+        if status is not None:
+            conditions.append(Trip.status == status.value)
+
+        return self._get_page(conditions, count, limit, offset, summary=True)
+
+    async def get_page_with_filters(
+        self,
+        status: Optional[TripStatus] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        필터를 적용하여 여행 목록과 전체 개수 조회 (관리자용)
+        """
+        conditions = self._filter_conditions(status, user_id, start_date, end_date)
+        return self._get_page(conditions, count, limit, offset)
+
+    async def get_summary_page_with_filters(
+        self,
+        status: Optional[TripStatus] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        필터를 적용하여 여행 요약 목록과 전체 개수 조회 (관리자용, 요약 컬럼만 조회)
+        """
+        conditions = self._filter_conditions(status, user_id, start_date, end_date)
+        return self._get_page(conditions, count, limit, offset, summary=True)
+
+    @staticmethod
+    def _filter_conditions(
+        status: Optional[TripStatus],
+        user_id: Optional[UUID],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> list:
+        """상태, 사용자, 날짜 범위 필터 조건 목록"""
+        conditions = []
+        if status is not None:
+            conditions.append(Trip.status == status.value)
+        if user_id is not None:
+            conditions.append(Trip.user_id == user_id)
+        if start_date:
+            conditions.append(Trip.created_at >= start_date)
+        if end_date:
+            conditions.append(Trip.created_at <= end_date)
+        return conditions
+
     async def get_active_trip(self, user_id: UUID) -> Optional[Trip]:
         """
         사용자의 활성 여행 조회 (DRIVING 또는 TRANSFERRED)
@@ -121,6 +324,30 @@ class SQLModelTripRepository(ITripRepository):
         )
         return list(self.session.exec(statement).all())
 
+    async def get_page_by_status(
+        self,
+        status: TripStatus,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        특정 상태의 여행 목록과 전체 개수 조회 (관리자용)
+        """
+        return self._get_page([Trip.status == status.value], count, limit, offset)
+
+    async def get_summary_page_by_status(
+        self,
+        status: TripStatus,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        특정 상태의 여행 요약 목록과 전체 개수 조회 (관리자용, 요약 컬럼만 조회)
+        """
+        return self._get_page([Trip.status == status.value], count, limit, offset, summary=True)
+
     async def count_by_status(self, status: TripStatus) -> int:
         """
         특정 상태의 여행 개수 조회 (관리자용)
@@ -8,22 +8,32 @@ PostGIS 좌표를 ORM으로 처리, latitude/longitude 컬럼과 트리거를 
 from typing import Optional
 from uuid import UUID
 
-from geoalchemy2.functions import ST_X, ST_Y
-from geoalchemy2.types import Geometry
-from sqlalchemy import cast
+from sqlalchemy import Integer, cast, func, insert, literal_column, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel import Session, select
 
 from src.domain.entities.parking_lot import ParkingLot
 from src.domain.entities.station import Station
 from src.domain.repositories.station_repository import IStationRepository
-
-
+from src.domain.value_objects.catalog_import import (
+    CatalogUpsertOutcome,
+    ParkingLotImportRow,
+    StationImportRow,
+)
+from src.domain.value_objects.catalog_version import CatalogVersion
+from src.infrastructure.cache.catalog_version_cache import get_catalog_version_cache
+from src.infrastructure.cache.station_search_index import get_station_search_index_cache
+from src.infrastructure.database.routing import route_reads
+
+
+@route_reads
 class SQLModelStationRepository(IStationRepository):
     """
     SQLModel/SQLAlchemy를 사용한 Station Repository 구현
 
-    PostGIS geography(Point) 타입의 좌표를 ORM으로 처리하여 latitude/longitude 제공
-    latitude/longitude 컬럼에 CRUD 수행 시 트리거가 location 자동 동기화
+    latitude/longitude 컬럼에 CRUD 수행 시 트리거가 location(PostGIS geography) 자동 동기화
+    조회는 저장된 latitude/longitude 컬럼을 그대로 읽음 (행마다 ST_X/ST_Y 계산 없음,
+    location과의 일치 여부는 check_coordinate_consistency 주기 작업이 확인)
     """
 
     def __init__(self, session: Session):
@@ -38,23 +48,26 @@ class SQLModelStationRepository(IStationRepository):
     ) -> list[Station]:
         """
         모든 지하철 역 조회 (선택적으로 노선별 필터링, 키워드 검색 및 페이지네이션)
-        PostGIS 좌표를 latitude/longitude로 변환하여 반환
+        키워드 검색은 메모리 검색 인덱스로 관련도순 정렬 (초성/오타 허용, 카탈로그 변경 시에만 DB 재조회)
         """
+        if keyword is not None:
+            index = await get_station_search_index_cache().get(loader=self.get_all)
+            stations = index.search(keyword, line_number=line_number)
+            start = offset or 0
+            return stations[start : start + limit if limit is not None else None]
+
         stmt = select(
             Station.id,
             Station.name,
             Station.line_number,
             Station.created_at,
-            ST_Y(cast(Station.location, Geometry)).label("latitude"),
-            ST_X(cast(Station.location, Geometry)).label("longitude"),
+            Station.latitude,
+            Station.longitude,
         )
 
         if line_number is not None:
             stmt = stmt.where(Station.line_number == line_number)
 
-        if keyword is not None:
-            stmt = stmt.where(Station.name.ilike(f"%{keyword}%"))
-
         stmt = stmt.order_by(Station.name)
 
         if limit is not None:
@@ -85,8 +98,8 @@ class SQLModelStationRepository(IStationRepository):
             Station.name,
             Station.line_number,
             Station.created_at,
-            ST_Y(cast(Station.location, Geometry)).label("latitude"),
-            ST_X(cast(Station.location, Geometry)).label("longitude"),
+            Station.latitude,
+            Station.longitude,
         ).where(Station.id == station_id)
 
         result = self.session.exec(stmt)
@@ -115,8 +128,8 @@ class SQLModelStationRepository(IStationRepository):
                 ParkingLot.distance_to_station_m,
                 ParkingLot.fee_info,
                 ParkingLot.created_at,
-                ST_Y(cast(ParkingLot.location, Geometry)).label("latitude"),
-                ST_X(cast(ParkingLot.location, Geometry)).label("longitude"),
+                ParkingLot.latitude,
+                ParkingLot.longitude,
             )
             .where(ParkingLot.station_id == station_id)
             .order_by(ParkingLot.distance_to_station_m)
@@ -140,6 +153,64 @@ class SQLModelStationRepository(IStationRepository):
             for row in rows
         ]
 
+    async def get_with_parking_lots(self, station_id: UUID) -> Optional[tuple[Station, list[ParkingLot]]]:
+        """
+        역과 주차장 목록 조회 (LEFT JOIN 1회)
+        주차장이 없는 역도 역 정보 1행이 반환되며, 주차장 컬럼은 NULL
+        """
+        stmt = (
+            select(
+                Station.id,
+                Station.name,
+                Station.line_number,
+                Station.created_at,
+                Station.latitude,
+                Station.longitude,
+                ParkingLot.id.label("parking_lot_id"),
+                ParkingLot.name.label("parking_lot_name"),
+                ParkingLot.address.label("parking_lot_address"),
+                ParkingLot.latitude.label("parking_lot_latitude"),
+                ParkingLot.longitude.label("parking_lot_longitude"),
+                ParkingLot.distance_to_station_m,
+                ParkingLot.fee_info,
+                ParkingLot.created_at.label("parking_lot_created_at"),
+            )
+            .select_from(Station)
+            .outerjoin(ParkingLot, ParkingLot.station_id == Station.id)
+            .where(Station.id == station_id)
+            .order_by(ParkingLot.distance_to_station_m)
+        )
+
+        rows = self.session.exec(stmt).all()
+        if not rows:
+            return None
+
+        first = rows[0]
+        station = Station(
+            id=first.id,
+            name=first.name,
+            line_number=first.line_number,
+            latitude=first.latitude,
+            longitude=first.longitude,
+            created_at=first.created_at,
+        )
+        parking_lots = [
+            ParkingLot(
+                id=row.parking_lot_id,
+                station_id=row.id,
+                name=row.parking_lot_name,
+                address=row.parking_lot_address,
+                latitude=row.parking_lot_latitude,
+                longitude=row.parking_lot_longitude,
+                distance_to_station_m=row.distance_to_station_m,
+                fee_info=row.fee_info,
+                created_at=row.parking_lot_created_at,
+            )
+            for row in rows
+            if row.parking_lot_id is not None
+        ]
+        return station, parking_lots
+
     async def get_all_parking_lots(
         self,
         limit: Optional[int] = None,
@@ -154,8 +225,8 @@ class SQLModelStationRepository(IStationRepository):
             ParkingLot.distance_to_station_m,
             ParkingLot.fee_info,
             ParkingLot.created_at,
-            ST_Y(cast(ParkingLot.location, Geometry)).label("latitude"),
-            ST_X(cast(ParkingLot.location, Geometry)).label("longitude"),
+            ParkingLot.latitude,
+            ParkingLot.longitude,
         ).order_by(ParkingLot.name)
 
         if limit is not None:
@@ -192,8 +263,8 @@ class SQLModelStationRepository(IStationRepository):
             ParkingLot.distance_to_station_m,
             ParkingLot.fee_info,
             ParkingLot.created_at,
-            ST_Y(cast(ParkingLot.location, Geometry)).label("latitude"),
-            ST_X(cast(ParkingLot.location, Geometry)).label("longitude"),
+            ParkingLot.latitude,
+            ParkingLot.longitude,
         ).where(ParkingLot.id == parking_lot_id)
 
         result = self.session.exec(stmt)
@@ -214,9 +285,31 @@ class SQLModelStationRepository(IStationRepository):
             created_at=row.created_at,
         )
 
+    async def get_catalog_version(self) -> CatalogVersion:
+        """
+        역/주차장 카탈로그 버전 조회
+        두 테이블의 max(updated_at)과 행 수를 스칼라 서브쿼리로 묶어 한 번의 왕복으로 조회
+        """
+        stmt = select(
+            select(func.max(Station.updated_at)).scalar_subquery().label("stations_updated_at"),
+            select(func.count()).select_from(Station).scalar_subquery().label("station_count"),
+            select(func.max(ParkingLot.updated_at)).scalar_subquery().label("parking_lots_updated_at"),
+            select(func.count()).select_from(ParkingLot).scalar_subquery().label("parking_lot_count"),
+        )
+
+        row = self.session.exec(stmt).one()
+        timestamps = [t for t in (row.stations_updated_at, row.parking_lots_updated_at) if t is not None]
+
+        return CatalogVersion(
+            last_modified=max(timestamps) if timestamps else None,
+            station_count=row.station_count,
+            parking_lot_count=row.parking_lot_count,
+        )
+
     # ========================================================================
     # 관리자용 CRUD 메서드
     # latitude/longitude 컬럼에 CRUD → 트리거가 location 자동 동기화
+    # 커밋 후 카탈로그 버전 캐시를 무효화하여 ETag가 즉시 바뀌도록 함
     # ========================================================================
 
     async def create_station(
@@ -234,6 +327,7 @@ class SQLModelStationRepository(IStationRepository):
         )
         self.session.add(station)
         self.session.commit()
+        get_catalog_version_cache().invalidate()
         self.session.refresh(station)
         return await self.get_by_id(station.id)
 
@@ -263,15 +357,49 @@ class SQLModelStationRepository(IStationRepository):
             station.longitude = longitude
 
         self.session.add(station)
+        if latitude is not None or longitude is not None:
+            # 트리거가 갱신한 location 기준으로 같은 트랜잭션에서 주차장 거리 재계산
+            self.session.flush()
+            self._recompute_distances(station_id)
         self.session.commit()
+        get_catalog_version_cache().invalidate()
         return await self.get_by_id(station_id)
 
+    def _recompute_distances(self, station_id: Optional[UUID]) -> int:
+        """
+        주차장 거리 일괄 재계산 (UPDATE parking_lots ... FROM stations 1회, 커밋은 호출자가 수행)
+        geography 거리를 버림하여 프로세스 내 계산(geography_distance_m)과 같은 값으로 저장
+        값이 바뀌는 행만 갱신하여 updated_at(카탈로그 버전)을 불필요하게 바꾸지 않음
+        """
+        distance = cast(func.floor(func.ST_Distance(ParkingLot.location, Station.location)), Integer)
+        stmt = (
+            update(ParkingLot)
+            .where(ParkingLot.station_id == Station.id)
+            .where(ParkingLot.location.is_not(None), Station.location.is_not(None))
+            .where(ParkingLot.distance_to_station_m.is_distinct_from(distance))
+            .values(distance_to_station_m=distance)
+            .execution_options(synchronize_session=False)
+        )
+        if station_id is not None:
+            stmt = stmt.where(Station.id == station_id)
+
+        return self.session.exec(stmt).rowcount
+
+    async def recompute_parking_lot_distances(self, station_id: Optional[UUID] = None) -> int:
+        """주차장-역 거리 일괄 재계산 (역 지정 시 해당 역만)"""
+        updated_count = self._recompute_distances(station_id)
+        self.session.commit()
+        if updated_count:
+            get_catalog_version_cache().invalidate()
+        return updated_count
+
     async def delete_station(self, station_id: UUID) -> None:
         """역 삭제 (CASCADE로 주차장도 함께 삭제)"""
         station = self.session.get(Station, station_id)
         if station:
             self.session.delete(station)
             self.session.commit()
+            get_catalog_version_cache().invalidate()
 
     async def create_parking_lot(
         self,
@@ -284,7 +412,7 @@ class SQLModelStationRepository(IStationRepository):
         fee_info: Optional[str] = None,
     ) -> ParkingLot:
         """
-        새 주차장 생성
+        새 주차장 생성 (INSERT ... RETURNING 1회)
         lat/lng 삽입 시 PostgreSQL 트리거가 location(geography) 자동 생성
         """
         parking_lot = ParkingLot(
@@ -296,10 +424,11 @@ class SQLModelStationRepository(IStationRepository):
             distance_to_station_m=distance_to_station_m,
             fee_info=fee_info,
         )
-        self.session.add(parking_lot)
+        stmt = insert(ParkingLot).values(parking_lot.model_dump(exclude={"location"})).returning(ParkingLot)
+        created = self.session.exec(stmt).scalar_one()
         self.session.commit()
-        self.session.refresh(parking_lot)
-        return parking_lot
+        get_catalog_version_cache().invalidate()
+        return created
 
     async def update_parking_lot(
         self,
@@ -337,6 +466,7 @@ class SQLModelStationRepository(IStationRepository):
 
         self.session.add(parking_lot)
         self.session.commit()
+        get_catalog_version_cache().invalidate()
         self.session.refresh(parking_lot)
         return parking_lot
 
@@ -346,36 +476,119 @@ class SQLModelStationRepository(IStationRepository):
         if parking_lot:
             self.session.delete(parking_lot)
             self.session.commit()
+            get_catalog_version_cache().invalidate()
 
-    async def calculate_distance(
-        self, lat1: float, lng1: float, lat2: float, lng2: float
-    ) -> int:
+    async def upsert_catalog(
+        self,
+        stations: list[StationImportRow],
+        parking_lots: list[ParkingLotImportRow],
+    ) -> tuple[list[CatalogUpsertOutcome], list[CatalogUpsertOutcome]]:
         """
-        두 좌표 간 거리 계산 (PostGIS ST_Distance)
-
-        PostGIS geography 타입으로 두 점 사이의 실제 거리를 계산
-        반환값은 미터 단위 (geography 타입은 구체 위의 거리 계산)
+        역/주차장 일괄 업서트 (단일 트랜잭션, 커밋 1회)
 
-        Args:
-            lat1, lng1: 첫 번째 지점 좌표
-            lat2, lng2: 두 번째 지점 좌표
-
-        Returns:
-            거리 (미터 단위, 정수)
+        1. 역: INSERT ... ON CONFLICT (name, line_number) DO UPDATE ... RETURNING 1회
+        2. 주차장: 연계 역/기존 주차장 조회 후 신규 행은 다중 행 INSERT 1회, 기존 행은 PK 기준 executemany UPDATE
+        3. 기존 역 좌표가 바뀌었을 수 있으므로 가져오지 않은 주차장 거리도 UPDATE 1회로 재계산
         """
-        from geoalchemy2 import WKTElement
-        from geoalchemy2.functions import ST_Distance
-        from geoalchemy2.types import Geography
+        station_outcomes = self._upsert_stations(stations)
+        station_ids = {row.key: outcome.id for row, outcome in zip(stations, station_outcomes)}
+        parking_lot_outcomes = self._upsert_parking_lots(parking_lots, station_ids)
 
-        # POINT 객체 생성 (WKT 형식: POINT(경도 위도))
-        point1 = WKTElement(f"POINT({lng1} {lat1})", srid=4326)
-        point2 = WKTElement(f"POINT({lng2} {lat2})", srid=4326)
+        if any(not outcome.created for outcome in station_outcomes):
+            self._recompute_distances(None)
 
-        # Geography 타입으로 실제 거리 계산 (미터 단위)
-        stmt = select(ST_Distance(cast(point1, Geography), cast(point2, Geography)))
+        self.session.commit()
+        if stations or parking_lots:
+            get_catalog_version_cache().invalidate()
+        return station_outcomes, parking_lot_outcomes
+
+    def _upsert_stations(self, rows: list[StationImportRow]) -> list[CatalogUpsertOutcome]:
+        """역 업서트 (INSERT ... ON CONFLICT DO UPDATE ... RETURNING 1회, 커밋은 호출자가 수행)"""
+        if not rows:
+            return []
+
+        stmt = pg_insert(Station).values(
+            [
+                Station(
+                    name=row.name,
+                    line_number=row.line_number,
+                    latitude=row.latitude,
+                    longitude=row.longitude,
+                ).model_dump(exclude={"location", "created_at", "updated_at"})
+                for row in rows
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Station.name, Station.line_number],
+            set_={"latitude": stmt.excluded.latitude, "longitude": stmt.excluded.longitude},
+        ).returning(
+            Station.id,
+            Station.name,
+            Station.line_number,
+            # 새로 삽입된 행은 xmax가 0 (충돌로 갱신된 행은 갱신 트랜잭션 ID)
+            literal_column("(xmax = 0)").label("created"),
+        )
 
-        result = self.session.exec(stmt)
-        distance_meters = result.scalar()
+        outcomes = {
+            (row.name, row.line_number): CatalogUpsertOutcome(id=row.id, created=row.created)
+            for row in self.session.exec(stmt).all()
+        }
+        return [outcomes[row.key] for row in rows]
 
-        return int(distance_meters)
+    def _upsert_parking_lots(
+        self,
+        rows: list[ParkingLotImportRow],
+        station_ids: dict[tuple[str, int], UUID],
+    ) -> list[CatalogUpsertOutcome]:
+        """
+        주차장 업서트 (커밋은 호출자가 수행)
+        parking_lots에는 자연 키 제약이 없으므로 (station_id, name)으로 기존 행을 조회하여 INSERT/UPDATE로 나눔
+        """
+        if not rows:
+            return []
 
+        missing_keys = {row.station_key for row in rows} - station_ids.keys()
+        if missing_keys:
+            stmt = select(Station.id, Station.name, Station.line_number).where(
+                tuple_(Station.name, Station.line_number).in_(list(missing_keys))
+            )
+            station_ids = {
+                **station_ids,
+                **{(row.name, row.line_number): row.id for row in self.session.exec(stmt).all()},
+            }
+
+        stmt = select(ParkingLot.id, ParkingLot.station_id, ParkingLot.name).where(
+            ParkingLot.station_id.in_({station_ids[row.station_key] for row in rows}),
+            ParkingLot.name.in_({row.name for row in rows}),
+        )
+        existing_ids = {(row.station_id, row.name): row.id for row in self.session.exec(stmt).all()}
+
+        outcomes: list[CatalogUpsertOutcome] = []
+        inserts: list[dict] = []
+        updates: list[dict] = []
+        for row in rows:
+            station_id = station_ids[row.station_key]
+            values = {
+                "station_id": station_id,
+                "name": row.name,
+                "address": row.address,
+                "latitude": row.latitude,
+                "longitude": row.longitude,
+                "distance_to_station_m": row.distance_to_station_m,
+                "fee_info": row.fee_info,
+            }
+            existing_id = existing_ids.get((station_id, row.name))
+            if existing_id is None:
+                parking_lot = ParkingLot(**values)
+                inserts.append(parking_lot.model_dump(exclude={"location", "created_at", "updated_at"}))
+                outcomes.append(CatalogUpsertOutcome(id=parking_lot.id, created=True))
+            else:
+                updates.append({"id": existing_id, **values})
+                outcomes.append(CatalogUpsertOutcome(id=existing_id, created=False))
+
+        if inserts:
+            self.session.exec(insert(ParkingLot).values(inserts))
+        if updates:
+            self.session.exec(update(ParkingLot), params=updates)
+
+        return outcomes
@@ -5,16 +5,33 @@ Supabase를 사용한 여행 데이터 접근 구현
 """
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
+from postgrest.exceptions import APIError
+from postgrest.types import CountMethod
 from supabase import Client
 
-from src.domain.entities.trip import Trip, TripStatus
-from src.domain.repositories.trip_repository import ITripRepository
+from src.domain.entities.trip import Trip, TripStatus, allowed_from_states
+from src.domain.repositories.trip_repository import ACTIVE_TRIP_UNIQUE_INDEX, CountMode, ITripRepository
+from src.domain.value_objects.trip_summary import TRIP_SUMMARY_COLUMNS, TripSummary
+from src.infrastructure.database.routing import route_reads
+from src.shared.exceptions import ConflictError
 
+# PostgreSQL unique_violation 에러 코드
+UNIQUE_VIOLATION = "23505"
 
+# PostgREST 범위 오류 코드 (count 요청 시 offset이 전체 개수를 넘으면 발생)
+RANGE_NOT_SATISFIABLE = "PGRST103"
+
+T = TypeVar("T")
+
+# 요약 조회 select 컬럼 목록
+SUMMARY_SELECT = ",".join(TRIP_SUMMARY_COLUMNS)
+
+
+@route_reads
 class SupbaseTripRepository(ITripRepository):
     """
     Supabase를 사용한 Trip Repository 구현
@@ -50,15 +67,48 @@ class SupbaseTripRepository(ITripRepository):
         """
         새로운 여행 생성
         None 값은 제외하여 DB의 DEFAULT 값이 적용되도록 함
+        진행 중 여행 유일성은 부분 유니크 인덱스가 보장 (INSERT 1회로 검사 + 생성)
         """
         trip_data = trip.model_dump(mode="json", exclude_none=True)
-        response = self.db.table("trips").insert(trip_data).execute()
+        try:
+            response = self.db.table("trips").insert(trip_data).execute()
+        except APIError as e:
+            if e.code == UNIQUE_VIOLATION and ACTIVE_TRIP_UNIQUE_INDEX in (e.message or ""):
+                raise ConflictError("이미 진행 중인 여행이 있습니다")
+            raise
 
         if not response.data:
             raise RuntimeError("여행 생성에 실패했습니다")
 
         return self._parse_trip_data(response.data[0])
 
+    async def transition(
+        self,
+        trip_id: UUID,
+        to_status: TripStatus,
+        changes: dict[str, Any],
+        user_id: Optional[UUID] = None,
+    ) -> Optional[Trip]:
+        """
+        조건부 상태 전이
+        현재 상태 검사와 변경을 UPDATE 1회로 처리하여 동시 요청 시 하나만 성공
+        """
+        query = (
+            self.db.table("trips")
+            .update({**changes, "status": to_status.value})
+            .eq("id", str(trip_id))
+            .in_("status", [status.value for status in allowed_from_states(to_status)])
+        )
+        if user_id is not None:
+            query = query.eq("user_id", str(user_id))
+
+        response = query.execute()
+
+        if not response.data:
+            return None
+
+        return self._parse_trip_data(response.data[0])
+
     async def get_by_id(self, trip_id: UUID) -> Optional[Trip]:
         """
         ID로 특정 여행 조회
@@ -91,6 +141,39 @@ class SupbaseTripRepository(ITripRepository):
 
         return [self._parse_trip_data(row) for row in response.data]
 
+    async def get_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TripStatus] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        사용자 ID로 여행 목록과 전체 개수 조회
+        데이터 요청에 count를 함께 보내 한 번의 왕복으로 처리
+        """
+        return await self._fetch_page(
+            lambda query: self._apply_filters(query, status, user_id, None, None),
+            "*", count, limit, offset, self._parse_trip_data,
+        )
+
+    async def get_summary_page_by_user_id(
+        self,
+        user_id: UUID,
+        status: Optional[TripStatus] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        사용자 ID로 여행 요약 목록과 전체 개수 조회 (요약 컬럼만 조회)
+        """
+        return await self._fetch_page(
+            lambda query: self._apply_filters(query, status, user_id, None, None),
+            SUMMARY_SELECT, count, limit, offset, TripSummary.from_row,
+        )
+
     async def get_active_trip(self, user_id: UUID) -> Optional[Trip]:
         """
         사용자의 활성 여행 조회 (DRIVING 또는 TRANSFERRED)
@@ -159,6 +242,37 @@ class SupbaseTripRepository(ITripRepository):
 
         return [self._parse_trip_data(row) for row in response.data]
 
+    async def get_page_by_status(
+        self,
+        status: TripStatus,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        특정 상태의 여행 목록과 전체 개수 조회 (관리자용)
+        데이터 요청에 count를 함께 보내 한 번의 왕복으로 처리
+        """
+        return await self._fetch_page(
+            lambda query: query.eq("status", status.value),
+            "*", count, limit, offset, self._parse_trip_data,
+        )
+
+    async def get_summary_page_by_status(
+        self,
+        status: TripStatus,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        특정 상태의 여행 요약 목록과 전체 개수 조회 (관리자용, 요약 컬럼만 조회)
+        """
+        return await self._fetch_page(
+            lambda query: query.eq("status", status.value),
+            SUMMARY_SELECT, count, limit, offset, TripSummary.from_row,
+        )
+
     async def count_by_status(self, status: TripStatus) -> int:
         """
         특정 상태의 여행 개수 조회 (관리자용)
@@ -194,21 +308,15 @@ class SupbaseTripRepository(ITripRepository):
         response = query.execute()
         return response.count or 0
 
-    async def get_with_filters(
-        self,
-        status: Optional[TripStatus] = None,
-        user_id: Optional[UUID] = None,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
-        limit: int = 10,
-        offset: int = 0,
-    ) -> list[Trip]:
-        """
-        필터를 적용하여 여행 목록 조회
-        상태, 사용자, 날짜 범위로 필터링 지원
-        """
-        query = self.db.table("trips").select("*")
-
+    @staticmethod
+    def _apply_filters(
+        query,
+        status: Optional[TripStatus],
+        user_id: Optional[UUID],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ):
+        """상태, 사용자, 날짜 범위 필터 적용"""
         # 상태 필터
         if status is not None:
             query = query.eq("status", status.value)
@@ -223,6 +331,59 @@ class SupbaseTripRepository(ITripRepository):
         if end_date:
             query = query.lte("created_at", end_date)
 
+        return query
+
+    def _select_page(self, count: Optional[CountMode], columns: str = "*"):
+        """목록 조회 쿼리 (count 지정 시 PostgREST가 같은 요청에서 전체 개수도 계산)"""
+        if count is None:
+            return self.db.table("trips").select(columns)
+        return self.db.table("trips").select(columns, count=CountMethod(count))
+
+    async def _fetch_page(
+        self,
+        apply_filters: Callable[[Any], Any],
+        columns: str,
+        count: Optional[CountMode],
+        limit: int,
+        offset: int,
+        parse: Callable[[dict], T],
+    ) -> tuple[list[T], Optional[int]]:
+        """
+        필터 적용 후 최신순 정렬/페이지네이션하여 실행하고 (목록, 전체 개수) 반환
+        마지막 페이지를 넘어선 offset이면 PostgREST가 범위 오류를 내므로
+        같은 필터와 count 방식의 HEAD 요청으로 개수만 조회하여 빈 목록과 함께 반환
+        """
+        query = apply_filters(self._select_page(count, columns))
+        try:
+            response = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+        except APIError as e:
+            if e.code != RANGE_NOT_SATISFIABLE:
+                raise
+            if count is None:
+                return [], None
+            count_query = apply_filters(self.db.table("trips").select("id", count=CountMethod(count), head=True))
+            return [], count_query.execute().count or 0
+
+        items = [parse(row) for row in response.data]
+        if count is None:
+            return items, None
+        return items, response.count or 0
+
+    async def get_with_filters(
+        self,
+        status: Optional[TripStatus] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> list[Trip]:
+        """
+        필터를 적용하여 여행 목록 조회
+        상태, 사용자, 날짜 범위로 필터링 지원
+        """
+        query = self._apply_filters(self.db.table("trips").select("*"), status, user_id, start_date, end_date)
+
         # 정렬 및 페이지네이션
         query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
         response = query.execute()
@@ -239,25 +400,50 @@ class SupbaseTripRepository(ITripRepository):
         """
         필터를 적용하여 여행 개수 조회
         """
-        query = self.db.table("trips").select("id", count="exact")
-
-        # 상태 필터
-        if status is not None:
-            query = query.eq("status", status.value)
-
-        # 사용자 필터
-        if user_id is not None:
-            query = query.eq("user_id", str(user_id))
-
-        # 날짜 범위 필터
-        if start_date:
-            query = query.gte("created_at", start_date)
-        if end_date:
-            query = query.lte("created_at", end_date)
+        query = self._apply_filters(
+            self.db.table("trips").select("id", count="exact"), status, user_id, start_date, end_date
+        )
 
         response = query.execute()
         return response.count or 0
 
+    async def get_page_with_filters(
+        self,
+        status: Optional[TripStatus] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[Trip], Optional[int]]:
+        """
+        필터를 적용하여 여행 목록과 전체 개수 조회
+        데이터 요청에 count를 함께 보내 필터 스캔을 한 번만 수행
+        """
+        return await self._fetch_page(
+            lambda query: self._apply_filters(query, status, user_id, start_date, end_date),
+            "*", count, limit, offset, self._parse_trip_data,
+        )
+
+    async def get_summary_page_with_filters(
+        self,
+        status: Optional[TripStatus] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        count: Optional[CountMode] = "exact",
+    ) -> tuple[list[TripSummary], Optional[int]]:
+        """
+        필터를 적용하여 여행 요약 목록과 전체 개수 조회 (요약 컬럼만 조회)
+        """
+        return await self._fetch_page(
+            lambda query: self._apply_filters(query, status, user_id, start_date, end_date),
+            SUMMARY_SELECT, count, limit, offset, TripSummary.from_row,
+        )
+
     async def count_approved_today(self) -> int:
         """
         오늘 승인된 여정 개수 조회 (KST 기준)
@@ -0,0 +1,203 @@
+"""
+Periodic Task Scheduler
+
+앱 lifespan에서 실행되는 asyncio 주기 작업 스케줄러
+- 작업별 interval(초) 또는 cron 표현식 스케줄 + 지터
+- 실행 시각(슬롯)이 되면 pg_try_advisory_lock으로 작업 잠금을 잡은 인스턴스만 실행
+- scheduler_runs 테이블에 슬롯을 기록하여 지터로 늦게 깨어난 다른 인스턴스가 같은 슬롯을 다시 실행하지 않음
+  (스케일 아웃해도 슬롯당 1회 실행)
+- 실행 시간/실패는 로그, /metrics(scheduled_task_*), scheduler_runs 테이블에 기록
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+from zoneinfo import ZoneInfo
+
+from src.shared.utils.cron import CronSchedule
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledTask:
+    """주기 작업 정의 (interval_seconds 또는 cron 중 하나 지정)"""
+
+    name: str
+    func: Callable[[], Awaitable[None]]
+    interval_seconds: Optional[float] = None
+    cron: Optional[str] = None
+    jitter_seconds: float = 0.0
+    _cron_schedule: Optional[CronSchedule] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if (self.interval_seconds is None) == (self.cron is None):
+            raise ValueError(f"주기 작업은 interval_seconds와 cron 중 하나만 지정해야 합니다: {self.name}")
+        if self.cron is not None:
+            self._cron_schedule = CronSchedule.parse(self.cron)
+
+    def next_slot(self, now: datetime) -> datetime:
+        """
+        now 이후 다음 실행 슬롯 (모든 인스턴스에서 같은 값이 나오도록 벽시계 기준으로 정렬)
+        interval은 epoch 기준 interval_seconds 배수 시각, cron은 다음 일치 시각
+        """
+        if self._cron_schedule is not None:
+            return self._cron_schedule.next_after(now)
+        epoch = now.timestamp()
+        slot = (epoch // self.interval_seconds + 1) * self.interval_seconds
+        return datetime.fromtimestamp(slot, tz=now.tzinfo)
+
+
+def _try_claim_slot(task_name: str, slot: datetime) -> Optional[object]:
+    """
+    작업 잠금 + 슬롯 선점
+    잠금을 잡고 이 슬롯이 아직 실행되지 않았으면 잠금을 보유한 연결 반환, 아니면 None
+    """
+    from sqlalchemy import text
+
+    from src.infrastructure.database.session import get_engine
+
+    connection = get_engine().connect()
+    try:
+        locked = connection.execute(
+            text("SELECT pg_try_advisory_lock(hashtext(:lock_name))"),
+            {"lock_name": f"scheduler:{task_name}"},
+        ).scalar_one()
+        if not locked:
+            connection.rollback()
+            connection.close()
+            return None
+
+        claimed = connection.execute(
+            text(
+                "INSERT INTO scheduler_runs (task, slot, started_at) VALUES (:task, :slot, now()) "
+                "ON CONFLICT (task) DO UPDATE SET slot = EXCLUDED.slot, started_at = now() "
+                "WHERE scheduler_runs.slot < EXCLUDED.slot "
+                "RETURNING task"
+            ),
+            {"task": task_name, "slot": slot},
+        ).first()
+        connection.commit()
+        if claimed is None:
+            _release(connection, task_name, None, None)
+            return None
+        return connection
+    except Exception:
+        # 잠금을 보유했을 수 있으므로 풀에 돌려보내지 않고 폐기
+        connection.invalidate()
+        connection.close()
+        raise
+
+
+def _release(connection, task_name: str, duration_ms: Optional[float], error: Optional[str]) -> None:
+    """
+    실행 결과 기록 후 작업 잠금 해제
+    잠금 해제에 실패한 연결은 풀에 돌려보내지 않고 폐기 (세션 종료 시 잠금도 해제됨)
+    """
+    from sqlalchemy import text
+
+    try:
+        if duration_ms is not None:
+            connection.execute(
+                text(
+                    "UPDATE scheduler_runs SET finished_at = now(), last_duration_ms = :duration_ms, "
+                    "last_error = :error WHERE task = :task"
+                ),
+                {"task": task_name, "duration_ms": duration_ms, "error": error},
+            )
+            connection.commit()
+        connection.execute(text("SELECT pg_advisory_unlock(hashtext(:lock_name))"), {"lock_name": f"scheduler:{task_name}"})
+        connection.commit()
+    except Exception:
+        connection.invalidate()
+        raise
+    finally:
+        connection.close()
+
+
+class Scheduler:
+    """
+    주기 작업 스케줄러
+
+    사용 예:
+    ```python
+    scheduler = Scheduler(build_maintenance_tasks(), timezone_name="Asia/Seoul")
+    scheduler.start()
+    ...
+    await scheduler.stop()
+    ```
+    """
+
+    def __init__(self, tasks: list[ScheduledTask], timezone_name: str = "UTC"):
+        self.tasks = tasks
+        self.timezone = ZoneInfo(timezone_name)
+        self._runners: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """작업별 실행 루프 시작"""
+        self._runners = [asyncio.create_task(self._run_forever(task), name=f"scheduler:{task.name}") for task in self.tasks]
+        if self.tasks:
+            logger.info(f"스케줄러 시작: {', '.join(task.name for task in self.tasks)}")
+
+    async def stop(self) -> None:
+        """실행 루프 취소 (실행 중인 작업은 취소됨)"""
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._runners = []
+
+    async def _run_forever(self, task: ScheduledTask) -> None:
+        """다음 슬롯까지 대기(+지터) 후 실행 반복"""
+        while True:
+            slot = task.next_slot(datetime.now(self.timezone))
+            delay = (slot - datetime.now(self.timezone)).total_seconds() + random.uniform(0, task.jitter_seconds)
+            await asyncio.sleep(max(0.0, delay))
+            await self.run_once(task, slot)
+
+    async def run_once(self, task: ScheduledTask, slot: datetime) -> str:
+        """
+        슬롯 1회 실행 시도
+
+        Returns:
+            "success" / "failure" / "skipped" (다른 인스턴스가 실행 중이거나 이미 실행한 슬롯)
+        """
+        from src.infrastructure.observability.metrics import (
+            scheduled_task_duration_seconds,
+            scheduled_task_runs_total,
+        )
+
+        try:
+            connection = await asyncio.to_thread(_try_claim_slot, task.name, slot.astimezone(timezone.utc))
+        except Exception as e:
+            logger.warning(f"주기 작업 잠금 실패 ({task.name}): {str(e)}")
+            scheduled_task_runs_total.inc(task.name, "failure")
+            return "failure"
+
+        if connection is None:
+            scheduled_task_runs_total.inc(task.name, "skipped")
+            return "skipped"
+
+        started_at = time.perf_counter()
+        error = None
+        try:
+            await task.func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)}"[:1000]
+            logger.error(f"주기 작업 실패 ({task.name}): {error}")
+        finally:
+            duration = time.perf_counter() - started_at
+            try:
+                await asyncio.to_thread(_release, connection, task.name, duration * 1000, error)
+            except Exception as e:
+                logger.warning(f"주기 작업 결과 기록 실패 ({task.name}): {str(e)}")
+
+        result = "failure" if error else "success"
+        scheduled_task_runs_total.inc(task.name, result)
+        scheduled_task_duration_seconds.observe(duration, task.name)
+        if error is None:
+            logger.info(f"주기 작업 완료 ({task.name}): {duration * 1000:.1f}ms")
+        return result
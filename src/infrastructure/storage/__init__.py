@@ -0,0 +1,5 @@
+"""
+Storage Infrastructure
+
+Supabase Storage 관련 인프라 구성 요소 (Signed URL 캐시 등)
+"""
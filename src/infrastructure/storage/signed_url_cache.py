@@ -0,0 +1,188 @@
+"""
+Signed URL Cache
+
+여정 이미지 객체 경로에 대한 Signed URL을 요청 시점에 발급하고 프로세스 단위로 캐시
+캐시 TTL을 Signed URL 만료 시간보다 약간 짧게 두어 만료된 URL이 응답되지 않도록 함
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Iterable, Optional
+from urllib.parse import quote
+
+from src.config import get_settings
+from src.shared.utils.storage_path import TRIP_IMAGE_BUCKET, extract_object_path
+
+logger = logging.getLogger(__name__)
+
+
+class SignedUrlCache:
+    """
+    객체 경로 → Signed URL 캐시 (프로세스 단위, thread-safe)
+
+    - get(): 캐시 미스 시 create_signed_url로 단건 발급
+    - prefetch(): 목록 응답 직전 create_signed_urls로 미스 경로를 일괄 발급
+    """
+
+    def __init__(
+        self,
+        bucket_factory: Callable[[], object],
+        expires_in: int,
+        ttl_seconds: int,
+        max_entries: int = 10000,
+    ):
+        """
+        Args:
+            bucket_factory: Storage 버킷 API 객체를 반환하는 함수 (지연 생성)
+            expires_in: 발급할 Signed URL 유효 시간 (초)
+            ttl_seconds: 캐시 유지 시간 (초, expires_in보다 짧아야 함)
+            max_entries: 최대 캐시 항목 수 (초과 시 오래된 항목부터 제거)
+        """
+        if ttl_seconds >= expires_in:
+            raise ValueError("캐시 TTL은 Signed URL 유효 시간보다 짧아야 합니다")
+
+        self._bucket_factory = bucket_factory
+        self._bucket = None
+        self.expires_in = expires_in
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def bucket(self):
+        """Storage 버킷 API 객체 (첫 사용 시 생성)"""
+        if self._bucket is None:
+            self._bucket = self._bucket_factory()
+        return self._bucket
+
+    def _lookup(self, path: str, now: float) -> Optional[str]:
+        """유효한 캐시 항목 조회 (lock 보유 상태에서 호출)"""
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        url, cached_until = entry
+        if cached_until <= now:
+            del self._entries[path]
+            return None
+        self._entries.move_to_end(path)
+        return url
+
+    def _store(self, path: str, url: str, now: float) -> None:
+        """캐시 항목 저장 (lock 보유 상태에서 호출)"""
+        self._entries[path] = (url, now + self.ttl_seconds)
+        self._entries.move_to_end(path)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, path: str) -> Optional[str]:
+        """
+        객체 경로의 Signed URL 반환
+        캐시에 없거나 만료 임박이면 새로 발급, 발급 실패 시 None 반환
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._lookup(path, now)
+        if cached is not None:
+            return cached
+
+        try:
+            signed_url = self.bucket.create_signed_url(path, self.expires_in)["signedURL"]
+        except Exception as e:
+            logger.warning(f"Signed URL 발급 실패 (path={path}): {e}")
+            return None
+
+        if signed_url:
+            with self._lock:
+                self._store(path, signed_url, time.monotonic())
+        return signed_url
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """
+        캐시에 없는 경로들의 Signed URL을 한 번의 API 호출로 일괄 발급
+        목록 응답 직렬화 시 행마다 발급 요청이 나가지 않도록 함
+        """
+        now = time.monotonic()
+        with self._lock:
+            missing = [path for path in dict.fromkeys(paths) if self._lookup(path, now) is None]
+        if not missing:
+            return
+
+        try:
+            signed = self.bucket.create_signed_urls(missing, self.expires_in)
+        except Exception as e:
+            logger.warning(f"Signed URL 일괄 발급 실패 ({len(missing)}건): {e}")
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            for item in signed:
+                if not item.get("error") and item.get("signedURL"):
+                    self._store(item["path"], item["signedURL"], now)
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache
+def get_signed_url_cache() -> SignedUrlCache:
+    """
+    프로세스 단위 SignedUrlCache 인스턴스 반환 (싱글톤)
+    """
+    from src.infrastructure.database.supabase import get_supabase_client
+
+    settings = get_settings()
+    return SignedUrlCache(
+        bucket_factory=lambda: get_supabase_client().storage.from_(TRIP_IMAGE_BUCKET),
+        expires_in=settings.signed_url_expires_in,
+        ttl_seconds=settings.signed_url_expires_in - settings.signed_url_cache_margin_seconds,
+    )
+
+
+def sign_image_url(value: Optional[str]) -> Optional[str]:
+    """
+    저장된 이미지 값을 Signed URL로 변환 (관리자 응답용)
+    Storage 객체가 아닌 외부 URL은 그대로 반환
+    """
+    path = extract_object_path(value)
+    if path is None:
+        return value
+    return get_signed_url_cache().get(path) or value
+
+
+@lru_cache
+def _public_url_prefix() -> str:
+    """
+    trips 버킷 Public URL 접두사 (프로세스당 1회 계산)
+    Storage 클라이언트의 get_public_url과 동일한 형식을 유지하기 위해 해당 결과에서 추출
+    """
+    from src.infrastructure.database.supabase import get_supabase_client
+
+    marker = "__object_path__"
+    public_url = get_supabase_client().storage.from_(TRIP_IMAGE_BUCKET).get_public_url(marker)
+    return public_url.split(marker, 1)[0]
+
+
+def public_image_url(value: Optional[str]) -> Optional[str]:
+    """
+    저장된 이미지 값을 Public URL로 변환 (사용자 응답용, 네트워크 호출 없음)
+    Storage 객체가 아닌 외부 URL은 그대로 반환
+    """
+    path = extract_object_path(value)
+    if path is None:
+        return value
+    return _public_url_prefix() + quote(path)
+
+
+def prefetch_signed_image_urls(values: Iterable[Optional[str]]) -> None:
+    """
+    여러 이미지 값의 Signed URL을 일괄 발급하여 캐시에 적재
+    """
+    paths = [path for path in (extract_object_path(value) for value in values) if path]
+    if paths:
+        get_signed_url_cache().prefetch(paths)
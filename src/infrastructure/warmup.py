@@ -0,0 +1,129 @@
+"""
+Startup Warm-up
+
+배포/스케일 아웃 직후 첫 요청이 부담하던 초기화 비용을 시작 단계에서 미리 처리
+- db_pool: SQLAlchemy 연결 풀에 N개 연결을 미리 열어 둠
+- postgrest: Supabase 클라이언트 생성 + PostgREST 최소 조회 (HTTP 연결 수립)
+- stations: 역 목록 조회 및 카탈로그 버전 캐시 채우기
+
+워밍업은 lifespan에서 백그라운드 작업으로 실행되고, 끝나면 readiness(/ready)가 준비 완료로 바뀜
+단계 실패는 기록만 하고 준비 완료를 막지 않음 (워밍업은 성능 최적화이며 헬스 체크가 아님)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupStep:
+    """워밍업 단계 1건의 결과"""
+
+    name: str
+    duration_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class WarmupState:
+    """워밍업 진행 상태 (readiness 판단 기준)"""
+
+    ready: bool = False
+    steps: list[WarmupStep] = field(default_factory=list)
+
+    def reset(self, ready: bool) -> None:
+        """앱 시작 시 상태 초기화 (워밍업 비활성화 시 ready=True)"""
+        self.ready = ready
+        self.steps = []
+
+    def as_dict(self) -> dict:
+        """readiness 응답용 요약"""
+        return {
+            "ready": self.ready,
+            "steps": [
+                {"name": step.name, "duration_ms": round(step.duration_ms, 1), "error": step.error}
+                for step in self.steps
+            ],
+        }
+
+
+# 프로세스 단위 워밍업 상태
+warmup_state = WarmupState()
+
+
+async def _warm_db_pool() -> None:
+    """SQLAlchemy 연결 풀 워밍업"""
+    from src.infrastructure.database.session import warm_up_pool
+
+    connections = await asyncio.to_thread(warm_up_pool, get_settings().warmup_db_connections)
+    logger.info(f"DB 연결 {connections}개 워밍업 완료")
+
+
+async def _warm_postgrest() -> None:
+    """Supabase 클라이언트 생성 및 PostgREST 최소 조회"""
+    from src.infrastructure.database.supabase import get_supabase_client
+
+    def ping():
+        get_supabase_client().table("stations").select("id").limit(1).execute()
+
+    await asyncio.to_thread(ping)
+
+
+async def _warm_stations() -> None:
+    """역 목록 조회(쿼리 컴파일 캐시) 및 카탈로그 버전 캐시 채우기 (요청 경로와 같은 세션/레포지토리 사용)"""
+    from src.infrastructure.cache.catalog_version_cache import get_catalog_version_cache
+    from src.infrastructure.database.routing import RoutingSession
+    from src.infrastructure.database.session import get_engine
+    from src.infrastructure.repositories.station_repository_impl import SQLModelStationRepository
+
+    with RoutingSession(get_engine()) as session:
+        await SQLModelStationRepository(session=session).get_all()
+    await get_catalog_version_cache().get()
+
+
+def _warmup_steps() -> list[tuple[str, Callable[[], Awaitable[None]]]]:
+    """설정에 따라 실행할 워밍업 단계 목록"""
+    settings = get_settings()
+    steps = []
+    if settings.database_url:
+        steps.append(("db_pool", _warm_db_pool))
+    steps.append(("postgrest", _warm_postgrest))
+    if settings.database_url:
+        steps.append(("stations", _warm_stations))
+    return steps
+
+
+async def run_warmup(state: WarmupState = warmup_state) -> WarmupState:
+    """
+    워밍업 단계를 순서대로 실행하고 완료 후 ready 전환
+    전체 시간이 warmup_timeout_seconds를 넘으면 남은 단계는 건너뛰고 ready 전환
+    """
+    settings = get_settings()
+    deadline = time.perf_counter() + settings.warmup_timeout_seconds
+
+    try:
+        for name, step in _warmup_steps():
+            remaining = deadline - time.perf_counter()
+            started_at = time.perf_counter()
+            error = None
+            try:
+                if remaining <= 0:
+                    raise TimeoutError("워밍업 제한 시간 초과로 건너뜀")
+                await asyncio.wait_for(step(), timeout=remaining)
+            except Exception as e:
+                # 공개 엔드포인트(/ready)에 노출되므로 예외 종류만 기록, 상세 내용은 로그로
+                error = type(e).__name__
+                logger.warning(f"워밍업 단계 실패 ({name}): {str(e)}")
+            state.steps.append(WarmupStep(name=name, duration_ms=(time.perf_counter() - started_at) * 1000, error=error))
+    finally:
+        state.ready = True
+
+    total_ms = sum(step.duration_ms for step in state.steps)
+    logger.info(f"워밍업 완료 ({total_ms:.1f}ms): " + ", ".join(f"{s.name}={s.duration_ms:.1f}ms" for s in state.steps))
+    return state
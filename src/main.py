@@ -4,6 +4,7 @@ FastAPI 애플리케이션 진입점
 미들웨어, 예외 핸들러, 라우터 설정을 포함한 메인 애플리케이션 구성
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
@@ -35,8 +36,29 @@ async def lifespan(app: FastAPI):
         init_db()
         print(f"✅ SQLModel Database Engine initialized")
 
+    # 워밍업 (백그라운드 실행, 완료 시 /ready 준비 완료 전환)
+    from src.infrastructure.warmup import run_warmup, warmup_state
+
+    warmup_state.reset(ready=not settings.warmup_enabled)
+    warmup_task = asyncio.create_task(run_warmup()) if settings.warmup_enabled else None
+
+    # 주기 유지보수 작업 스케줄러 (작업별 advisory lock으로 전체 인스턴스 중 하나만 실행)
+    scheduler = None
+    if settings.scheduler_enabled and settings.database_url:
+        from src.infrastructure.maintenance import build_maintenance_tasks
+        from src.infrastructure.scheduler import Scheduler
+
+        scheduler = Scheduler(build_maintenance_tasks(settings), timezone_name=settings.scheduler_timezone)
+        scheduler.start()
+
     yield
 
+    if scheduler is not None:
+        await scheduler.stop()
+
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
     # 종료 시 실행
     if settings.database_url:
         from src.infrastructure.database.session import close_db
@@ -87,8 +109,14 @@ def create_application() -> FastAPI:
 - `404 Not Found`: 리소스를 찾을 수 없음
 - `409 Conflict`: 리소스 충돌 (중복 이메일, 진행 중 여정 등)
 - `422 Unprocessable Entity`: 유효성 검증 실패
+- `429 Too Many Requests`: 요청 한도 초과 (`Retry-After` 헤더의 초만큼 대기 후 재시도)
 - `500 Internal Server Error`: 서버 내부 오류
 
+## 재시도 (Idempotency-Key)
+
+여정 시작/환승/도착 API는 `Idempotency-Key` 헤더를 지원합니다.
+같은 키로 재시도하면 처음 처리된 응답을 그대로 반환합니다 (`Idempotent-Replayed: true` 헤더).
+
 ## 표준 응답 형식
 
 모든 API는 다음 형식으로 응답합니다:
@@ -144,6 +172,80 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # 역/주차장 조회 API 조건부 캐싱 (ETag / Last-Modified / Cache-Control, 304)
+    # CORS/메트릭 미들웨어보다 안쪽에 두어 304 응답에도 CORS 헤더와 메트릭이 적용되도록 먼저 등록
+    if settings.catalog_cache_enabled and settings.database_url:
+        from src.api.middleware.conditional_cache import CatalogCacheMiddleware
+        from src.infrastructure.cache.catalog_version_cache import get_catalog_version_cache
+
+        app.add_middleware(
+            CatalogCacheMiddleware,
+            path_prefixes=(f"{settings.api_prefix}/stations", f"{settings.api_prefix}/parking-lots"),
+            version_cache=get_catalog_version_cache(),
+            cache_control=settings.catalog_cache_control,
+        )
+
+    # 여행 시작/환승/도착 Idempotency-Key 재시도 처리 (저장되는 응답은 압축 전 본문이 되도록 압축보다 안쪽에 등록)
+    if settings.idempotency_enabled:
+        from src.api.dependencies.auth_deps import verified_token_subject
+        from src.api.middleware.idempotency import IdempotencyMiddleware
+        from src.infrastructure.cache.idempotency_store import get_idempotency_store
+
+        app.add_middleware(
+            IdempotencyMiddleware,
+            path_patterns=(
+                f"{settings.api_prefix}/trips/start",
+                f"{settings.api_prefix}/trips/[^/]+/(transfer|arrival)",
+            ),
+            store=get_idempotency_store(),
+            verify_token=verified_token_subject,
+        )
+
+    # 응답 압축 (gzip/brotli), 카탈로그 ETag를 보고 압축 결과를 재사용하도록 조건부 캐싱보다 바깥쪽에 등록
+    if settings.compression_enabled:
+        from src.api.middleware.compression import CompressionMiddleware
+
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+        )
+
+    # 로그인/업로드/주소 검색 요청 한도 (429 응답에도 CORS 헤더가 붙도록 CORS보다 안쪽에 등록)
+    if settings.rate_limit_enabled:
+        from src.api.middleware.rate_limit import RateLimitMiddleware, RateLimitPolicy
+        from src.infrastructure.rate_limiter import get_rate_limiter
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            policies=(
+                RateLimitPolicy(
+                    name="auth",
+                    path_pattern=f"{settings.api_prefix}/auth/(login|signup)",
+                    limit=settings.rate_limit_auth_per_minute,
+                    key_by="ip",
+                ),
+                RateLimitPolicy(
+                    name="upload",
+                    path_pattern=f"{settings.api_prefix}/storage/upload/[^/]+",
+                    limit=settings.rate_limit_upload_per_minute,
+                    ip_limit=settings.rate_limit_upload_per_minute * settings.rate_limit_user_ip_multiplier,
+                    key_by="user",
+                ),
+                RateLimitPolicy(
+                    name="address_search",
+                    path_pattern=f"{settings.api_prefix}/admin/address/search",
+                    limit=settings.rate_limit_address_search_per_minute,
+                    ip_limit=settings.rate_limit_address_search_per_minute * settings.rate_limit_user_ip_multiplier,
+                    key_by="user",
+                    methods=("GET",),
+                ),
+            ),
+            limiter=get_rate_limiter(),
+            trusted_proxy_hops=settings.rate_limit_trusted_proxy_hops,
+        )
+
     # CORS 미들웨어 설정
     app.add_middleware(
         CORSMiddleware,
@@ -153,6 +255,28 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # 읽기 복제본 사용 시 쓰기 요청과 최근 쓰기 사용자의 요청을 주 DB로 고정 (read-your-writes)
+    if settings.database_replica_urls_list or settings.supabase_replica_urls_list:
+        from src.api.middleware.read_your_writes import ReadYourWritesMiddleware
+        from src.infrastructure.database.routing import RecentWriters
+
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            recent_writers=RecentWriters(window_seconds=settings.read_your_writes_seconds),
+        )
+
+    # 라우트별 지연 시간 / DB 왕복 메트릭 수집 미들웨어
+    if settings.metrics_enabled:
+        from src.api.middleware.metrics import MetricsMiddleware
+
+        app.add_middleware(MetricsMiddleware, excluded_paths=("/metrics",))
+
+    # 헤더로 요청 단위 쿼리 타임라인 트레이스 (Server-Timing 헤더 + 로그)
+    if settings.query_trace_enabled:
+        from src.api.middleware.query_trace import QueryTraceMiddleware
+
+        app.add_middleware(QueryTraceMiddleware, header_name=settings.query_trace_header)
+
     # ============================================================
     # 예외 핸들러 (Exception Handlers)
     # ============================================================
@@ -214,6 +338,54 @@ def create_application() -> FastAPI:
             data={"status": "ok", "version": settings.app_version},
         )
 
+    @app.get("/ready", tags=["Health"])
+    async def readiness_check():
+        """
+        서비스 준비 상태 확인 엔드포인트
+        시작 워밍업이 끝나기 전에는 503을 반환하여 로드 밸런서가 트래픽을 보내지 않도록 함
+        """
+        from src.infrastructure.warmup import warmup_state
+        from src.shared.schemas.response import SuccessResponse
+
+        if not warmup_state.ready:
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content=ErrorResponse.create(message="워밍업 진행 중입니다").model_dump(),
+            )
+
+        return SuccessResponse.create(
+            message="서비스가 요청을 받을 준비가 되었습니다",
+            data=warmup_state.as_dict(),
+        )
+
+    if settings.metrics_enabled:
+
+        @app.get("/metrics", tags=["Health"], include_in_schema=False)
+        async def metrics(request: Request):
+            """
+            Prometheus 메트릭 엔드포인트
+            라우트별 지연 시간 히스토그램과 요청당 DB 왕복 횟수를 텍스트 포맷으로 반환
+            METRICS_TOKEN이 설정되어 있으면 Authorization: Bearer <토큰> 헤더 필요
+            """
+            import secrets
+
+            from fastapi.responses import PlainTextResponse
+
+            from src.infrastructure.observability.metrics import registry
+
+            if settings.metrics_token:
+                scheme, _, token = request.headers.get("authorization", "").partition(" ")
+                if scheme.lower() != "bearer" or not secrets.compare_digest(token.encode(), settings.metrics_token.encode()):
+                    return JSONResponse(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        content=ErrorResponse.create(message="메트릭 접근 권한이 없습니다").model_dump(),
+                    )
+
+            return PlainTextResponse(
+                registry.render(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
+
     # ============================================================
     # 라우터 등록
     # ============================================================
@@ -232,6 +404,12 @@ def create_application() -> FastAPI:
     app.include_router(storage_router, prefix=settings.api_prefix)
     app.include_router(trip_router, prefix=settings.api_prefix)
 
+    # 미리 생성된 OpenAPI 스키마 로드 (첫 /openapi.json 요청 시 스키마 생성 생략)
+    if settings.prebuilt_openapi_enabled:
+        from src.api.openapi import install_prebuilt_openapi
+
+        install_prebuilt_openapi(app, api_prefix=settings.api_prefix)
+
     return app
 
 
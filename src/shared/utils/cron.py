@@ -0,0 +1,103 @@
+"""
+Cron 표현식 유틸리티
+
+5필드 cron 표현식(분 시 일 월 요일)의 다음 실행 시각 계산
+지원 문법: *, 숫자, 목록(1,15), 범위(1-5), 간격(*/10, 0-30/5)
+요일은 0(일요일)~6(토요일), 7도 일요일로 처리
+일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 동작)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# 필드별 (최솟값, 최댓값)
+_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# 다음 실행 시각 탐색 최대 범위 (존재하지 않는 날짜 조합 방지, 예: 2월 30일)
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(field: str, minimum: int, maximum: int) -> frozenset[int]:
+    """cron 필드 1개를 허용 값 집합으로 변환"""
+    values: set[int] = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"cron 간격은 1 이상이어야 합니다: {part}")
+
+        if base == "*":
+            start, end = minimum, maximum
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(base)
+            end = maximum if step_text else start
+
+        if not (minimum <= start <= end <= maximum):
+            raise ValueError(f"cron 필드 범위를 벗어났습니다: {part} ({minimum}~{maximum})")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """파싱된 cron 표현식"""
+
+    expression: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    day_restricted: bool
+    weekday_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        """cron 표현식 파싱 (형식 오류 시 ValueError)"""
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression}")
+
+        minutes, hours, days, months, weekdays = (
+            _parse_field(field, minimum, maximum) for field, (minimum, maximum) in zip(fields, _FIELD_RANGES)
+        )
+        return cls(
+            expression=expression,
+            minutes=minutes,
+            hours=hours,
+            days=days,
+            months=months,
+            weekdays=frozenset(day % 7 for day in weekdays),
+            day_restricted=fields[2] != "*",
+            weekday_restricted=fields[4] != "*",
+        )
+
+    def _matches_day(self, moment: datetime) -> bool:
+        """날짜(일/요일) 조건 확인"""
+        day_match = moment.day in self.days
+        weekday_match = (moment.isoweekday() % 7) in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def next_after(self, moment: datetime) -> datetime:
+        """moment 이후(초과) 첫 실행 시각 (moment의 시간대 기준)"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+
+        while candidate < limit:
+            if candidate.month not in self.months or not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식입니다: {self.expression}")
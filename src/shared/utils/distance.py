@@ -8,8 +8,6 @@ Haversine 공식을 사용하여 두 좌표 간 거리를 계산
 import logging
 from typing import Optional
 
-from geopy.distance import geodesic
-
 logger = logging.getLogger(__name__)
 
 # 포인트 계산 기준: 500m당 1포인트
@@ -45,6 +43,9 @@ def calculate_distance_meters(
     if not (-180 <= lon1 <= 180) or not (-180 <= lon2 <= 180):
         raise ValueError(f"경도 값은 -180 ~ 180 범위여야 합니다: lon1={lon1}, lon2={lon2}")
 
+    # geopy는 import 비용이 커서(geocoders 등 함께 로드) 첫 거리 계산 시점에 로드 (콜드 스타트 단축)
+    from geopy.distance import geodesic
+
     # 좌표 형식: (위도, 경도)
     point1 = (lat1, lon1)
     point2 = (lat2, lon2)
@@ -58,6 +59,28 @@ def calculate_distance_meters(
     return distance_meters
 
 
+# PostGIS ST_Distance(geography, geography)와의 허용 오차 (미터)
+# 둘 다 WGS84 타원체 측지선 거리(Karney 알고리즘, PostGIS 2.2+/PROJ 4.9+)라 실제 차이는 1mm 미만이며
+# 정수 변환(버림) 경계에서만 1m 차이가 날 수 있음
+GEOGRAPHY_DISTANCE_TOLERANCE_M = 1
+
+
+def geography_distance_m(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+) -> int:
+    """
+    PostGIS geography 거리와 같은 기준의 두 좌표 간 거리 (미터, 정수 버림)
+    DB 왕복 없이 프로세스 안에서 계산 (허용 오차: GEOGRAPHY_DISTANCE_TOLERANCE_M)
+
+    Raises:
+        ValueError: 좌표 값이 유효하지 않은 경우
+    """
+    return int(calculate_distance_meters(lat1, lon1, lat2, lon2))
+
+
 def calculate_trip_total_distance(
     start_lat: float,
     start_lon: float,
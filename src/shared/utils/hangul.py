@@ -0,0 +1,72 @@
+"""
+한글 문자열 유틸리티
+
+역 이름 검색용 음절 분해 함수
+- 초성 추출 (예: "반월당" → "ㅂㅇㄷ")
+- 자모 분해 (예: "반" → "ㅂㅏㄴ", 오타 허용 거리 계산용)
+"""
+
+# 한글 음절 범위 (가 ~ 힣)
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_END = 0xD7A3
+
+# 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+
+def is_syllable(char: str) -> bool:
+    """완성형 한글 음절인지 확인"""
+    return SYLLABLE_BASE <= ord(char) <= SYLLABLE_END
+
+
+def is_choseong(char: str) -> bool:
+    """초성으로 쓰이는 호환 자모(ㄱ, ㄴ, ...)인지 확인"""
+    return char in CHOSEONG
+
+
+def choseong_of(char: str) -> str:
+    """음절의 초성 (한글 음절이 아니면 문자 그대로)"""
+    if not is_syllable(char):
+        return char
+    return CHOSEONG[(ord(char) - SYLLABLE_BASE) // (JUNGSEONG_COUNT * JONGSEONG_COUNT)]
+
+
+def has_jongseong(char: str) -> bool:
+    """받침이 있는 음절인지 확인"""
+    return is_syllable(char) and (ord(char) - SYLLABLE_BASE) % JONGSEONG_COUNT != 0
+
+
+def strip_jongseong(char: str) -> str:
+    """음절에서 받침을 뗀 음절 (예: "당" → "다", 한글 음절이 아니면 그대로)"""
+    if not is_syllable(char):
+        return char
+    offset = ord(char) - SYLLABLE_BASE
+    return chr(SYLLABLE_BASE + offset - offset % JONGSEONG_COUNT)
+
+
+def to_choseong(text: str) -> str:
+    """문자열의 초성 문자열 (예: "반월당역" → "ㅂㅇㄷㅇ")"""
+    return "".join(choseong_of(char) for char in text)
+
+
+def decompose(text: str) -> str:
+    """
+    문자열을 자모 단위로 분해 (예: "반월" → "ㅂㅏㄴㅇㅝㄹ")
+    한 글자 오타가 음절 전체가 아닌 자모 1~2개 차이가 되도록 하기 위해 사용
+    """
+    jamo = []
+    for char in text:
+        if not is_syllable(char):
+            jamo.append(char)
+            continue
+        offset = ord(char) - SYLLABLE_BASE
+        jamo.append(CHOSEONG[offset // (JUNGSEONG_COUNT * JONGSEONG_COUNT)])
+        jamo.append(JUNGSEONG[offset // JONGSEONG_COUNT % JUNGSEONG_COUNT])
+        if offset % JONGSEONG_COUNT:
+            jamo.append(JONGSEONG[offset % JONGSEONG_COUNT])
+    return "".join(jamo)
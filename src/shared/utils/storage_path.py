@@ -0,0 +1,47 @@
+"""
+Storage 경로 유틸리티
+
+Supabase Storage URL(public/sign)과 버킷 내 객체 경로 간 변환 기능 제공
+trips 테이블에는 만료되는 URL 대신 객체 경로만 저장
+"""
+
+from typing import Optional
+from urllib.parse import unquote, urlparse
+
+# 여정 인증 이미지 버킷명
+TRIP_IMAGE_BUCKET = "trips"
+
+
+def is_object_path(value: str) -> bool:
+    """
+    URL이 아닌 버킷 내 객체 경로인지 확인
+    예: "user_id/20260101_120000_ab12cd34_transfer.jpg"
+    """
+    return "://" not in value
+
+
+def extract_object_path(value: Optional[str], bucket: str = TRIP_IMAGE_BUCKET) -> Optional[str]:
+    """
+    이미지 값에서 버킷 내 객체 경로 추출
+
+    - 이미 객체 경로이면 그대로 반환
+    - Supabase Storage public/sign URL이면 버킷 이후 경로 반환
+    - 그 외 외부 URL이면 None 반환
+
+    예시:
+        입력: https://xxx.supabase.co/storage/v1/object/sign/trips/user_id/file.jpg?token=...
+        출력: user_id/file.jpg
+    """
+    if not value:
+        return None
+
+    if is_object_path(value):
+        return value.lstrip("/") or None
+
+    path = urlparse(value).path
+    for access in ("public", "sign", "authenticated"):
+        marker = f"/storage/v1/object/{access}/{bucket}/"
+        if marker in path:
+            return unquote(path.split(marker, 1)[1]) or None
+
+    return None
@@ -0,0 +1,26 @@
+"""
+토큰 유틸리티
+
+미들웨어에서 인증 의존성 실행 전에 요청 사용자를 구분하기 위한 JWT 보조 함수
+"""
+
+import base64
+import json
+from typing import Optional
+
+
+def unverified_token_subject(authorization: str) -> Optional[str]:
+    """
+    Bearer 토큰(JWT) payload의 sub 클레임 추출 (서명 검증 없음)
+    요청 한도 버킷, 주 DB 고정 등 사용자 구분 용도로만 사용하며 인증에는 사용하지 않음
+    """
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    subject = claims.get("sub") if isinstance(claims, dict) else None
+    return subject if isinstance(subject, str) and subject else None
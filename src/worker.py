@@ -0,0 +1,80 @@
+"""
+Background Job Worker
+
+jobs 테이블의 작업을 처리하는 워커 프로세스
+동시 처리 수만큼 asyncio 작업을 띄워 각각 작업을 꺼내 처리 (FOR UPDATE SKIP LOCKED)
+처리량이 부족하면 워커 프로세스(또는 --concurrency)를 늘리면 됨
+
+사용법:
+    python -m src.worker                   # 설정값(WORKER_CONCURRENCY)만큼 동시 처리
+    python -m src.worker --concurrency 8   # 동시 처리 수 지정
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import signal
+
+from src.config import get_settings
+from src.infrastructure.jobs.handlers import HANDLERS
+from src.infrastructure.jobs.queue import JobQueue, get_job_queue
+
+logger = logging.getLogger("src.worker")
+
+
+async def _consume(queue: JobQueue, stop: asyncio.Event, poll_interval_seconds: float) -> None:
+    """작업을 하나씩 꺼내 처리, 큐가 비어 있으면 poll_interval_seconds(±20% 지터)만큼 대기"""
+    while not stop.is_set():
+        try:
+            result = await asyncio.to_thread(queue.run_next, HANDLERS)
+        except Exception as e:
+            logger.warning(f"작업 조회 실패: {str(e)}")
+            result = None
+
+        if result is not None:
+            continue
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=poll_interval_seconds * random.uniform(0.8, 1.2))
+        except TimeoutError:
+            pass
+
+
+async def run_worker(concurrency: int, poll_interval_seconds: float) -> None:
+    """SIGINT/SIGTERM을 받을 때까지 작업 처리 (진행 중인 작업은 끝까지 처리 후 종료)"""
+    from src.infrastructure.database.session import close_db, init_db
+
+    init_db()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    queue = get_job_queue()
+    logger.info(f"워커 시작 (동시 처리 {concurrency}, 작업 종류: {', '.join(HANDLERS)})")
+    try:
+        await asyncio.gather(*(_consume(queue, stop, poll_interval_seconds) for _ in range(concurrency)))
+    finally:
+        close_db()
+        logger.info("워커 종료")
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="백그라운드 작업 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency, help="동시 처리 작업 수")
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=settings.worker_poll_interval_seconds,
+        help="큐가 비었을 때 조회 간격 (초)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(run_worker(concurrency=args.concurrency, poll_interval_seconds=args.poll_interval))
+
+
+if __name__ == "__main__":
+    main()
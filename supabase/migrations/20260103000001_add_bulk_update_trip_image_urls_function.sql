@@ -0,0 +1,27 @@
+-- Migration: trips 이미지 URL 일괄 갱신 함수
+-- 목적: Signed URL 갱신 시 여정마다 UPDATE를 보내지 않고 페이지 단위로 한 번에 반영
+--
+-- 사용 예 (PostgREST RPC):
+--   supabase.rpc("bulk_update_trip_image_urls", {"p_updates": [
+--       {"id": "...", "transfer_image_url": "...", "arrival_image_url": null}
+--   ]})
+-- NULL로 전달된 컬럼은 기존 값을 유지
+
+CREATE OR REPLACE FUNCTION bulk_update_trip_image_urls(p_updates jsonb)
+RETURNS integer
+LANGUAGE sql
+AS $$
+    WITH updated AS (
+        UPDATE public.trips t
+        SET
+            transfer_image_url = COALESCE(u.transfer_image_url, t.transfer_image_url),
+            arrival_image_url = COALESCE(u.arrival_image_url, t.arrival_image_url)
+        FROM jsonb_to_recordset(p_updates)
+            AS u(id uuid, transfer_image_url text, arrival_image_url text)
+        WHERE t.id = u.id
+        RETURNING 1
+    )
+    SELECT count(*)::integer FROM updated;
+$$;
+
+COMMENT ON FUNCTION bulk_update_trip_image_urls(jsonb) IS 'trips 이미지 URL 일괄 갱신 (NULL 값은 기존 값 유지)';
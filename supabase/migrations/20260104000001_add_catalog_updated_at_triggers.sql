@@ -0,0 +1,19 @@
+-- stations / parking_lots updated_at 자동 갱신 트리거
+-- 카탈로그 버전(ETag/Last-Modified)을 max(updated_at) + 행 수로 계산하므로
+-- 관리자 API 외 경로(스크립트, SQL 콘솔)로 수정되어도 updated_at이 반드시 갱신되어야 함
+
+DROP TRIGGER IF EXISTS update_stations_updated_at ON public.stations;
+CREATE TRIGGER update_stations_updated_at
+  BEFORE UPDATE ON public.stations
+  FOR EACH ROW
+  EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_parking_lots_updated_at ON public.parking_lots;
+CREATE TRIGGER update_parking_lots_updated_at
+  BEFORE UPDATE ON public.parking_lots
+  FOR EACH ROW
+  EXECUTE FUNCTION update_updated_at_column();
+
+-- max(updated_at) 조회용 인덱스
+CREATE INDEX IF NOT EXISTS idx_stations_updated_at ON public.stations (updated_at);
+CREATE INDEX IF NOT EXISTS idx_parking_lots_updated_at ON public.parking_lots (updated_at);
@@ -0,0 +1,24 @@
+-- 사용자당 진행 중(DRIVING/TRANSFERRED) 여행 1건 보장
+-- 여행 시작 시 "활성 여행 조회 → 생성" 2회 왕복 대신 INSERT 1회로 처리하고,
+-- 동시에 두 번 시작 요청이 와도 DB가 유일성을 강제함 (위반 시 23505 → 409 Conflict)
+
+-- 1. 기존 중복 활성 여행 정리 (가장 최근 여행만 유지, 나머지는 반려 처리)
+WITH ranked AS (
+  SELECT id,
+         row_number() OVER (PARTITION BY user_id ORDER BY created_at DESC, id DESC) AS rn
+  FROM public.trips
+  WHERE status IN ('DRIVING', 'TRANSFERRED')
+)
+UPDATE public.trips t
+SET status = 'REJECTED',
+    admin_note = COALESCE(t.admin_note || ' / ', '') || '중복 진행 중 여행 자동 정리'
+FROM ranked r
+WHERE t.id = r.id
+  AND r.rn > 1;
+
+-- 2. 부분 유니크 인덱스 (활성 여행 조회 인덱스로도 사용)
+CREATE UNIQUE INDEX IF NOT EXISTS trips_one_active_per_user_idx
+  ON public.trips (user_id)
+  WHERE status IN ('DRIVING', 'TRANSFERRED');
+
+COMMENT ON INDEX public.trips_one_active_per_user_idx IS '사용자당 진행 중(DRIVING/TRANSFERRED) 여행 1건 제한';
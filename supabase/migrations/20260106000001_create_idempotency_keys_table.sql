@@ -0,0 +1,20 @@
+-- 여행 시작/환승/도착 API의 Idempotency-Key 응답 저장소 (IDEMPOTENCY_BACKEND=postgres 일 때 사용)
+-- 인스턴스가 여러 대일 때 다른 인스턴스로 재시도된 요청도 저장된 응답을 반환하도록 함
+-- key는 (사용자 ID(토큰 sub), 경로, Idempotency-Key)의 SHA-256 해시 (토큰 갱신 후 재시도도 같은 키, 토큰은 저장되지 않음)
+-- 저장된 응답 재생 전 미들웨어가 토큰을 검증하여 sub를 위조한 요청은 401로 거절
+
+CREATE TABLE IF NOT EXISTS public.idempotency_keys (
+  key TEXT PRIMARY KEY,
+  fingerprint TEXT NOT NULL,
+  status_code SMALLINT NOT NULL,
+  content_type TEXT NOT NULL DEFAULT '',
+  body BYTEA NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  expires_at TIMESTAMPTZ NOT NULL
+);
+
+-- 만료 키 정리용
+CREATE INDEX IF NOT EXISTS idempotency_keys_expires_at_idx
+  ON public.idempotency_keys (expires_at);
+
+COMMENT ON TABLE public.idempotency_keys IS 'Idempotency-Key 재시도 응답 저장소 (만료 행은 주기적으로 삭제)';
@@ -0,0 +1,17 @@
+-- 다중 워커/인스턴스 공유 요청 한도 카운터 (RATE_LIMIT_BACKEND=postgres 일 때 사용)
+-- (키, 윈도 시작 시각) 단위 고정 윈도 카운터를 INSERT ... ON CONFLICT DO UPDATE로 1회 왕복에 증가시킴
+-- 키는 "정책:user:<사용자 ID>" 또는 "정책:ip:<IP>" 형식
+
+CREATE UNLOGGED TABLE IF NOT EXISTS public.rate_limit_counters (
+  key TEXT NOT NULL,
+  window_start TIMESTAMPTZ NOT NULL,
+  expires_at TIMESTAMPTZ NOT NULL,
+  count INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (key, window_start)
+);
+
+-- 지난 윈도 정리용
+CREATE INDEX IF NOT EXISTS rate_limit_counters_expires_at_idx
+  ON public.rate_limit_counters (expires_at);
+
+COMMENT ON TABLE public.rate_limit_counters IS '요청 한도 공유 카운터 (UNLOGGED, 지난 윈도 행은 주기적으로 삭제)';
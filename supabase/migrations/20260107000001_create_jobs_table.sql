@@ -0,0 +1,27 @@
+-- 백그라운드 작업 큐 (워커: python -m src.worker)
+-- 워커는 FOR UPDATE SKIP LOCKED로 작업을 1건씩 잠가 처리하므로 여러 워커가 동시에 실행되어도 중복 처리 없음
+-- 실패한 작업은 지수 백오프로 run_at을 미뤄 재시도하고, max_attempts를 넘으면 failed로 남김
+
+CREATE TABLE IF NOT EXISTS public.jobs (
+  id BIGSERIAL PRIMARY KEY,
+  kind TEXT NOT NULL,
+  payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+  status TEXT NOT NULL DEFAULT 'queued',
+  attempts INTEGER NOT NULL DEFAULT 0,
+  max_attempts INTEGER NOT NULL DEFAULT 5,
+  run_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  last_error TEXT,
+  dedupe_key TEXT UNIQUE,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+  CONSTRAINT jobs_status_check CHECK (status IN ('queued', 'done', 'failed'))
+);
+
+-- 실행 대기 작업 조회 (WHERE status = 'queued' AND run_at <= now() ORDER BY run_at, id)
+CREATE INDEX IF NOT EXISTS jobs_queued_run_at_idx
+  ON public.jobs (run_at, id)
+  WHERE status = 'queued';
+
+COMMENT ON TABLE public.jobs IS '백그라운드 작업 큐 (FOR UPDATE SKIP LOCKED)';
+COMMENT ON COLUMN public.jobs.dedupe_key IS '중복 등록 방지 키 (예: credit_trip_points:<trip_id>)';
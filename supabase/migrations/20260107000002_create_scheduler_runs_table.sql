@@ -0,0 +1,14 @@
+-- 주기 유지보수 작업 실행 기록
+-- 스케줄러는 pg_try_advisory_lock으로 작업 잠금을 잡은 뒤 이 테이블에 실행 슬롯을 선점하므로
+-- 여러 인스턴스가 실행되어도 같은 슬롯은 한 번만 실행됨 (slot이 더 큰 경우에만 갱신)
+
+CREATE TABLE IF NOT EXISTS public.scheduler_runs (
+  task TEXT PRIMARY KEY,
+  slot TIMESTAMPTZ NOT NULL,
+  started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  finished_at TIMESTAMPTZ,
+  last_duration_ms DOUBLE PRECISION,
+  last_error TEXT
+);
+
+COMMENT ON TABLE public.scheduler_runs IS '주기 작업별 마지막 실행 슬롯, 소요 시간, 오류';
@@ -140,6 +140,26 @@ class TestLogin:
         assert data["status"] == "error"
 
 
+class TestAuthRateLimit:
+    """로그인 요청 한도 테스트 클래스"""
+
+    def test_login_rate_limited(self, test_client: TestClient, test_settings):
+        """
+        로그인 요청 한도 초과 테스트
+        같은 IP에서 분당 한도를 넘겨 로그인하면 429 Too Many Requests + Retry-After 반환
+        """
+        credentials = {"email": "nonexistent@example.com", "password": "password123"}
+        for _ in range(test_settings.rate_limit_auth_per_minute):
+            response = test_client.post("/api/v1/auth/login", json=credentials)
+            assert response.status_code == 401
+
+        response = test_client.post("/api/v1/auth/login", json=credentials)
+
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) >= 1
+        assert response.json()["status"] == "error"
+
+
 class TestProfile:
     """프로필 관리 테스트 클래스"""
 
@@ -0,0 +1,106 @@
+"""
+요청 한도 미들웨어 테스트
+
+X-Forwarded-For 위조, 위조 토큰(sub)으로 새 버킷을 얻는 우회 차단과 버킷 정리 테스트 (DB 없이 실행)
+"""
+
+import base64
+import json
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.api.middleware.rate_limit import RateLimitMiddleware, RateLimitPolicy
+from src.infrastructure.rate_limiter import RateLimiter, TokenBucketLimiter
+
+
+def _client(policy: RateLimitPolicy, trusted_proxy_hops: int = 1) -> TestClient:
+    async def endpoint(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route(policy.path_pattern, endpoint, methods=["POST"])])
+    app.add_middleware(
+        RateLimitMiddleware,
+        policies=(policy,),
+        limiter=RateLimiter(local=TokenBucketLimiter()),
+        trusted_proxy_hops=trusted_proxy_hops,
+    )
+    return TestClient(app)
+
+
+def _forged_token(subject: str) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": subject}).encode()).decode().rstrip("=")
+    return f"Bearer e30.{payload}.signature"
+
+
+class TestRateLimitMiddleware:
+    """요청 한도 미들웨어 테스트 클래스"""
+
+    def test_spoofed_forwarded_for_does_not_bypass_limit(self):
+        """
+        X-Forwarded-For 위조 테스트
+        클라이언트가 보낸 왼쪽 주소를 바꿔도 프록시가 덧붙인 오른쪽 주소 기준으로 한도 적용
+        """
+        client = _client(RateLimitPolicy(name="auth", path_pattern="/login", limit=2))
+
+        statuses = [
+            client.post("/login", headers={"X-Forwarded-For": f"10.0.0.{i}, 203.0.113.7"}).status_code
+            for i in range(3)
+        ]
+
+        assert statuses == [200, 200, 429]
+
+    def test_forged_subject_still_limited_by_ip(self):
+        """
+        위조 토큰 테스트
+        요청마다 다른 sub를 보내도 같은 IP의 보호 버킷(ip_limit)에서 한도 적용
+        """
+        client = _client(RateLimitPolicy(name="upload", path_pattern="/upload", limit=2, ip_limit=4, key_by="user"))
+
+        statuses = [
+            client.post(
+                "/upload",
+                headers={"Authorization": _forged_token(f"user-{i}"), "X-Forwarded-For": "203.0.113.7"},
+            ).status_code
+            for i in range(5)
+        ]
+
+        assert statuses == [200, 200, 200, 200, 429]
+
+    def test_users_sharing_ip_have_separate_limits(self):
+        """
+        IP 공유 사용자 테스트
+        같은 IP(NAT, 통신사 게이트웨이) 뒤의 사용자도 사용자당 한도를 각각 적용받음
+        """
+        client = _client(RateLimitPolicy(name="upload", path_pattern="/upload", limit=2, ip_limit=20, key_by="user"))
+
+        def upload(subject: str) -> int:
+            headers = {"Authorization": _forged_token(subject), "X-Forwarded-For": "203.0.113.7"}
+            return client.post("/upload", headers=headers).status_code
+
+        statuses = [upload("user-a"), upload("user-a"), upload("user-b"), upload("user-b"), upload("user-a")]
+
+        assert statuses == [200, 200, 200, 200, 429]
+
+
+class TestTokenBucketLimiter:
+    """토큰 버킷 테스트 클래스"""
+
+    def test_evicts_least_recently_used_bucket(self):
+        """
+        버킷 정리 테스트
+        max_keys 초과 시 가장 오래 쓰지 않은 버킷을 제거하고 최근 사용한 버킷은 유지
+        """
+        limiter = TokenBucketLimiter(max_keys=2)
+        limiter.acquire("a", limit=1, window_seconds=60)
+        limiter.acquire("b", limit=1, window_seconds=60)
+        limiter.acquire("a", limit=1, window_seconds=60)
+
+        limiter.acquire("c", limit=1, window_seconds=60)
+
+        # "a"는 최근 사용되어 남아 있고 토큰이 소진된 상태 유지
+        assert not limiter.acquire("a", limit=1, window_seconds=60).allowed
+        # "b"는 제거되어 새 버킷으로 허용
+        assert limiter.acquire("b", limit=1, window_seconds=60).allowed
@@ -317,6 +317,18 @@ def admin_client(test_client: TestClient, admin_user_data: dict, test_settings:
 # ============================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """
+    테스트마다 요청 한도 버킷 초기화
+    픽스처의 회원가입/로그인 요청이 테스트 간에 누적되어 429가 나지 않도록 함
+    """
+    from src.infrastructure.rate_limiter import get_rate_limiter
+
+    get_rate_limiter().local.reset()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def cleanup_test_data(supabase_client: Client):
     """
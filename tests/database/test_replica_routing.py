@@ -0,0 +1,106 @@
+"""
+읽기 복제본 라우팅 테스트
+
+get_*/count_* 레포지토리 호출의 복제본 라우팅과 read-your-writes 고정 테스트
+"""
+
+import asyncio
+import contextvars
+
+from src.infrastructure.database.routing import (
+    RecentWriters,
+    ReplicaRoutedClient,
+    pin_primary,
+    route_reads,
+    use_replica,
+)
+
+
+@route_reads
+class _Repository:
+    async def get_item(self) -> bool:
+        return use_replica()
+
+    async def count_items(self) -> bool:
+        return use_replica()
+
+    async def create_item(self) -> bool:
+        return use_replica()
+
+
+class _Client:
+    def __init__(self, name: str):
+        self.name = name
+        self.auth = f"{name}-auth"
+
+    def table(self, table_name: str) -> str:
+        return f"{self.name}:{table_name}"
+
+
+def _run(coro_factory):
+    """테스트마다 독립된 컨텍스트(요청)에서 실행"""
+    return contextvars.copy_context().run(lambda: asyncio.run(coro_factory()))
+
+
+class TestRouteReads:
+    """레포지토리 메서드 라우팅 테스트 클래스"""
+
+    def test_read_methods_use_replica(self):
+        """get_*/count_* 메서드만 복제본 사용, 쓰기 메서드는 주 DB"""
+        repository = _Repository()
+
+        async def scenario():
+            return await repository.get_item(), await repository.count_items(), await repository.create_item()
+
+        assert _run(scenario) == (True, True, False)
+        assert use_replica() is False
+
+    def test_pinned_request_uses_primary(self):
+        """주 DB로 고정된 요청은 읽기 메서드도 주 DB 사용"""
+        repository = _Repository()
+
+        async def scenario():
+            pin_primary()
+            return await repository.get_item()
+
+        assert _run(scenario) is False
+        # 고정은 해당 요청 컨텍스트에만 적용
+        assert _run(repository.get_item) is True
+
+
+class TestReplicaRoutedClient:
+    """Supabase 클라이언트 라우팅 테스트 클래스"""
+
+    def test_table_routing(self):
+        """읽기 호출의 table()만 복제본으로 가고 auth 등은 주 클라이언트 사용"""
+        client = ReplicaRoutedClient(_Client("primary"), [_Client("replica")])
+
+        @route_reads
+        class _TableRepository:
+            async def get_table(self) -> str:
+                return client.table("trips")
+
+            async def update_table(self) -> str:
+                return client.table("trips")
+
+        repository = _TableRepository()
+        assert _run(repository.get_table) == "replica:trips"
+        assert _run(repository.update_table) == "primary:trips"
+        assert client.auth == "primary-auth"
+
+
+class TestRecentWriters:
+    """최근 쓰기 사용자 기록 테스트 클래스"""
+
+    def test_window(self):
+        """기록 후 window 동안만 최근 쓰기 사용자로 판단"""
+        writers = RecentWriters(window_seconds=60)
+        writers.mark("user-1")
+
+        assert writers.wrote_recently("user-1") is True
+        assert writers.wrote_recently("user-2") is False
+        assert writers.wrote_recently(None) is False
+
+        expired = RecentWriters(window_seconds=0)
+        expired.mark("user-1")
+        assert expired.wrote_recently("user-1") is False
@@ -0,0 +1,66 @@
+"""
+백그라운드 작업 큐 테스트
+
+jobs 테이블 작업 등록(중복 방지)과 재시도 백오프 계산 테스트
+"""
+
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from src.infrastructure.database.session import get_engine
+from src.infrastructure.jobs.queue import JobQueue
+
+
+class TestJobQueue:
+    """작업 큐 테스트 클래스"""
+
+    def test_backoff_grows_exponentially_with_cap(self):
+        """
+        재시도 백오프 테스트
+        실패할 때마다 대기 시간이 2배로 늘고 상한을 넘지 않음
+        """
+        queue = JobQueue(max_attempts=5, backoff_base_seconds=5, backoff_max_seconds=30)
+
+        assert [queue.backoff_seconds(attempts) for attempts in range(1, 6)] == [5, 10, 20, 30, 30]
+
+    def test_enqueue_with_dedupe_key_registers_once(self):
+        """
+        중복 방지 키 테스트
+        같은 dedupe_key로 두 번 등록하면 한 번만 등록되고 두 번째는 None 반환
+        """
+        queue = JobQueue(max_attempts=5, backoff_base_seconds=5, backoff_max_seconds=30)
+        dedupe_key = f"test:{uuid4()}"
+
+        # 워커가 바로 처리하지 않도록 실행 시각을 미룸
+        first_id = queue.enqueue("test_job", {"value": 1}, dedupe_key=dedupe_key, delay_seconds=3600)
+        second_id = queue.enqueue("test_job", {"value": 2}, dedupe_key=dedupe_key, delay_seconds=3600)
+
+        try:
+            assert first_id is not None
+            assert second_id is None
+        finally:
+            with get_engine().begin() as connection:
+                connection.execute(text("DELETE FROM jobs WHERE dedupe_key = :key"), {"key": dedupe_key})
+
+    def test_enqueue_in_caller_transaction_rolls_back_together(self):
+        """
+        호출자 트랜잭션 등록 테스트
+        connection을 넘겨 등록한 작업은 호출자 트랜잭션이 롤백되면 함께 취소됨
+        (여정 승인과 포인트 지급 작업 등록이 함께 커밋/롤백되는 근거)
+        """
+        queue = JobQueue(max_attempts=5, backoff_base_seconds=5, backoff_max_seconds=30)
+        dedupe_key = f"test:{uuid4()}"
+
+        with get_engine().connect() as connection:
+            with connection.begin() as transaction:
+                job_id = queue.enqueue("test_job", {"value": 1}, dedupe_key=dedupe_key, delay_seconds=3600, connection=connection)
+                transaction.rollback()
+
+        with get_engine().connect() as connection:
+            remaining = connection.execute(
+                text("SELECT count(*) FROM jobs WHERE dedupe_key = :key"), {"key": dedupe_key}
+            ).scalar_one()
+
+        assert job_id is not None
+        assert remaining == 0
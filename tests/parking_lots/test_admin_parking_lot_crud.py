@@ -36,7 +36,7 @@ class TestAdminParkingLotCreate:
         assert data["status"] == "success"
         assert data["data"]["name"] == "테스트주차장_생성"
         assert data["data"]["station_id"] == station_id
-        # distance_to_station_m은 자동 계산됨 (PostGIS)
+        # distance_to_station_m은 자동 계산됨 (geography 측지선 거리)
         assert data["data"]["distance_to_station_m"] is not None
 
         # 생성된 주차장 ID 저장 (정리용)
@@ -203,3 +203,55 @@ class TestAdminStationCascadeDelete:
         # 4. 역 조회 시 404 확인
         get_station_response = admin_client.get(f"/api/v1/stations/{station_id}")
         assert get_station_response.status_code == 404
+
+
+class TestAdminParkingLotDistanceRecompute:
+    """관리자 주차장 거리 재계산 테스트 클래스"""
+
+    def test_station_move_recomputes_distances(self, admin_client: TestClient):
+        """
+        역 좌표 수정 시 주차장 거리 재계산 테스트
+        역을 옮기면 연결된 주차장의 distance_to_station_m이 새 좌표 기준으로 바뀜
+        """
+        station_response = admin_client.post(
+            "/api/v1/admin/stations",
+            json={"name": "거리재계산테스트역", "line_number": 4, "latitude": 35.8550, "longitude": 128.5850},
+        )
+        assert station_response.status_code == 201
+        station_id = station_response.json()["data"]["id"]
+
+        parking_response = admin_client.post(
+            "/api/v1/admin/parking-lots",
+            json={"station_id": station_id, "name": "거리재계산테스트주차장", "address": "대구광역시 중구 동성로2가 88-25"},
+        )
+        assert parking_response.status_code == 201
+        distance_before = parking_response.json()["data"]["distance_to_station_m"]
+
+        # 역을 약 1km 북쪽으로 이동
+        update_response = admin_client.put(f"/api/v1/admin/stations/{station_id}", json={"latitude": 35.8640})
+        assert update_response.status_code == 200
+
+        lots = admin_client.get(f"/api/v1/stations/{station_id}/parking-lots").json()["data"]["parking_lots"]
+        distance_after = lots[0]["distance_to_station_m"]
+        assert distance_after != distance_before
+
+        # 이미 최신 거리이므로 전체 재계산 시 이 주차장의 거리는 바뀌지 않음
+        recompute_response = admin_client.post("/api/v1/admin/parking-lots/recompute-distances")
+        assert recompute_response.status_code == 200
+        lots = admin_client.get(f"/api/v1/stations/{station_id}/parking-lots").json()["data"]["parking_lots"]
+        assert lots[0]["distance_to_station_m"] == distance_after
+
+        # 첫 재계산이 다른 주차장의 오래된 거리를 모두 갱신했으므로 다시 실행하면 갱신 건수 0
+        second_response = admin_client.post("/api/v1/admin/parking-lots/recompute-distances")
+        assert second_response.status_code == 200
+        assert second_response.json()["data"]["updated_count"] == 0
+
+        admin_client.delete(f"/api/v1/admin/stations/{station_id}")
+
+    def test_recompute_distances_non_admin(self, authenticated_client: TestClient):
+        """
+        일반 사용자 거리 재계산 테스트
+        관리자가 아니면 403 Forbidden 반환
+        """
+        response = authenticated_client.post("/api/v1/admin/parking-lots/recompute-distances")
+        assert response.status_code == 403
@@ -0,0 +1,40 @@
+"""
+주차장-역 거리 계산 테스트
+
+프로세스 내 측지선 거리가 PostGIS ST_Distance(geography) 결과와 허용 오차 안에서 일치하는지 테스트
+"""
+
+import pytest
+
+from src.shared.utils.distance import GEOGRAPHY_DISTANCE_TOLERANCE_M, geography_distance_m
+
+
+class TestGeographyDistance:
+    """geography 거리 계산 테스트 클래스"""
+
+    @pytest.mark.parametrize(
+        ("lat1", "lon1", "lat2", "lon2", "postgis_meters"),
+        [
+            # SELECT ST_Distance('POINT(0 0)'::geography, 'POINT(1 0)'::geography)
+            (0.0, 0.0, 0.0, 1.0, 111319.49079327357),
+            # SELECT ST_Distance('POINT(0 0)'::geography, 'POINT(0 1)'::geography)
+            (0.0, 0.0, 1.0, 0.0, 110574.38855779878),
+        ],
+    )
+    def test_matches_postgis_geography(
+        self, lat1: float, lon1: float, lat2: float, lon2: float, postgis_meters: float
+    ):
+        """
+        PostGIS geography 거리와 비교
+        WGS84 타원체 기준 측지선 거리이므로 허용 오차(1m) 안에서 일치
+        """
+        assert abs(geography_distance_m(lat1, lon1, lat2, lon2) - postgis_meters) <= GEOGRAPHY_DISTANCE_TOLERANCE_M
+
+    def test_same_point_is_zero(self):
+        """같은 좌표 간 거리는 0"""
+        assert geography_distance_m(35.8575, 128.5974, 35.8575, 128.5974) == 0
+
+    def test_invalid_coordinates(self):
+        """범위를 벗어난 좌표는 ValueError"""
+        with pytest.raises(ValueError):
+            geography_distance_m(91.0, 0.0, 0.0, 0.0)
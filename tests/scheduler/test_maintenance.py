@@ -0,0 +1,105 @@
+"""
+유지보수 작업 테스트
+
+좌표 일치 확인 작업의 불일치 판정(좌표 차이, 한쪽만 NULL)과 실패 메시지 테스트
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure import maintenance
+from src.infrastructure.database.session import get_engine
+
+# (latitude, longitude, location 경도, location 위도) - location 경도/위도가 None이면 location NULL
+CONSISTENT_ROW = (35.8575, 128.5974, 128.5974, 35.8575)
+SHIFTED_ROW = (35.8575, 128.5974, 128.5974, 35.8675)
+LOCATION_NULL_ROW = (35.8575, 128.5974, None, None)
+LATITUDE_NULL_ROW = (None, 128.5974, 128.5974, 35.8575)
+BOTH_NULL_ROW = (None, None, None, None)
+
+
+@pytest.fixture
+def coordinate_table():
+    """
+    역/주차장과 같은 좌표 컬럼 구성의 임시 테이블 생성 함수
+    _count_coordinate_mismatches는 별도 연결을 쓰므로 일반 테이블로 만들고 테스트 후 삭제
+    """
+    table = f"coordinate_check_{uuid4().hex[:8]}"
+    engine = get_engine()
+
+    def create(rows: list[tuple]) -> str:
+        with engine.begin() as connection:
+            connection.execute(
+                text(f"CREATE TABLE {table} (latitude double precision, longitude double precision, location geography(Point, 4326))")
+            )
+            for latitude, longitude, location_lng, location_lat in rows:
+                connection.execute(
+                    text(
+                        f"INSERT INTO {table} (latitude, longitude, location) VALUES (:latitude, :longitude, "
+                        "CASE WHEN CAST(:lng AS double precision) IS NULL THEN NULL "
+                        "ELSE ST_SetSRID(ST_MakePoint(:lng, :lat), 4326)::geography END)"
+                    ),
+                    {"latitude": latitude, "longitude": longitude, "lng": location_lng, "lat": location_lat},
+                )
+        return table
+
+    yield create
+
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+
+class TestCoordinateMismatchCount:
+    """좌표 불일치 판정 테스트 클래스"""
+
+    def test_consistent_rows(self, coordinate_table):
+        """
+        일치하는 행 테스트
+        location과 같은 좌표, 양쪽 모두 NULL인 행은 불일치로 세지 않음
+        """
+        table = coordinate_table([CONSISTENT_ROW, BOTH_NULL_ROW])
+
+        assert maintenance._count_coordinate_mismatches(table) == 0
+
+    def test_shifted_coordinates(self, coordinate_table):
+        """
+        좌표 차이 테스트
+        latitude/longitude가 location과 허용 오차 이상 다르면 불일치
+        """
+        table = coordinate_table([CONSISTENT_ROW, SHIFTED_ROW])
+
+        assert maintenance._count_coordinate_mismatches(table) == 1
+
+    def test_one_side_null(self, coordinate_table):
+        """
+        한쪽만 NULL 테스트
+        location만 NULL이거나 latitude/longitude 중 하나만 NULL인 행은 불일치
+        """
+        table = coordinate_table([CONSISTENT_ROW, LOCATION_NULL_ROW, LATITUDE_NULL_ROW, BOTH_NULL_ROW])
+
+        assert maintenance._count_coordinate_mismatches(table) == 2
+
+
+class TestCheckCoordinateConsistency:
+    """좌표 일치 확인 작업 테스트 클래스"""
+
+    def test_passes_without_mismatches(self, monkeypatch: pytest.MonkeyPatch):
+        """불일치 행이 없으면 예외 없이 완료"""
+        monkeypatch.setattr(maintenance, "_count_coordinate_mismatches", lambda table: 0)
+
+        asyncio.run(maintenance.check_coordinate_consistency())
+
+    def test_reports_mismatched_tables(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        불일치 보고 테스트
+        불일치 행이 있는 테이블만 건수와 함께 RuntimeError 메시지에 포함
+        """
+        counts = {"stations": 0, "parking_lots": 3}
+        monkeypatch.setattr(maintenance, "_count_coordinate_mismatches", counts.__getitem__)
+
+        with pytest.raises(RuntimeError, match="parking_lots 3건") as exc_info:
+            asyncio.run(maintenance.check_coordinate_consistency())
+        assert "stations" not in str(exc_info.value)
@@ -0,0 +1,77 @@
+"""
+주기 작업 스케줄러 테스트
+
+cron 표현식 다음 실행 시각 계산과 interval 슬롯 정렬 테스트
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.infrastructure.scheduler import ScheduledTask
+from src.shared.utils.cron import CronSchedule
+
+SEOUL = ZoneInfo("Asia/Seoul")
+
+
+async def _noop() -> None:
+    pass
+
+
+class TestCronSchedule:
+    """cron 표현식 테스트 클래스"""
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("*/15 * * * *", datetime(2026, 2, 1, 0, 0, tzinfo=SEOUL)),
+            ("30 4 * * *", datetime(2026, 2, 1, 4, 30, tzinfo=SEOUL)),
+            ("0 */6 * * *", datetime(2026, 2, 1, 0, 0, tzinfo=SEOUL)),
+            ("0 9 * * 1", datetime(2026, 2, 2, 9, 0, tzinfo=SEOUL)),
+            ("0 0 29 2 *", datetime(2028, 2, 29, 0, 0, tzinfo=SEOUL)),
+        ],
+    )
+    def test_next_after(self, expression: str, expected: datetime):
+        """
+        다음 실행 시각 계산 테스트
+        월말/요일/윤일 조합에서도 다음 일치 시각을 반환
+        """
+        now = datetime(2026, 1, 31, 23, 59, tzinfo=SEOUL)
+
+        assert CronSchedule.parse(expression).next_after(now) == expected
+
+    @pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "*/0 * * * *", "0 0 31 2 *"])
+    def test_invalid_expression(self, expression: str):
+        """
+        잘못된 cron 표현식 테스트
+        필드 수/범위/간격 오류나 존재하지 않는 날짜는 ValueError
+        """
+        with pytest.raises(ValueError):
+            CronSchedule.parse(expression).next_after(datetime(2026, 1, 1, tzinfo=SEOUL))
+
+
+class TestScheduledTask:
+    """주기 작업 정의 테스트 클래스"""
+
+    def test_interval_slot_aligned_to_wall_clock(self):
+        """
+        interval 슬롯 정렬 테스트
+        어느 인스턴스에서 계산해도 같은 슬롯(epoch 기준 interval 배수)이 나옴
+        """
+        task = ScheduledTask("test", _noop, interval_seconds=600)
+
+        first = task.next_slot(datetime(2026, 1, 1, 12, 3, 10, tzinfo=SEOUL))
+        second = task.next_slot(datetime(2026, 1, 1, 12, 9, 59, tzinfo=SEOUL))
+
+        assert first == second == datetime(2026, 1, 1, 12, 10, tzinfo=SEOUL)
+
+    def test_requires_exactly_one_schedule(self):
+        """
+        스케줄 지정 검증 테스트
+        interval_seconds와 cron 중 정확히 하나만 지정해야 함
+        """
+        with pytest.raises(ValueError):
+            ScheduledTask("test", _noop)
+        with pytest.raises(ValueError):
+            ScheduledTask("test", _noop, interval_seconds=60, cron="* * * * *")
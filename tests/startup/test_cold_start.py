@@ -0,0 +1,67 @@
+"""
+콜드 스타트 테스트
+
+새 프로세스에서 앱을 띄워 첫 요청까지의 시간이 예산 안에 있는지,
+지연 로드 대상 모듈이 시작 시점에 로드되지 않는지,
+미리 생성된 OpenAPI 스키마가 현재 라우트와 일치하는지 확인
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.api.openapi import generate_openapi_schema, load_prebuilt_openapi
+from src.main import app
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 첫 요청까지 허용 시간 (ms), 배포 환경에 맞게 COLD_START_BUDGET_MS로 조정
+COLD_START_BUDGET_MS = float(os.getenv("COLD_START_BUDGET_MS", "4000"))
+
+
+@pytest.fixture(scope="module")
+def startup_profile() -> dict:
+    """scripts/profile_startup.py로 측정한 콜드 스타트 결과"""
+    completed = subprocess.run(
+        [sys.executable, "scripts/profile_startup.py", "--json"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+class TestColdStart:
+    """콜드 스타트 예산 테스트 클래스"""
+
+    def test_time_to_first_request_within_budget(self, startup_profile: dict):
+        """
+        첫 요청까지의 시간 테스트
+        인터프리터 시작부터 첫 /health 응답까지 예산 이내
+        """
+        assert startup_profile["time_to_first_request_ms"] <= COLD_START_BUDGET_MS, (
+            f"첫 요청까지 {startup_profile['time_to_first_request_ms']:.0f}ms "
+            f"(예산 {COLD_START_BUDGET_MS:.0f}ms), python scripts/profile_startup.py로 import 비용 확인"
+        )
+
+    def test_deferred_modules_not_loaded(self, startup_profile: dict):
+        """
+        지연 로드 테스트
+        geopy, 네이버 Geocoding 클라이언트는 첫 사용 전까지 로드되지 않음
+        """
+        assert startup_profile["deferred_modules_loaded"] == []
+
+    def test_prebuilt_openapi_up_to_date(self):
+        """
+        미리 생성된 OpenAPI 스키마 테스트
+        저장된 스키마가 현재 라우트로 생성한 스키마와 동일 (다르면 scripts/generate_openapi.py 실행)
+        """
+        prebuilt = load_prebuilt_openapi()
+
+        assert prebuilt is not None
+        assert prebuilt == generate_openapi_schema(app)
@@ -0,0 +1,42 @@
+"""
+Readiness 테스트
+
+시작 워밍업 완료 후 /ready가 준비 완료(200)로 전환되는지 확인
+"""
+
+import time
+
+from fastapi.testclient import TestClient
+
+# 워밍업 완료 대기 최대 시간 (초)
+READY_TIMEOUT_SECONDS = 30
+
+
+class TestReadiness:
+    """Readiness 엔드포인트 테스트 클래스"""
+
+    def test_ready_after_warmup(self, test_client: TestClient):
+        """
+        준비 완료 전환 테스트
+        워밍업이 끝나면 /ready가 200과 단계별 소요 시간을 반환
+        """
+        deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+        response = test_client.get("/ready")
+        while response.status_code == 503 and time.monotonic() < deadline:
+            time.sleep(0.1)
+            response = test_client.get("/ready")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["ready"] is True
+        assert {step["name"] for step in data["steps"]} >= {"db_pool", "postgrest", "stations"}
+        assert all(step["error"] is None for step in data["steps"])
+
+    def test_health_is_independent_of_readiness(self, test_client: TestClient):
+        """
+        liveness 테스트
+        /health는 워밍업 여부와 관계없이 항상 200
+        """
+        response = test_client.get("/health")
+
+        assert response.status_code == 200
@@ -139,6 +139,29 @@ class TestAdminStationUpdate:
         data = response.json()
         assert data["status"] == "error"
 
+    def test_update_station_invalidates_catalog_etag(self, admin_client: TestClient):
+        """
+        카탈로그 ETag 무효화 테스트
+        역 수정 후에는 이전 ETag로 조건부 요청해도 304가 아닌 200 반환
+        """
+        station_data = {
+            "name": "테스트역_캐시",
+            "line_number": 1,
+            "latitude": 35.8700,
+            "longitude": 128.6000,
+        }
+        created_id = admin_client.post("/api/v1/admin/stations", json=station_data).json()["data"]["id"]
+        etag = admin_client.get(f"/api/v1/stations/{created_id}").headers["etag"]
+
+        admin_client.put(f"/api/v1/admin/stations/{created_id}", json={"name": "테스트역_캐시_수정"})
+        response = admin_client.get(f"/api/v1/stations/{created_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["data"]["name"] == "테스트역_캐시_수정"
+
+        # 정리: 생성된 역 삭제
+        admin_client.delete(f"/api/v1/admin/stations/{created_id}")
+
 
 class TestAdminStationDelete:
     """관리자 역 삭제 테스트 클래스"""
@@ -183,6 +206,68 @@ class TestAdminStationDelete:
         assert data["status"] == "error"
 
 
+class TestAdminCatalogImport:
+    """관리자 카탈로그 일괄 등록 테스트 클래스"""
+
+    def test_import_catalog_upsert_and_report(self, admin_client: TestClient):
+        """
+        카탈로그 일괄 등록 테스트
+        같은 요청의 새 역에 주차장을 연결하여 생성하고, 다시 등록하면 수정으로 처리
+        연계 역이 없는 행은 실패 사유와 함께 건너뜀
+        """
+        payload = {
+            "stations": [
+                {"name": "일괄등록테스트역", "line_number": 1, "latitude": 35.8600, "longitude": 128.5800},
+            ],
+            "parking_lots": [
+                {
+                    "station_name": "일괄등록테스트역",
+                    "station_line_number": 1,
+                    "name": "일괄등록테스트주차장",
+                    "address": "대구광역시 중구 동성로2가 123",
+                    "latitude": 35.8610,
+                    "longitude": 128.5800,
+                },
+                {
+                    "station_name": "없는역",
+                    "station_line_number": 1,
+                    "name": "연계역없음주차장",
+                    "address": "대구광역시 중구 동성로2가 123",
+                    "latitude": 35.8610,
+                    "longitude": 128.5800,
+                },
+            ],
+        }
+
+        response = admin_client.post("/api/v1/admin/catalog/import", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [row["action"] for row in data["rows"]] == ["created", "created", "failed"]
+        assert data["rows"][2]["message"] is not None
+        station_id = data["rows"][0]["id"]
+
+        # 거리는 역 좌표 기준으로 자동 계산 (위도 0.001도 ≈ 111m)
+        detail = admin_client.get(f"/api/v1/stations/{station_id}").json()["data"]
+        assert 100 <= detail["parking_lots"][0]["distance_to_station_m"] <= 120
+
+        # 같은 키로 다시 등록하면 수정
+        response = admin_client.post("/api/v1/admin/catalog/import", json=payload)
+        assert response.json()["data"]["updated_count"] == 2
+
+        # 정리: 역 삭제 (주차장 CASCADE 삭제)
+        admin_client.delete(f"/api/v1/admin/stations/{station_id}")
+
+    def test_import_catalog_non_admin(self, authenticated_client: TestClient):
+        """
+        일반 사용자의 일괄 등록 시도 테스트
+        관리자가 아닌 사용자가 요청하면 403 Forbidden 반환
+        """
+        response = authenticated_client.post("/api/v1/admin/catalog/import", json={"stations": []})
+
+        assert response.status_code == 403
+
+
 # ============================================================================
 # 주차장(Parking Lot) 관리 테스트
 # ============================================================================
@@ -118,3 +118,71 @@ class TestStationDetail:
         assert response.status_code == 404
         data = response.json()
         assert data["status"] == "error"
+
+
+class TestStationConditionalCache:
+    """역 조회 API HTTP 조건부 캐싱 테스트 클래스"""
+
+    def test_catalog_response_has_cache_headers(self, test_client: TestClient):
+        """
+        캐시 헤더 테스트
+        역 목록 응답에 ETag, Cache-Control 헤더 포함
+        """
+        response = test_client.get("/api/v1/stations")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert "public" in response.headers["cache-control"]
+        assert "max-age=" in response.headers["cache-control"]
+
+    def test_if_none_match_returns_304(self, test_client: TestClient):
+        """
+        조건부 요청 테스트
+        이전 응답의 ETag로 재요청 시 본문 없이 304 Not Modified 반환
+        """
+        etag = test_client.get("/api/v1/stations?line=1").headers["etag"]
+
+        response = test_client.get("/api/v1/stations?line=1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_etag_differs_by_query(self, test_client: TestClient):
+        """
+        쿼리별 ETag 테스트
+        필터가 다른 요청은 같은 ETag로 304가 반환되지 않음
+        """
+        etag = test_client.get("/api/v1/stations?line=1").headers["etag"]
+
+        response = test_client.get("/api/v1/stations?line=2", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+class TestStationCompression:
+    """역 조회 API 응답 압축 테스트 클래스"""
+
+    def test_station_list_gzip(self, test_client: TestClient):
+        """
+        gzip 압축 테스트
+        Accept-Encoding: gzip 요청 시 전체 역 목록이 압축되어 전송되고 정상적으로 해제됨
+        """
+        response = test_client.get("/api/v1/stations", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "Accept-Encoding" in response.headers["vary"]
+        if len(response.content) >= 1024:
+            assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["status"] == "success"
+
+    def test_station_list_identity(self, test_client: TestClient):
+        """
+        압축 미요청 테스트
+        Accept-Encoding: identity 요청 시 압축하지 않음
+        """
+        response = test_client.get("/api/v1/stations", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
@@ -0,0 +1,114 @@
+"""
+역 이름 검색 인덱스 테스트
+
+접두/부분 일치, 한글 초성 검색, 오타 허용 및 관련도 정렬 테스트 (DB 없이 실행)
+"""
+
+from uuid import uuid4
+
+from src.domain.entities.station import Station
+from src.infrastructure.cache.station_search_index import StationSearchIndex
+from src.shared.utils.hangul import decompose, to_choseong
+
+
+def _station(name: str, line_number: int = 1) -> Station:
+    return Station(id=uuid4(), name=name, line_number=line_number, latitude=35.86, longitude=128.59)
+
+
+STATIONS = [
+    _station("반월당역", 1),
+    _station("반월당역", 2),
+    _station("중앙로역", 1),
+    _station("대구역", 1),
+    _station("동대구역", 1),
+    _station("대구은행역", 2),
+    _station("월배역", 1),
+]
+
+
+def _names(stations: list[Station]) -> list[str]:
+    return [station.name for station in stations]
+
+
+class TestHangulUtils:
+    """한글 분해 유틸리티 테스트 클래스"""
+
+    def test_to_choseong(self):
+        """
+        초성 추출 테스트
+        한글 음절은 초성으로, 그 외 문자는 그대로 반환
+        """
+        assert to_choseong("반월당역") == "ㅂㅇㄷㅇ"
+        assert to_choseong("KTX대구") == "KTXㄷㄱ"
+
+    def test_decompose(self):
+        """
+        자모 분해 테스트
+        받침 유무에 따라 음절당 2~3개 자모로 분해
+        """
+        assert decompose("반월") == "ㅂㅏㄴㅇㅝㄹ"
+        assert decompose("대구") == "ㄷㅐㄱㅜ"
+
+
+class TestStationSearchIndex:
+    """역 검색 인덱스 테스트 클래스"""
+
+    def test_choseong_search(self):
+        """
+        초성 검색 테스트
+        'ㅂㅇㄷ'으로 반월당역을 찾고, 초성과 음절을 섞은 검색어도 허용
+        """
+        index = StationSearchIndex(STATIONS)
+
+        assert _names(index.search("ㅂㅇㄷ")) == ["반월당역", "반월당역"]
+        assert _names(index.search("반ㅇㄷ")) == ["반월당역", "반월당역"]
+
+    def test_choseong_infix_ranked_after_prefix(self):
+        """
+        초성 부분 일치 테스트
+        초성만으로 된 검색어도 접두 일치 → 부분 일치 순으로 반환 ('ㄷㄱ' → 대구역, 대구은행역, 동대구역)
+        """
+        index = StationSearchIndex(STATIONS)
+
+        assert _names(index.search("ㄷㄱ")) == ["대구역", "대구은행역", "동대구역"]
+
+    def test_prefix_ranked_before_infix(self):
+        """
+        관련도 정렬 테스트
+        정확 일치 → 접두 일치 → 부분 일치 순으로 반환
+        """
+        index = StationSearchIndex(STATIONS)
+
+        assert _names(index.search("대구")) == ["대구역", "대구은행역", "동대구역"]
+        assert _names(index.search("월")) == ["월배역", "반월당역", "반월당역"]
+
+    def test_search_as_you_type(self):
+        """
+        입력 중 검색 테스트
+        받침을 입력하기 전의 마지막 음절도 일치 ('반월다' → 반월당역)
+        """
+        index = StationSearchIndex(STATIONS)
+
+        assert _names(index.search("반월다")) == ["반월당역", "반월당역"]
+
+    def test_typo_tolerance(self):
+        """
+        오타 허용 테스트
+        자모 1개가 다른 검색어도 일치하되 정확한 일치보다 뒤에 정렬
+        """
+        index = StationSearchIndex(STATIONS)
+
+        assert _names(index.search("반얼당")) == ["반월당역", "반월당역"]
+        assert _names(index.search("중앙노")) == ["중앙로역"]
+        assert index.search("서울") == []
+
+    def test_line_filter(self):
+        """
+        노선 필터 테스트
+        line_number 지정 시 해당 노선의 역만 반환
+        """
+        index = StationSearchIndex(STATIONS)
+
+        results = index.search("ㅂㅇㄷ", line_number=2)
+
+        assert [(s.name, s.line_number) for s in results] == [("반월당역", 2)]
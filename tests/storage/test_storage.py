@@ -219,3 +219,47 @@ class TestStorageIntegration:
 
         # 모든 URL이 서로 다른지 확인 (고유한 파일명)
         assert len(set(uploaded_urls)) == 3
+
+
+class TestStorageObjectPath:
+    """여정 이미지 객체 경로 변환 테스트 클래스"""
+
+    def test_extract_object_path_from_storage_urls(self):
+        """
+        public/sign URL과 객체 경로 모두 동일한 객체 경로로 변환
+        외부 URL은 변환하지 않음
+        """
+        from src.shared.utils.storage_path import extract_object_path
+
+        base = "https://xxx.supabase.co/storage/v1/object"
+        assert extract_object_path(f"{base}/public/trips/user/a.jpg") == "user/a.jpg"
+        assert extract_object_path(f"{base}/sign/trips/user/a.jpg?token=abc") == "user/a.jpg"
+        assert extract_object_path("user/a.jpg") == "user/a.jpg"
+        assert extract_object_path("https://example.com/a.jpg") is None
+        assert extract_object_path(None) is None
+
+    def test_signed_url_cache_reuses_urls(self):
+        """
+        캐시 TTL 동안 동일 경로는 다시 발급하지 않고
+        prefetch는 미스 경로만 한 번에 일괄 발급
+        """
+        from src.infrastructure.storage.signed_url_cache import SignedUrlCache
+
+        calls = []
+
+        class FakeBucket:
+            def create_signed_url(self, path, expires_in):
+                calls.append([path])
+                return {"signedURL": f"signed:{path}"}
+
+            def create_signed_urls(self, paths, expires_in):
+                calls.append(list(paths))
+                return [{"path": path, "signedURL": f"signed:{path}", "error": None} for path in paths]
+
+        cache = SignedUrlCache(bucket_factory=FakeBucket, expires_in=3600, ttl_seconds=3000)
+
+        cache.prefetch(["a.jpg", "b.jpg", "a.jpg"])
+        assert cache.get("a.jpg") == "signed:a.jpg"
+        cache.prefetch(["a.jpg", "c.jpg"])
+
+        assert calls == [["a.jpg", "b.jpg"], ["c.jpg"]]
@@ -4,6 +4,8 @@
 여정 승인/반려, 포인트 지급 등 관리자 전용 엔드포인트 테스트
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -219,6 +221,35 @@ class TestAdminRejection:
         data = response.json()
         assert data["status"] == "error"
 
+    def test_approve_trip_concurrent(
+        self,
+        authenticated_client: TestClient,
+        admin_client: TestClient,
+        test_trip_start_data: dict,
+        test_trip_transfer_data: dict,
+        test_trip_arrival_data: dict,
+    ):
+        """
+        동시 승인 테스트
+        같은 여정에 승인 요청이 동시에 들어와도 하나만 성공하고 나머지는 422 반환 (포인트 중복 지급 방지)
+        """
+        start_response = authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data)
+        trip_id = start_response.json()["data"]["trip_id"]
+
+        authenticated_client.post(f"/api/v1/trips/{trip_id}/transfer", json=test_trip_transfer_data)
+        authenticated_client.post(f"/api/v1/trips/{trip_id}/arrival", json=test_trip_arrival_data)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: admin_client.post(f"/api/v1/admin/trips/{trip_id}/approve"),
+                    range(3),
+                )
+            )
+
+        status_codes = sorted(response.status_code for response in responses)
+        assert status_codes == [200, 422, 422]
+
 
 class TestAdminTripList:
     """관리자 여정 목록 조회 테스트 클래스"""
@@ -236,6 +267,24 @@ class TestAdminTripList:
         assert "trips" in data["data"]
         assert "total_count" in data["data"]
 
+    def test_get_pending_trips_endpoint_count_options(self, admin_client: TestClient):
+        """
+        승인 대기 목록 전체 개수 옵션 테스트
+        /admin/trips/pending도 include_total, count 옵션을 지원
+        """
+        response = admin_client.get("/api/v1/admin/trips/pending?include_total=false")
+        assert response.status_code == 200
+        assert response.json()["data"]["total_count"] is None
+
+        response = admin_client.get("/api/v1/admin/trips/pending?count=planned&view=summary")
+        assert response.status_code == 200
+        assert response.json()["data"]["total_count"] is not None
+
+        response = admin_client.get("/api/v1/admin/trips/pending?offset=100000")
+        assert response.status_code == 200
+        assert response.json()["data"]["trips"] == []
+        assert response.json()["data"]["total_count"] >= 0
+
     def test_get_all_trips_as_admin(self, admin_client: TestClient):
         """
         관리자의 전체 여정 목록 조회 테스트
@@ -0,0 +1,80 @@
+"""
+Idempotency-Key 미들웨어 테스트
+
+토큰 갱신 후 재시도와 위조 토큰(sub) 재시도 처리 테스트 (DB 없이 실행)
+"""
+
+import base64
+import json
+from typing import Optional
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.api.middleware.idempotency import IdempotencyMiddleware
+from src.infrastructure.cache.idempotency_store import InMemoryIdempotencyStore
+
+# 검증을 통과하는 토큰 → 사용자 ID
+VALID_TOKENS = {"token-1": "user-a", "token-2": "user-a"}
+
+
+def _bearer(token_id: str, subject: str) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": subject, "jti": token_id}).encode()).decode().rstrip("=")
+    return f"Bearer e30.{payload}.{token_id}"
+
+
+async def _verify_token(token: str) -> Optional[str]:
+    return VALID_TOKENS.get(token.rsplit(".", 1)[-1])
+
+
+def _client() -> tuple[TestClient, list[int]]:
+    calls: list[int] = []
+
+    async def start(request):
+        calls.append(1)
+        return JSONResponse({"trip": len(calls)}, status_code=201)
+
+    app = Starlette(routes=[Route("/trips/start", start, methods=["POST"])])
+    app.add_middleware(
+        IdempotencyMiddleware,
+        path_patterns=("/trips/start",),
+        store=InMemoryIdempotencyStore(ttl_seconds=60, max_entries=100),
+        verify_token=_verify_token,
+    )
+    return TestClient(app), calls
+
+
+class TestIdempotencyMiddleware:
+    """Idempotency-Key 미들웨어 테스트 클래스"""
+
+    def test_retry_after_token_refresh_replays(self):
+        """
+        토큰 갱신 후 재시도 테스트
+        같은 사용자의 새 토큰으로 재시도하면 라우트를 다시 실행하지 않고 저장된 응답 반환
+        """
+        client, calls = _client()
+        headers = {"Idempotency-Key": "key-1"}
+
+        first = client.post("/trips/start", json={}, headers={**headers, "Authorization": _bearer("token-1", "user-a")})
+        retry = client.post("/trips/start", json={}, headers={**headers, "Authorization": _bearer("token-2", "user-a")})
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert retry.json() == first.json()
+        assert len(calls) == 1
+
+    def test_forged_subject_cannot_replay(self):
+        """
+        위조 토큰 테스트
+        다른 사용자의 sub를 넣은 검증되지 않는 토큰으로는 저장된 응답을 받을 수 없음 (401)
+        """
+        client, calls = _client()
+        headers = {"Idempotency-Key": "key-1"}
+        client.post("/trips/start", json={}, headers={**headers, "Authorization": _bearer("token-1", "user-a")})
+
+        forged = client.post("/trips/start", json={}, headers={**headers, "Authorization": _bearer("forged", "user-a")})
+
+        assert forged.status_code == 401
+        assert "idempotent-replayed" not in forged.headers
@@ -4,6 +4,9 @@
 여정 시작, 환승, 도착, 상태 전환 등 여정 생명주기 관련 엔드포인트 테스트
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -45,6 +48,24 @@ class TestTripStart:
         assert data["status"] == "error"
         assert "진행 중" in data["message"]
 
+    def test_start_trip_concurrent(
+        self, authenticated_client: TestClient, test_trip_start_data: dict
+    ):
+        """
+        동시 여정 시작 테스트
+        같은 사용자가 동시에 여러 번 시작 요청해도 하나만 성공하고 나머지는 409 Conflict 반환
+        """
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data),
+                    range(5),
+                )
+            )
+
+        status_codes = sorted(response.status_code for response in responses)
+        assert status_codes == [201, 409, 409, 409, 409]
+
     def test_start_trip_unauthorized(self, test_client: TestClient, test_trip_start_data: dict):
         """
         인증 없이 여정 시작 테스트
@@ -312,3 +333,65 @@ class TestTripStatuses:
         assert response.status_code >= 400  # 4xx 에러면 OK (400, 422 등)
         data = response.json()
         assert data["status"] == "error"
+
+
+class TestTripIdempotency:
+    """Idempotency-Key 재시도 테스트 클래스"""
+
+    def test_start_trip_retry_replays_response(
+        self, authenticated_client: TestClient, test_trip_start_data: dict
+    ):
+        """
+        같은 Idempotency-Key로 여정 시작 재시도 테스트
+        409 대신 첫 요청의 201 응답이 그대로 반환됨
+        """
+        headers = {"Idempotency-Key": str(uuid4())}
+
+        first = authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data, headers=headers)
+        retry = authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data, headers=headers)
+
+        assert first.status_code == 201
+        assert retry.status_code == 201
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert retry.json()["data"]["trip_id"] == first.json()["data"]["trip_id"]
+
+    def test_transfer_retry_replays_response(
+        self,
+        authenticated_client: TestClient,
+        test_trip_start_data: dict,
+        test_trip_transfer_data: dict,
+    ):
+        """
+        같은 Idempotency-Key로 환승 재시도 테스트
+        두 번째 요청도 상태 오류 없이 첫 응답 반환
+        """
+        start_response = authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data)
+        trip_id = start_response.json()["data"]["trip_id"]
+        headers = {"Idempotency-Key": str(uuid4())}
+
+        first = authenticated_client.post(
+            f"/api/v1/trips/{trip_id}/transfer", json=test_trip_transfer_data, headers=headers
+        )
+        retry = authenticated_client.post(
+            f"/api/v1/trips/{trip_id}/transfer", json=test_trip_transfer_data, headers=headers
+        )
+
+        assert first.status_code == 200
+        assert retry.status_code == 200
+        assert retry.json() == first.json()
+
+    def test_same_key_different_body(
+        self, authenticated_client: TestClient, test_trip_start_data: dict
+    ):
+        """
+        같은 Idempotency-Key로 다른 요청 본문 전송 테스트
+        422 Unprocessable Entity 반환
+        """
+        headers = {"Idempotency-Key": str(uuid4())}
+        authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data, headers=headers)
+
+        other_body = {**test_trip_start_data, "latitude": test_trip_start_data["latitude"] + 0.01}
+        response = authenticated_client.post("/api/v1/trips/start", json=other_body, headers=headers)
+
+        assert response.status_code == 422
+        assert response.json()["status"] == "error"
@@ -63,6 +63,52 @@ class TestTripRetrieval:
         assert data["status"] == "success"
         assert len(data["data"]["trips"]) <= 10
 
+    def test_get_trips_total_count_options(
+        self, authenticated_client: TestClient, test_trip_start_data: dict
+    ):
+        """
+        전체 개수 옵션 테스트
+        include_total=false면 total_count가 null, 마지막 페이지를 넘어서도 전체 개수 반환
+        """
+        authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data)
+
+        response = authenticated_client.get("/api/v1/trips?include_total=false")
+        assert response.status_code == 200
+        assert response.json()["data"]["total_count"] is None
+        assert len(response.json()["data"]["trips"]) > 0
+
+        response = authenticated_client.get("/api/v1/trips?offset=1000")
+        assert response.status_code == 200
+        assert response.json()["data"]["trips"] == []
+        assert response.json()["data"]["total_count"] >= 1
+
+        response = authenticated_client.get("/api/v1/trips?count=planned")
+        assert response.status_code == 200
+        assert response.json()["data"]["total_count"] is not None
+
+        # 마지막 페이지를 넘어선 offset에서도 요청한 count 방식으로 개수 반환
+        response = authenticated_client.get("/api/v1/trips?offset=1000&count=planned")
+        assert response.status_code == 200
+        assert response.json()["data"]["trips"] == []
+        assert response.json()["data"]["total_count"] is not None
+
+    def test_get_trips_summary_view(
+        self, authenticated_client: TestClient, test_trip_start_data: dict
+    ):
+        """
+        요약 목록 조회 테스트
+        view=summary면 이미지 URL, 환승/도착 좌표 없이 목록 카드용 필드만 반환
+        """
+        authenticated_client.post("/api/v1/trips/start", json=test_trip_start_data)
+
+        response = authenticated_client.get("/api/v1/trips?view=summary")
+
+        assert response.status_code == 200
+        trip = response.json()["data"]["trips"][0]
+        assert {"id", "status", "points", "created_at"} <= set(trip)
+        assert "transfer_image_url" not in trip
+        assert "arrival_latitude" not in trip
+
     def test_get_trip_unauthorized_access(
         self, authenticated_client: TestClient, test_user_data: dict, test_client: TestClient
     ):